@@ -11,7 +11,9 @@ import socket
 import logging
 import datetime
 import random
-from alarms import alarm_dict  # Import the alarm dictionary
+from alarms import get_alarm_database
+from framing import LineFramer
+from protocol import checksum
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -220,9 +222,19 @@ class SerialSimulator:
             self.send_command("@2100000000013")
             print("Starting timer for MALN completed response")
             threading.Timer(self.maln_delay.get() / 1000.0, self.send_maln_completed).start()
+        elif command.strip()[2:6] in ("CCLR", "HRST"):
+            self.send_reset_responses(command.strip())
         else:
             print(f"No auto-response match for command: {command}")
 
+    def send_reset_responses(self, command):
+        # Alarm clear and hardware reset: acknowledge, then complete at once.
+        unit, mnemonic = command[1], command[2:6]
+        ack = f"@{unit}0000000000"
+        self.send_command(ack + checksum(ack))
+        completion = f"${unit}0000000000{mnemonic}"
+        self.send_command(completion + checksum(completion))
+
     def send_command(self, command):
         print(f"send: {command}")
         if not self.serial_port or not self.serial_port.is_open:
@@ -279,8 +291,9 @@ class SerialSimulator:
 
     @staticmethod
     def generate_random_alarm_command():
-        major_code = random.choice(list(alarm_dict.keys()))
-        return f"$242{major_code}0000MALN001701085137"  # Embed the alarm code here
+        major_code = random.choice(get_alarm_database().codes())
+        response = f"$242{major_code}0000MALN0017010851"  # Embed the alarm code here
+        return response + checksum(response)
 
 
 class TCPServer:
@@ -316,13 +329,18 @@ class TCPServer:
                 continue
 
     def handle_client(self):
+        framer = LineFramer()
         while self.is_running:
             try:
-                data = self.client_socket.recv(1024).decode('utf-8').strip()
-                if data:
+                chunk = self.client_socket.recv(1024)
+                if not chunk:
+                    break
+                for frame in framer.feed(chunk):
+                    data = frame.decode('utf-8').strip()
                     self.log_callback(f"Received TCP: {data}")
                     response = self.process_command(data)
-                    self.client_socket.sendall(response.encode('utf-8'))
+                    # XG-X terminates every reply with CR
+                    self.client_socket.sendall(f"{response}\r".encode('utf-8'))
                     self.log_callback(f"Sent TCP: {response}")
             except socket.error as e:
                 self.log_callback(f"Socket error: {e}")
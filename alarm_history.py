@@ -0,0 +1,99 @@
+# alarm_history.py
+#
+# Alarm frequency and reliability figures from the alarms table kept by
+# ResultsStore. Each query is one aggregate over the time-indexed tables, so
+# it reads only the rows in the window asked for. Run directly for a report:
+#
+#   python alarm_history.py [results.sqlite3] [hours]
+
+import sqlite3
+import sys
+import time
+
+from results_store import RESULTS_PATH
+
+TOP_ALARMS = 10
+
+
+def connect(path=RESULTS_PATH):
+    # Read-only; the store's writer thread keeps its own connection.
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def window_start(hours=None, now=None):
+    if hours is None:
+        return 0.0
+    return (time.time() if now is None else now) - hours * 3600
+
+
+def top_alarms(connection, limit=TOP_ALARMS, since=0.0):
+    # [(code, count, last_seen)], most frequent first.
+    return connection.execute(
+        "SELECT code, COUNT(*) AS count, MAX(timestamp) FROM alarms WHERE timestamp >= ? "
+        "GROUP BY code ORDER BY count DESC, code LIMIT ?", (since, limit)).fetchall()
+
+
+def alarm_count(connection, since=0.0):
+    return connection.execute("SELECT COUNT(*) FROM alarms WHERE timestamp >= ?", (since,)).fetchone()[0]
+
+
+def cycle_count(connection, since=0.0):
+    return connection.execute("SELECT COUNT(*) FROM cycles WHERE timestamp >= ?", (since,)).fetchone()[0]
+
+
+def mean_cycles_between_failures(connection, since=0.0, code=None):
+    # Cycles run in the window per alarm raised in it (of one code, if given);
+    # None if there were no alarms.
+    if code is None:
+        alarms = alarm_count(connection, since)
+    else:
+        alarms = connection.execute("SELECT COUNT(*) FROM alarms WHERE code = ? AND timestamp >= ?",
+                                    (code, since)).fetchone()[0]
+    if not alarms:
+        return None
+    return cycle_count(connection, since) / alarms
+
+
+def alarm_rate_per_hour(connection, since=0.0):
+    # [(hour_start, count)] for each clock hour with at least one alarm.
+    rows = connection.execute(
+        "SELECT CAST(timestamp / 3600 AS INTEGER) AS hour, COUNT(*) FROM alarms WHERE timestamp >= ? "
+        "GROUP BY hour ORDER BY hour", (since,)).fetchall()
+    return [(hour * 3600, count) for hour, count in rows]
+
+
+def mean_alarm_rate(connection, since=0.0, now=None):
+    # Alarms per hour over the window; over the whole history if since is 0.
+    now = time.time() if now is None else now
+    count, first = connection.execute("SELECT COUNT(*), MIN(timestamp) FROM alarms WHERE timestamp >= ?",
+                                      (since,)).fetchone()
+    if not count:
+        return 0.0
+    start = since or first
+    return count / max((now - start) / 3600, 1.0)
+
+
+def report(connection, hours=None, limit=TOP_ALARMS):
+    since = window_start(hours)
+    span = "all time" if hours is None else f"last {hours:g} h"
+    lines = [f"Alarms ({span}): {alarm_count(connection, since)}, "
+             f"{mean_alarm_rate(connection, since):.2f} per hour"]
+    mcbf = mean_cycles_between_failures(connection, since)
+    lines.append("Mean cycles between failures: " + ("no alarms" if mcbf is None else f"{mcbf:.1f}"))
+    for code, count, last_seen in top_alarms(connection, limit, since):
+        code_mcbf = mean_cycles_between_failures(connection, since, code)
+        last = time.strftime("%Y-%m-%d %H:%M", time.localtime(last_seen))
+        lines.append(f"  {code}: {count} (1 per {code_mcbf:.1f} cycles, last {last})")
+    return lines
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else RESULTS_PATH
+    hours = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    try:
+        connection = connect(path)
+        for line in report(connection, hours):
+            print(line)
+    except sqlite3.Error as e:
+        print(f"Cannot read alarm history: {e}")
+        sys.exit(1)
@@ -0,0 +1,146 @@
+# alarm_index.py
+
+import time
+from bisect import bisect_right
+
+from alarms import get_alarm_database
+
+
+def parse_subcode_key(key):
+    # "0032" -> (0x32, 0x32); "0001:001F" -> (0x1, 0x1F). A few entries in the
+    # alarm table are written high:low, so the bounds are put in order.
+    low, _, high = key.partition(':')
+    low = int(low, 16)
+    high = int(high, 16) if high else low
+    return min(low, high), max(low, high)
+
+
+class AlarmIndex:
+    def __init__(self, alarms):
+        # Per alarm code, the subcode space split into disjoint intervals:
+        # starts[i] .. ends[i] resolves to keys[i]. Where table entries
+        # overlap (an exact subcode inside a range) the narrowest one wins.
+        # alarms is anything with get(code) -> entries (a dict or an
+        # AlarmDatabase); a code's table is built the first time it is seen.
+        self.alarms = alarms
+        self.tables = {}
+
+    def table(self, code):
+        table = self.tables.get(code)
+        if table is None:
+            entries = self.alarms.get(code)
+            if entries is None:
+                return None
+            table = self.tables[code] = self.build_table(entries)
+        return table
+
+    @staticmethod
+    def build_table(entries):
+        intervals = []
+        for key in entries:
+            try:
+                low, high = parse_subcode_key(key)
+            except ValueError:
+                print(f"Ignoring malformed alarm subcode key: {key!r}")
+                continue
+            intervals.append((high - low, low, high, key))
+        boundaries = sorted({low for _, low, _, _ in intervals} | {high + 1 for _, _, high, _ in intervals})
+        starts, ends, keys = [], [], []
+        for start, stop in zip(boundaries, boundaries[1:]):
+            covering = [interval for interval in intervals if interval[1] <= start and stop - 1 <= interval[2]]
+            if not covering:
+                continue
+            key = min(covering)[3]
+            if keys and keys[-1] == key and ends[-1] == start - 1:
+                ends[-1] = stop - 1
+            else:
+                starts.append(start)
+                ends.append(stop - 1)
+                keys.append(key)
+        return starts, ends, keys
+
+    def find_key(self, code, subcode):
+        # Table key for an alarm code/subcode pair, or None if the subcode is
+        # not covered by any entry for that code.
+        table = self.table(code)
+        if table is None:
+            return None
+        try:
+            value = int(subcode, 16)
+        except (TypeError, ValueError):
+            return None
+        starts, ends, keys = table
+        i = bisect_right(starts, value) - 1
+        if i >= 0 and value <= ends[i]:
+            return keys[i]
+        return None
+
+    def lookup(self, code, subcode):
+        key = self.find_key(code, subcode)
+        if key is None:
+            return None
+        return self.alarms.get(code)[key]
+
+    def describe(self, code, subcode):
+        # (entry, key) for display. A known code with an uncovered subcode
+        # falls back to the code's first entry with key None; an unknown code
+        # gives (None, None).
+        key = self.find_key(code, subcode)
+        if key is not None:
+            return self.alarms.get(code)[key], key
+        entries = self.alarms.get(code)
+        if entries:
+            return next(iter(entries.values())), None
+        return None, None
+
+
+alarm_index = None
+
+
+def get_alarm_index():
+    global alarm_index
+    if alarm_index is None:
+        alarm_index = AlarmIndex(get_alarm_database())
+    return alarm_index
+
+
+class AlarmRecord:
+    def __init__(self, code, subcode, mnemonic='', line='', command=None, run_id=None, cycle=None):
+        # One alarm as received, resolved against the alarm table once so the
+        # panel and the logs show the same text. command is the host command in
+        # flight; run_id and cycle place it in a macro run, if one was going.
+        self.timestamp = time.time()
+        self.code = code
+        self.subcode = subcode
+        self.mnemonic = mnemonic
+        self.line = line
+        self.command = command
+        self.run_id = run_id
+        self.cycle = cycle
+        self.acknowledged = False
+        entry, self.key = get_alarm_index().describe(code, subcode)
+        entry = entry or {}
+        self.message = entry.get("Message", "Unknown message")
+        self.cause = entry.get("Cause", "Unknown cause")
+        self.potential_causes = entry.get("Potential Causes", ["Unknown potential causes"])
+        if not entry:
+            self.subcode_note = ""
+        elif self.key is None:
+            self.subcode_note = " (not listed for this alarm)"
+        else:
+            self.subcode_note = "" if self.key == subcode else f" (entry {self.key})"
+
+    def format(self):
+        potential_causes_formatted = "\n".join([f"• {cause}" for cause in self.potential_causes])
+        return (
+            f"Alarm: {self.code}\n\n"
+            f"{self.message}\n\n"
+            f"{self.cause}\n\n"
+            f"Potential Causes:\n{potential_causes_formatted}\n\n"
+            f"Subcode: {self.subcode}{self.subcode_note}"
+            + (f"\nCommand: {self.command}" if self.command else "")
+            + (f"\nCycle: {self.cycle}" if self.cycle is not None else "")
+        )
+
+    def __str__(self):
+        return f"Alarm {self.code}:{self.subcode} {self.message}"
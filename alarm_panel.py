@@ -0,0 +1,131 @@
+# alarm_panel.py
+
+import sqlite3
+import tkinter as tk
+from datetime import datetime
+from tkinter import ttk
+
+import alarm_history
+from results_store import RESULTS_PATH
+
+ALARM_HISTORY = 500
+STATISTICS_HOURS = 24
+
+
+class AlarmPanel(tk.Toplevel):
+    def __init__(self, parent, dispatcher, history_path=RESULTS_PATH, max_history=ALARM_HISTORY):
+        # Non-modal: alarms are added as they arrive and stay listed until
+        # acknowledged. Closing the window only hides it; the next alarm
+        # brings it back.
+        super().__init__(parent)
+        self.dispatcher = dispatcher
+        self.history_path = history_path
+        self.max_history = max_history
+        self.records = {}
+        self.title("Alarms")
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+
+        self.alarm_table = ttk.Treeview(self, columns=("Time", "Alarm", "Subcode", "Command", "Message"),
+                                        show='headings', height=8)
+        for column, width in (("Time", 80), ("Alarm", 60), ("Subcode", 70), ("Command", 70), ("Message", 260)):
+            self.alarm_table.column(column, width=width, anchor="w" if column == "Message" else "center")
+            self.alarm_table.heading(column, text=column)
+        self.alarm_table.tag_configure("active", background="dark red", foreground="white")
+        self.alarm_table.tag_configure("acknowledged", foreground="grey")
+        self.alarm_table.grid(row=0, column=0, columnspan=5, padx=10, pady=(10, 5), sticky="nsew")
+        self.alarm_table.bind("<<TreeviewSelect>>", self.show_selected)
+
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.alarm_table.yview)
+        scrollbar.grid(row=0, column=5, pady=(10, 5), sticky="ns")
+        self.alarm_table.configure(yscrollcommand=scrollbar.set)
+
+        self.detail = tk.Text(self, height=10, width=60, wrap="word", state="disabled")
+        self.detail.grid(row=1, column=0, columnspan=6, padx=10, pady=5, sticky="nsew")
+
+        self.acknowledge_button = ttk.Button(self, text="Acknowledge", command=self.acknowledge_selected)
+        self.acknowledge_button.grid(row=2, column=0, padx=(10, 5), pady=(5, 10), sticky="ew")
+        self.acknowledge_all_button = ttk.Button(self, text="Acknowledge All", command=self.acknowledge_all)
+        self.acknowledge_all_button.grid(row=2, column=1, padx=5, pady=(5, 10), sticky="ew")
+        self.clear_button = ttk.Button(self, text="Send CCLR", command=self.send_clear)
+        self.clear_button.grid(row=2, column=2, padx=5, pady=(5, 10), sticky="ew")
+        self.statistics_button = ttk.Button(self, text="Statistics", command=self.show_statistics)
+        self.statistics_button.grid(row=2, column=3, padx=5, pady=(5, 10), sticky="ew")
+        self.close_button = ttk.Button(self, text="Close", command=self.withdraw)
+        self.close_button.grid(row=2, column=4, padx=(5, 10), pady=(5, 10), sticky="ew")
+
+        for column in range(5):
+            self.columnconfigure(column, weight=1)
+        self.rowconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+
+    @property
+    def unacknowledged(self):
+        return sum(1 for record in self.records.values() if not record.acknowledged)
+
+    def add_alarms(self, records):
+        # Newest first. A burst of alarms arrives here as one list.
+        item_id = None
+        for record in records:
+            item_id = self.alarm_table.insert("", 0, values=(
+                datetime.fromtimestamp(record.timestamp).strftime("%H:%M:%S"),
+                record.code, record.subcode, record.command or record.mnemonic, record.message), tags=("active",))
+            self.records[item_id] = record
+        children = self.alarm_table.get_children()
+        if len(children) > self.max_history:
+            for stale in children[self.max_history:]:
+                self.records.pop(stale, None)
+            self.alarm_table.delete(*children[self.max_history:])
+        if item_id is not None:
+            self.alarm_table.selection_set(item_id)
+            self.alarm_table.see(item_id)
+        self.update_title()
+        if self.state() == "withdrawn":
+            self.deiconify()
+        self.lift()
+
+    def show_detail(self, text):
+        self.detail.configure(state="normal")
+        self.detail.delete("1.0", "end")
+        self.detail.insert("end", text)
+        self.detail.configure(state="disabled")
+
+    def show_selected(self, _event=None):
+        selection = self.alarm_table.selection()
+        record = self.records.get(selection[0]) if selection else None
+        self.show_detail(record.format() if record is not None else "")
+
+    def show_statistics(self):
+        # Indexed aggregates over the stored history; quick enough to run here.
+        try:
+            connection = alarm_history.connect(self.history_path)
+            try:
+                lines = alarm_history.report(connection, STATISTICS_HOURS)
+                lines.append("")
+                lines.extend(alarm_history.report(connection))
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            lines = [f"Alarm history unavailable: {e}"]
+        self.show_detail("\n".join(lines))
+
+    def acknowledge(self, item_ids):
+        for item_id in item_ids:
+            record = self.records.get(item_id)
+            if record is not None and not record.acknowledged:
+                record.acknowledged = True
+                self.alarm_table.item(item_id, tags=("acknowledged",))
+                self.dispatcher.emit('alarmAcknowledged', record)
+        self.update_title()
+
+    def acknowledge_selected(self):
+        self.acknowledge(self.alarm_table.selection())
+
+    def acknowledge_all(self):
+        self.acknowledge(self.alarm_table.get_children())
+
+    def send_clear(self):
+        self.dispatcher.emit('sendClearCommand')
+
+    def update_title(self):
+        count = self.unacknowledged
+        self.title(f"Alarms ({count} unacknowledged)" if count else "Alarms")
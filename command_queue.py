@@ -0,0 +1,156 @@
+# command_queue.py
+
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+from protocol import ACK, COMPLETION
+
+
+class CommandAlarm(Exception):
+    def __init__(self, command, alarm_code, subcode, response):
+        super().__init__(f"{command} failed with alarm {alarm_code} subcode {subcode}")
+        self.command = command
+        self.alarm_code = alarm_code
+        self.subcode = subcode
+        self.response = response
+
+
+class CommandTimeout(TimeoutError):
+    pass
+
+
+class CommandCancelled(Exception):
+    pass
+
+
+class InFlightCommand:
+    def __init__(self, command, callback=None, timeout=None):
+        self.command = command
+        self.unit = command[1:2]
+        self.mnemonic = command[2:6]
+        self.callback = callback
+        self.timeout = timeout
+        self.future = Future()
+        self.slot = None
+        self.acknowledged = False
+        self.timer = None
+
+    @property
+    def key(self):
+        return self.unit, self.mnemonic
+
+
+class CommandQueue:
+    def __init__(self, write, loop_thread, max_in_flight=4, default_timeout=30.0, on_timeout=None):
+        self.write = write
+        self.loop_thread = loop_thread
+        self.max_in_flight = max_in_flight
+        self.default_timeout = default_timeout
+        self.on_timeout = on_timeout
+        self.lock = threading.Lock()
+        self.slots = [None] * max_in_flight
+        self.backlog = deque()
+        self.awaiting_ack = deque()
+        self.awaiting_completion = {}
+
+    def submit(self, command, callback=None, timeout=None):
+        entry = InFlightCommand(command, callback, self.default_timeout if timeout is None else timeout)
+        with self.lock:
+            if not self._assign_slot(entry):
+                self.backlog.append(entry)
+                return entry.future
+        self._send(entry)
+        return entry.future
+
+    def _assign_slot(self, entry):
+        for slot, occupant in enumerate(self.slots):
+            if occupant is None:
+                self.slots[slot] = entry
+                entry.slot = slot
+                self.awaiting_ack.append(entry)
+                self.awaiting_completion.setdefault(entry.key, deque()).append(entry)
+                return True
+        return False
+
+    def _send(self, entry):
+        if entry.timeout:
+            entry.timer = self.loop_thread.call_later(entry.timeout, self.expire, entry)
+        try:
+            self.write(entry.command)
+        except Exception as e:
+            self._finish(entry, error=e)
+
+    def _release(self, entry):
+        # Caller holds the lock. Returns the backlog entry that took the slot.
+        if entry.slot is None or self.slots[entry.slot] is not entry:
+            return None
+        self.slots[entry.slot] = None
+        if entry in self.awaiting_ack:
+            self.awaiting_ack.remove(entry)
+        waiting = self.awaiting_completion.get(entry.key)
+        if waiting and entry in waiting:
+            waiting.remove(entry)
+        if self.backlog and self._assign_slot(self.backlog[0]):
+            return self.backlog.popleft()
+        return None
+
+    def _finish(self, entry, result=None, error=None):
+        with self.lock:
+            promoted = self._release(entry)
+        if entry.timer:
+            entry.timer.cancel()
+        if not entry.future.done():
+            if error is None:
+                entry.future.set_result(result)
+            else:
+                entry.future.set_exception(error)
+        if promoted:
+            self._send(promoted)
+
+    def dispatch(self, frame):
+        # frame is a parsed protocol.Frame. '@' acknowledgements only carry the
+        # unit, so they go to the oldest unacknowledged command for that unit.
+        # '$' completions also carry the mnemonic and are matched on
+        # (unit, mnemonic).
+        unit = frame.unit
+        with self.lock:
+            if frame.header == ACK:
+                entry = next((e for e in self.awaiting_ack if e.unit == unit), None)
+                if entry:
+                    self.awaiting_ack.remove(entry)
+                    entry.acknowledged = True
+            elif frame.header == COMPLETION:
+                waiting = self.awaiting_completion.get((unit, frame.mnemonic))
+                entry = waiting[0] if waiting else None
+            else:
+                entry = None
+        if entry is None:
+            return None
+
+        if not frame.ok:
+            self._finish(entry, error=CommandAlarm(entry.command, frame.alarm, frame.subcode, frame))
+            return entry
+        if entry.callback:
+            entry.callback(frame)
+        if frame.header == COMPLETION:
+            self._finish(entry, result=frame)
+        return entry
+
+    def expire(self, entry):
+        if entry.future.done():
+            return
+        self._finish(entry, error=CommandTimeout(f"No completion for {entry.command} after {entry.timeout}s"))
+        if self.on_timeout:
+            self.on_timeout(entry)
+
+    def cancel_all(self, reason):
+        with self.lock:
+            entries = [entry for entry in self.slots if entry] + list(self.backlog)
+            self.backlog.clear()
+        for entry in entries:
+            self._finish(entry, error=CommandCancelled(reason))
+
+    def in_flight(self):
+        with self.lock:
+            return [entry for entry in self.slots if entry]
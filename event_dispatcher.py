@@ -1,8 +1,18 @@
 # event_dispatcher.py
 
-def register_events(dispatcher, serial_service, tcp_service, macro_service, log_to_display, clear_log_display,
+import threading
+import time
+from collections import Counter, deque
+
+# Coalescing policies, see EventDispatcher.set_event_policy().
+PASS_THROUGH = 'pass'
+LATEST_WINS = 'latest'
+BATCH_APPEND = 'batch'
+
+def register_events(dispatcher, serial_service, tcp_service, macro_service, log_batch_to_display, clear_log_display,
                     export_log, scan_com_ports, quit_application, update_serial_connection_status,
-                    update_tcp_connection_status, update_macro_running_status, update_completed_cycles_display):
+                    update_tcp_connection_status, update_macro_running_status, update_completed_cycles_display,
+                    show_alarms, show_warning):
 
     dispatcher.register_event('connectSerialPort', serial_service.connect_serial_port)
     dispatcher.register_event('closeSerialPort', serial_service.close_serial_port)
@@ -18,6 +28,7 @@ def register_events(dispatcher, serial_service, tcp_service, macro_service, log_
     dispatcher.register_event('connectTCP', tcp_service.connect_tcp_socket)
     dispatcher.register_event('disconnectTCP', tcp_service.close_tcp_socket)
     dispatcher.register_event('triggerOne', tcp_service.trigger_one)
+    dispatcher.register_event('triggerCapture', tcp_service.trigger_capture)
     dispatcher.register_event('triggerTwo', tcp_service.trigger_two)
     dispatcher.register_event('prevCamera', tcp_service.prev_camera)
     dispatcher.register_event('nextCamera', tcp_service.next_camera)
@@ -36,37 +47,228 @@ def register_events(dispatcher, serial_service, tcp_service, macro_service, log_
     dispatcher.register_event('incrementCycleCount', macro_service.increment_cycle_count)
     dispatcher.register_event('emergencyStop', macro_service.emergency_stop_sequence)
     dispatcher.register_event('updateTotalCycles', macro_service.update_total_cycles)
+    dispatcher.register_event('setPipelinedMode', macro_service.set_pipelined_mode)
+    dispatcher.register_event('setSettleParameters', macro_service.set_settle_parameters)
+    dispatcher.register_event('setSettleQuery', macro_service.set_settle_query)
+    dispatcher.register_event('setCommandParameters', macro_service.set_command_parameters)
+    dispatcher.register_event('setRepeatabilityLimits', macro_service.set_repeatability_limits)
+    dispatcher.register_event('requestRepeatability', macro_service.request_repeatability)
+    dispatcher.register_event('setRecoveryPolicy', macro_service.set_recovery_policy)
+    dispatcher.register_event('clearRecoveryPolicies', macro_service.clear_recovery_policies)
+    dispatcher.register_event('setStepTimeout', macro_service.set_step_timeout)
+    dispatcher.register_event('exportLatencies', macro_service.export_latencies)
+    dispatcher.register_event('selectSequence', macro_service.select_sequence)
+    dispatcher.register_event('sequenceCompleted', macro_service.show_completion_messagebox, tk=True)
 
-    dispatcher.register_event('logToDisplay', log_to_display)
-    dispatcher.register_event('receivedData', log_to_display)
-    dispatcher.register_event('clearLogDisplay', clear_log_display)
-    dispatcher.register_event('exportLog', export_log)
+    dispatcher.register_event('logToDisplay', log_batch_to_display, tk=True)
+    dispatcher.register_event('clearLogDisplay', clear_log_display, tk=True)
+    dispatcher.register_event('exportLog', export_log, tk=True)
+    dispatcher.register_event('showAlarm', show_alarms, tk=True)
+    dispatcher.register_event('showWarning', show_warning, tk=True)
 
     dispatcher.register_event('scanForSerialPorts', scan_com_ports)
-    dispatcher.register_event('quitApplication', quit_application)
+    dispatcher.register_event('quitApplication', quit_application, tk=True)
 
-    dispatcher.register_event('updateSerialConnectionStatus', update_serial_connection_status)
-    dispatcher.register_event('updateTCPConnectionStatus', update_tcp_connection_status)
-    dispatcher.register_event('updateMacroRunningStatus', update_macro_running_status)
-    dispatcher.register_event('updateCompletedCycles', update_completed_cycles_display)
+    dispatcher.register_event('updateSerialConnectionStatus', update_serial_connection_status, tk=True)
+    dispatcher.register_event('updateTCPConnectionStatus', update_tcp_connection_status, tk=True)
+    dispatcher.register_event('updateMacroRunningStatus', update_macro_running_status, tk=True)
+    dispatcher.register_event('updateCompletedCycles', update_completed_cycles_display, tk=True)
+
+    # Display updates render at most once per pump tick: status-style events only
+    # need their latest value, log lines arrive as one batch in emit order.
+    dispatcher.set_event_policy('updateCompletedCycles', LATEST_WINS)
+    dispatcher.set_event_policy('macro_update', LATEST_WINS)
+    dispatcher.set_event_policy('cycle_update', LATEST_WINS)
+    dispatcher.set_event_policy('offset_update', LATEST_WINS)
+    dispatcher.set_event_policy('repeatabilityUpdate', LATEST_WINS)
+    dispatcher.set_event_policy('timeout_update', LATEST_WINS)
+    dispatcher.set_event_policy('latency_update', LATEST_WINS)
+    dispatcher.set_event_policy('logToDisplay', BATCH_APPEND)
+    dispatcher.set_event_policy('receivedData', BATCH_APPEND, into='logToDisplay')
+    dispatcher.set_event_policy('showAlarm', BATCH_APPEND)
 
 
 class EventDispatcher:
     def __init__(self):
         self.handlers = {}
         self.values = {}
+        # Handlers registered with tk=True touch widgets. Once attached to Tk,
+        # an event emitted from any other thread runs its other handlers there
+        # and then, and is queued here for its Tk handlers, which pump() runs
+        # on the Tk thread a batch per after() tick.
+        self.tk_handlers = {}
+        self.direct_handlers = {}
+        self.tk_root = None
+        self.tk_thread = None
+        # Queued Tk work in emit order: (PASS_THROUGH, event, (args, kwargs)),
+        # (LATEST_WINS, event, [args, kwargs, live]) or (BATCH_APPEND, event,
+        # items). A batch stays open for more items until a pass-through event
+        # is queued after it.
+        self.pending = deque()
+        self.lock = threading.Lock()
+        self.draining = False
+        self.pump_interval = 16
+        self.pump_batch = 500
+        self.policies = {}
+        self.latest = {}
+        self.open_batches = {}
+        self.tracing = False
+        self.trace_buffer = deque(maxlen=1000)
+        self.event_counts = Counter()
+        self.handler_timings = {}
+
+    def attach_tk(self, root, pump_interval=16):
+        self.tk_root = root
+        self.tk_thread = threading.current_thread()
+        self.pump_interval = pump_interval
+        self.tk_root.after(self.pump_interval, self.pump)
 
-    def register_event(self, event_name, handler):
+    def register_event(self, event_name, handler, tk=False):
         # print(f'Registered event: {event_name}')
         if event_name not in self.handlers:
             self.handlers[event_name] = []
         self.handlers[event_name].append(handler)
+        split = self.tk_handlers if tk else self.direct_handlers
+        split.setdefault(event_name, []).append(handler)
+
+    def set_event_policy(self, event_name, policy, into=None):
+        # LATEST_WINS keeps only the newest arguments until the next pump tick.
+        # BATCH_APPEND collects every call as an (emit time, *args) tuple and
+        # hands the handlers a list of them; batched events take positional
+        # arguments only. into= merges the event into another event's batch so
+        # their order is kept. Coalescing only applies once attached to Tk;
+        # before that, batches are delivered one at a time.
+        if policy == PASS_THROUGH:
+            self.policies.pop(event_name, None)
+            return
+        self.policies[event_name] = (policy, into or event_name)
 
     def emit(self, event_name, *args, **kwargs):
-        print(f'Emitting event: {event_name}')
-        for handler in self.handlers.get(event_name, []):
+        policy = self.policies.get(event_name)
+        if policy is not None:
+            self.coalesce(policy, args, kwargs)
+            return
+        if self.tk_thread is not None and threading.current_thread() is not self.tk_thread:
+            self.run_handlers(event_name, args, kwargs, self.direct_handlers)
+            if event_name in self.tk_handlers:
+                with self.lock:
+                    self.open_batches.clear()
+                    self.pending.append((PASS_THROUGH, event_name, (args, kwargs)))
+            return
+        if self.pending and not self.draining:
+            # Whatever is still queued was emitted first.
+            self.drain()
+        self.run_handlers(event_name, args, kwargs)
+
+    def coalesce(self, policy, args, kwargs):
+        policy, target = policy
+        if policy == BATCH_APPEND:
+            if kwargs:
+                raise TypeError(f"{target} is batched and takes positional arguments only")
+            item = (time.time(),) + args
+            if self.tk_root is None:
+                self.run_handlers(target, ([item],), {})
+                return
+            with self.lock:
+                batch = self.open_batches.get(target)
+                if batch is None:
+                    batch = self.open_batches[target] = []
+                    self.pending.append((BATCH_APPEND, target, batch))
+                batch.append(item)
+        elif self.tk_root is None:
+            self.run_handlers(target, args, kwargs)
+        else:
+            # Latest-wins values are snapshots, so they do not close a batch;
+            # an update still queued is dropped in favour of this one.
+            entry = [args, kwargs, True]
+            with self.lock:
+                previous = self.latest.get(target)
+                if previous is not None:
+                    previous[2] = False
+                self.latest[target] = entry
+                self.pending.append((LATEST_WINS, target, entry))
+
+    def run_handlers(self, event_name, args, kwargs, handlers=None):
+        for handler in (self.handlers if handlers is None else handlers).get(event_name, []):
             handler(*args, **kwargs)
 
+    def deliver(self, event_name, args, kwargs, handlers=None):
+        try:
+            self.run_handlers(event_name, args, kwargs, handlers)
+        except Exception as e:
+            print(f"Handler for {event_name} failed: {e}")
+
+    def pump(self):
+        self.drain(self.pump_batch)
+        self.tk_root.after(self.pump_interval, self.pump)
+
+    def drain(self, limit=None):
+        # Delivers queued work in emit order, on the Tk thread.
+        pending = self.pending
+        self.draining = True
+        try:
+            for _ in range(len(pending) if limit is None else min(len(pending), limit)):
+                with self.lock:
+                    kind, event_name, payload = pending.popleft()
+                    if kind == BATCH_APPEND and self.open_batches.get(event_name) is payload:
+                        del self.open_batches[event_name]
+                    elif kind == LATEST_WINS and self.latest.get(event_name) is payload:
+                        del self.latest[event_name]
+                if kind == PASS_THROUGH:
+                    self.deliver(event_name, *payload, self.tk_handlers)
+                elif kind == BATCH_APPEND:
+                    self.deliver(event_name, (payload,), {})
+                elif payload[2]:
+                    self.deliver(event_name, payload[0], payload[1])
+        finally:
+            self.draining = False
+
+    # TRACING
+    # Enabling swaps emit/run_handlers for traced versions on the instance, so
+    # while tracing is off the dispatch path is exactly the plain methods above.
+    def enable_tracing(self, capacity=1000):
+        self.trace_buffer = deque(self.trace_buffer, maxlen=capacity)
+        self.emit = self.traced_emit
+        self.run_handlers = self.traced_run_handlers
+        self.tracing = True
+
+    def disable_tracing(self):
+        self.__dict__.pop('emit', None)
+        self.__dict__.pop('run_handlers', None)
+        self.tracing = False
+
+    def reset_trace(self):
+        self.trace_buffer.clear()
+        self.event_counts.clear()
+        self.handler_timings.clear()
+
+    def traced_emit(self, event_name, *args, **kwargs):
+        queued = self.tk_thread is not None and (event_name in self.policies or (
+            threading.current_thread() is not self.tk_thread and event_name in self.tk_handlers))
+        self.event_counts[event_name] += 1
+        self.trace_buffer.append((time.time(), threading.current_thread().name, event_name, args, queued))
+        EventDispatcher.emit(self, event_name, *args, **kwargs)
+
+    def traced_run_handlers(self, event_name, args, kwargs, handlers=None):
+        timings = self.handler_timings
+        for handler in (self.handlers if handlers is None else handlers).get(event_name, []):
+            started = time.perf_counter_ns()
+            try:
+                handler(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter_ns() - started
+                key = (event_name, getattr(handler, '__qualname__', repr(handler)))
+                calls, total, longest = timings.get(key, (0, 0, 0))
+                timings[key] = (calls + 1, total + elapsed, max(longest, elapsed))
+
+    def trace_report(self, limit=10):
+        lines = [f"{name}: {count}" for name, count in self.event_counts.most_common(limit)]
+        slowest = sorted(self.handler_timings.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+        for (event_name, handler), (calls, total, longest) in slowest:
+            lines.append(f"{event_name} -> {handler}: {calls} calls, "
+                         f"mean {total / calls / 1000:.1f} us, max {longest / 1000:.1f} us")
+        return lines
+
     def set(self, key, value):
         self.values[key] = value
 
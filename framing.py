@@ -0,0 +1,78 @@
+# framing.py
+
+import threading
+import serial
+
+MAX_FRAME_LENGTH = 4096
+
+
+class LineFramer:
+    def __init__(self, max_frame_length=MAX_FRAME_LENGTH):
+        self.buffer = bytearray()
+        self.scan_from = 0
+        self.max_frame_length = max_frame_length
+        self.overflows = 0
+
+    def feed(self, data):
+        # Appends raw bytes and returns every complete CR/LF terminated frame.
+        # Whatever follows the last terminator stays buffered for the next call,
+        # and only bytes that arrived since then are scanned again. The complete
+        # region is copied out of the buffer once and split in C.
+        buffer = self.buffer
+        buffer += data
+        scan_from = self.scan_from
+        end = max(buffer.rfind(b'\r', scan_from), buffer.rfind(b'\n', scan_from)) + 1
+        frames = []
+        if end:
+            with memoryview(buffer) as view:
+                frames = [frame for frame in view[:end].tobytes().splitlines() if frame]
+            del buffer[:end]
+        if len(buffer) > self.max_frame_length:
+            # No terminator in sight; drop the garbage rather than grow forever.
+            self.overflows += 1
+            buffer.clear()
+        self.scan_from = len(buffer)
+        return frames
+
+    def reset(self):
+        self.buffer.clear()
+        self.scan_from = 0
+
+
+class SerialReader:
+    def __init__(self, serial_port, on_frame, on_error=None):
+        self.serial_port = serial_port
+        self.on_frame = on_frame
+        self.on_error = on_error
+        self.framer = LineFramer()
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return self.thread
+
+    def stop(self, timeout=2.0):
+        self.running = False
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+
+    def run(self):
+        port = self.serial_port
+        framer = self.framer
+        on_frame = self.on_frame
+        while self.running and port.is_open:
+            try:
+                # read(1) returns as soon as the first byte arrives, everything
+                # already queued by the driver is then pulled in one call.
+                data = port.read(port.in_waiting or 1)
+            except (serial.SerialException, OSError, TypeError) as e:
+                if self.running and port.is_open and self.on_error:
+                    self.on_error(e)
+                break
+            if data:
+                for frame in framer.feed(data):
+                    on_frame(frame)
+        self.running = False
@@ -0,0 +1,187 @@
+# latency.py
+#
+# Where macro cycle time goes. MacroService stamps every edge of a cycle
+# (command sent / acknowledged / completed, settle start / end, T1 sent /
+# received) with perf_counter_ns() on its CycleRecord; ResultsStore keeps them
+# in cycle_edges as ns since the cycle started. Intervals between edges are
+# tracked live in LatencyHistograms. Run directly to summarise or export a
+# stored run:
+#
+#   python latency.py [results.sqlite3] [run_id] [export.csv]
+
+import csv
+import sqlite3
+import sys
+from collections import Counter
+
+import numpy as np
+
+from results_store import RESULTS_PATH
+
+PERCENTILES = (50, 95, 99)
+
+# Interval name, start edge, end edge. Command edges are '<command key>_sent',
+# '_ack' and '_complete', e.g. 'maln_ack'; every cycle starts at 'start'.
+INTERVALS = (
+    ('MTRS ack', 'mtrs_sent', 'mtrs_ack'),
+    ('MTRS move', 'mtrs_ack', 'mtrs_complete'),
+    ('MTRS > MALN', 'mtrs_complete', 'maln_sent'),
+    ('MALN ack', 'maln_sent', 'maln_ack'),
+    ('MALN align', 'maln_ack', 'maln_complete'),
+    ('MALN > settle', 'maln_complete', 'settle_start'),
+    ('settle', 'settle_start', 'settle_end'),
+    ('settle > T1', 'settle_end', 't1_sent'),
+    ('T1 capture', 't1_sent', 't1_received'),
+    ('CSOL1 hold', 'csol1_sent', 'csol1_complete'),
+    ('CSOL0 release', 'csol0_sent', 'csol0_complete'),
+    ('cycle', 'start', 'end'),
+)
+
+
+def intervals(edges):
+    # [(name, ns)] for every interval whose two edges were both seen.
+    return [(name, edges[end] - edges[start]) for name, start, end in INTERVALS
+            if start in edges and end in edges]
+
+
+class LatencyHistogram:
+    # Log-linear buckets: a value keeps its top SUB_BITS bits, so each bucket
+    # is within ~3% of the values in it, whatever the scale (us to minutes).
+    # Adding is O(1) and the bucket count stays in the low hundreds.
+    SUB_BITS = 6
+
+    def __init__(self):
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def add(self, ns):
+        ns = max(0, int(ns))
+        shift = max(0, ns.bit_length() - self.SUB_BITS)
+        self.buckets[(shift, ns >> shift)] += 1
+        self.count += 1
+        self.total += ns
+        self.min = ns if self.min is None else min(self.min, ns)
+        self.max = max(self.max, ns)
+
+    def percentile(self, q):
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for (shift, top), count in sorted(self.buckets.items()):
+            seen += count
+            if seen >= rank:
+                # Middle of the bucket, kept within the values seen: with a
+                # handful of samples the middle can lie below all of them.
+                return min(max((top << shift) + ((1 << shift) >> 1), self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def snapshot(self):
+        snapshot = {'count': self.count, 'mean': self.mean, 'max': self.max if self.count else None}
+        for q in PERCENTILES:
+            snapshot[f'p{q}'] = self.percentile(q)
+        return snapshot
+
+
+class LatencyStats:
+    def __init__(self):
+        self.histograms = {}
+
+    def add_edges(self, edges):
+        for name, ns in intervals(edges):
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.add(ns)
+
+    def reset(self):
+        self.histograms = {}
+
+    def snapshot(self):
+        # Interval name -> snapshot, in INTERVALS order.
+        return {name: self.histograms[name].snapshot() for name, _, _ in INTERVALS if name in self.histograms}
+
+
+def format_latency(name, stats):
+    def ms(ns):
+        return "-" if ns is None else f"{ns / 1e6:.1f}"
+    return (f"{name}: n={stats['count']} p50 {ms(stats['p50'])} p95 {ms(stats['p95'])} "
+            f"p99 {ms(stats['p99'])} max {ms(stats['max'])} ms")
+
+
+def load_edges(connection, run_id):
+    # {cycle: {edge: ns}} for one run, in cycle order.
+    cycles = {}
+    for cycle, edge, ns in connection.execute(
+            "SELECT cycle, edge, ns FROM cycle_edges WHERE run_id = ? ORDER BY cycle", (run_id,)):
+        cycles.setdefault(cycle, {})[edge] = ns
+    return cycles
+
+
+def latest_run(connection):
+    row = connection.execute("SELECT run_id FROM runs ORDER BY started_at DESC LIMIT 1").fetchone()
+    return row[0] if row else None
+
+
+def summarize_run(cycles):
+    # Exact percentiles over a stored run: name -> {count, p50, p95, p99, max}.
+    values = {}
+    for edges in cycles.values():
+        for name, ns in intervals(edges):
+            values.setdefault(name, []).append(ns)
+    summary = {}
+    for name, _, _ in INTERVALS:
+        if name not in values:
+            continue
+        data = np.asarray(values[name], dtype=float)
+        summary[name] = {'count': int(data.size), 'mean': float(data.mean()), 'max': float(data.max())}
+        for q, value in zip(PERCENTILES, np.percentile(data, PERCENTILES)):
+            summary[name][f'p{q}'] = float(value)
+    return summary
+
+
+def export_run(path, run_id, destination):
+    # One row per cycle: every edge and interval in ms from the cycle start.
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cycles = load_edges(connection, run_id)
+    finally:
+        connection.close()
+    edge_names = []
+    for edges in cycles.values():
+        edge_names.extend(edge for edge in sorted(edges, key=edges.get) if edge not in edge_names)
+    interval_names = [name for name, start, end in INTERVALS if start in edge_names and end in edge_names]
+    with open(destination, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['cycle'] + [f"{edge} ms" for edge in edge_names] + [f"{name} ms" for name in interval_names])
+        for cycle, edges in cycles.items():
+            spans = dict(intervals(edges))
+            writer.writerow([cycle]
+                            + [f"{edges[edge] / 1e6:.3f}" if edge in edges else "" for edge in edge_names]
+                            + [f"{spans[name] / 1e6:.3f}" if name in spans else "" for name in interval_names])
+    return len(cycles)
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else RESULTS_PATH
+    connection = sqlite3.connect(path)
+    try:
+        run_id = sys.argv[2] if len(sys.argv) > 2 else latest_run(connection)
+        if run_id is None:
+            print("No runs recorded")
+            sys.exit(1)
+        summary = summarize_run(load_edges(connection, run_id))
+    finally:
+        connection.close()
+    print(f"Run {run_id}")
+    for name, stats in summary.items():
+        print(format_latency(name, stats))
+    if len(sys.argv) > 3:
+        print(f"{export_run(path, run_id, sys.argv[3])} cycles written to {sys.argv[3]}")
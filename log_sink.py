@@ -0,0 +1,125 @@
+# log_sink.py
+
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime
+
+
+class LogSink:
+    def __init__(self, directory="LOGS", prefix="log", max_bytes=10 * 1024 * 1024, fsync_interval=1.0,
+                 buffer_size=64 * 1024):
+        # Log entries are handed to a writer thread, so the caller never waits on
+        # the disk. The file is flushed and fsynced at most every fsync_interval
+        # seconds, and only if something was written since the last time, and
+        # rolls over to a new timestamped file past max_bytes.
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.fsync_interval = fsync_interval
+        self.buffer_size = buffer_size
+        self.queue = queue.SimpleQueue()
+        self.paths = []
+        self.file = None
+        self.size = 0
+        self.last_sync = 0.0
+        self.dirty = False
+        self.thread = None
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, name="log-sink", daemon=True)
+            self.thread.start()
+        return self
+
+    def write_entries(self, entries):
+        # entries are (time.time() stamp, message, source) triples, formatted on
+        # the writer thread.
+        self.queue.put(('entries', None, entries))
+
+    def flush(self, timeout=5.0):
+        done = threading.Event()
+        self.queue.put(('flush', done, None))
+        return done.wait(timeout)
+
+    def export(self, destination, on_done=None):
+        # Copies this session's files, oldest first, once everything queued so
+        # far has been written.
+        self.queue.put(('export', destination, on_done))
+
+    def close(self, timeout=5.0):
+        if self.thread and self.thread.is_alive():
+            self.queue.put(('close', None, None))
+            self.thread.join(timeout)
+
+    def run(self):
+        while True:
+            try:
+                kind, first, second = self.queue.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                if self.dirty:
+                    try:
+                        self.sync()
+                    except OSError as e:
+                        print(f"Log sink error: {e}")
+                continue
+            try:
+                if kind == 'entries':
+                    self.write(second)
+                elif kind == 'flush':
+                    self.sync()
+                    first.set()
+                elif kind == 'export':
+                    self.copy_to(first, second)
+                elif kind == 'close':
+                    self.sync()
+                    if self.file:
+                        self.file.close()
+                        self.file = None
+                    return
+            except OSError as e:
+                print(f"Log sink error: {e}")
+            if time.monotonic() - self.last_sync >= self.fsync_interval:
+                self.sync()
+
+    def write(self, entries):
+        data = "".join(f"[{self.format_stamp(stamp)}] {source} {message}\n" for stamp, message, source in entries)
+        if self.file is None or self.size >= self.max_bytes:
+            self.rotate()
+        self.file.write(data)
+        self.size += len(data)
+        self.dirty = True
+
+    @staticmethod
+    def format_stamp(stamp):
+        return datetime.fromtimestamp(stamp).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+    def rotate(self):
+        if self.file:
+            self.sync()
+            self.file.close()
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"{self.prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(self.paths) + 1:03d}.txt"
+        path = os.path.join(self.directory, name)
+        self.file = open(path, 'a', encoding='utf-8', buffering=self.buffer_size)
+        self.size = 0
+        self.paths.append(path)
+
+    def sync(self):
+        self.last_sync = time.monotonic()
+        if self.file and self.dirty:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.dirty = False
+
+    def copy_to(self, destination, on_done):
+        self.sync()
+        os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+        with open(destination, 'wb') as target:
+            for path in self.paths:
+                with open(path, 'rb') as source:
+                    shutil.copyfileobj(source, target)
+        if on_done:
+            on_done(destination)
@@ -0,0 +1,141 @@
+# log_view.py
+
+import tkinter as tk
+from collections import deque
+from itertools import islice
+from tkinter import ttk
+from tkinter import font as tkfont
+
+LOG_MAX_LINES = 5000
+
+
+class LogModel:
+    def __init__(self, max_lines=LOG_MAX_LINES):
+        # Only the newest max_lines stay in memory; the full history is on disk
+        # (see LogSink).
+        self.lines = deque(maxlen=max_lines)
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self.lines)
+
+    def set_max_lines(self, max_lines):
+        self.dropped += max(0, len(self.lines) - max_lines)
+        self.lines = deque(self.lines, maxlen=max_lines)
+
+    def extend(self, lines):
+        lines = list(lines)
+        self.dropped += max(0, len(self.lines) + len(lines) - self.lines.maxlen)
+        self.lines.extend(lines)
+
+    def window(self, start, count):
+        return list(islice(self.lines, start, start + count))
+
+    def clear(self):
+        self.lines.clear()
+        self.dropped = 0
+
+
+class LogView(ttk.Frame):
+    def __init__(self, parent, model, height=22, width=62):
+        super().__init__(parent)
+        self.model = model
+        self.first = 0
+        self.follow = True
+        self.seen_dropped = model.dropped
+        self.render_pending = False
+
+        # The Text widget only ever holds the lines that fit on screen; the
+        # vertical scrollbar is driven from the model instead of the widget
+        # contents. Lines are not wrapped, so one entry is one display row and
+        # long ones scroll sideways.
+        self.text = tk.Text(self, wrap=tk.NONE, height=height, width=width, state='disabled')
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.xscrollbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.text.xview)
+        self.text.configure(xscrollcommand=self.xscrollbar.set)
+        self.text.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.xscrollbar.grid(row=1, column=0, sticky="ew")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        self.linespace = tkfont.Font(root=self, font=self.text.cget('font')).metrics('linespace')
+
+        self.text.bind('<MouseWheel>', self.on_mouse_wheel)
+        self.text.bind('<Button-4>', self.on_mouse_wheel)
+        self.text.bind('<Button-5>', self.on_mouse_wheel)
+        self.text.bind('<Configure>', lambda event: self.schedule_render())
+
+    def configure_text(self, **options):
+        self.text.configure(**options)
+        self.linespace = tkfont.Font(root=self, font=self.text.cget('font')).metrics('linespace')
+        self.schedule_render()
+
+    def visible_rows(self):
+        # Whole rows that fit inside the border and padding; with wrapping off
+        # each is one model entry.
+        height = self.text.winfo_height()
+        if height <= 1:
+            return int(self.text.cget('height'))
+        inset = 2 * sum(int(self.text.cget(option)) for option in ('borderwidth', 'highlightthickness', 'pady'))
+        return max(1, (height - inset) // self.linespace)
+
+    def append(self, lines):
+        self.model.extend(lines)
+        self.schedule_render()
+
+    def clear(self):
+        self.model.clear()
+        self.seen_dropped = 0
+        self.first = 0
+        self.follow = True
+        self.render()
+
+    def schedule_render(self):
+        if not self.render_pending:
+            self.render_pending = True
+            self.after_idle(self.render)
+
+    def render(self):
+        self.render_pending = False
+        rows = self.visible_rows()
+        total = len(self.model)
+        dropped = self.model.dropped - self.seen_dropped
+        self.seen_dropped = self.model.dropped
+        last = max(0, total - rows)
+        # A reader scrolled back stays on the same lines while old ones drop off.
+        self.first = last if self.follow else max(0, min(self.first - dropped, last))
+
+        left = self.text.xview()[0]
+        self.text.configure(state='normal')
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', '\n'.join(self.model.window(self.first, rows)))
+        self.text.configure(state='disabled')
+        # Replacing the contents resets the horizontal position; keep it.
+        self.text.xview_moveto(left)
+        if self.follow:
+            self.text.yview_moveto(1.0)
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def yview(self, *args):
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.model)))
+        elif args[0] == 'scroll':
+            step = self.visible_rows() if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
+
+    def scroll(self, lines):
+        self.scroll_to(self.first + lines)
+
+    def scroll_to(self, first):
+        last = max(0, len(self.model) - self.visible_rows())
+        self.first = max(0, min(first, last))
+        self.follow = self.first >= last
+        self.render()
+
+    def on_mouse_wheel(self, event):
+        # Windows/macOS report a delta, X11 sends buttons 4 and 5.
+        self.scroll(-3 if event.num == 4 or event.delta > 0 else 3)
+        return 'break'
@@ -0,0 +1,63 @@
+# macro_config.py
+#
+# Macro settings that outlive a session: recovery policies by alarm code,
+# watchdog timeouts by mnemonic and the settle stage (dwell, and the XG-X
+# query that ends it early). They are kept in macro_settings.json, applied
+# through the dispatcher when the app starts and again whenever Settings >
+# Macro Settings saves them:
+#
+#   {"recovery": {"*": {"action": "retry", "attempts": 2, "delay": 0.5},
+#                 "timeout": "abort"},
+#    "step_timeouts": {"MTRS": 30.0, "T1": 10.0},
+#    "settle": {"min_dwell": 1.0, "max_wait": 10.0, "query": "", "expected": ""}}
+#
+# Anything left out keeps its built-in default; an empty query settles on the
+# dwell alone.
+
+import json
+import os
+
+MACRO_CONFIG_PATH = "macro_settings.json"
+
+
+def load_macro_config(path=MACRO_CONFIG_PATH):
+    # {} if there is no file yet; a file that does not parse is reported and
+    # ignored rather than stopping the app.
+    try:
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Macro settings not loaded from {path}: {e}")
+        return {}
+    if not isinstance(config, dict):
+        print(f"Macro settings not loaded from {path}: expected an object")
+        return {}
+    return config
+
+
+def save_macro_config(config, path=MACRO_CONFIG_PATH):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+
+
+def apply_macro_config(config, dispatcher):
+    # The saved policies replace the running ones, so a code taken out of the
+    # file goes back to the default.
+    recovery = config.get('recovery')
+    if recovery is not None:
+        dispatcher.emit('clearRecoveryPolicies')
+        for code, policy in recovery.items():
+            if isinstance(policy, str):
+                policy = {'action': policy}
+            dispatcher.emit('setRecoveryPolicy', code, policy.get('action'), policy.get('attempts', 1),
+                            policy.get('delay', 0.0))
+    for mnemonic, seconds in config.get('step_timeouts', {}).items():
+        dispatcher.emit('setStepTimeout', mnemonic, seconds)
+    settle = config.get('settle', {})
+    if 'min_dwell' in settle or 'max_wait' in settle:
+        dispatcher.emit('setSettleParameters', settle.get('min_dwell'), settle.get('max_wait'))
+    if 'query' in settle:
+        dispatcher.emit('setSettleQuery', settle['query'], settle.get('expected') or None)
@@ -0,0 +1,125 @@
+# macro_engine.py
+
+
+class Step:
+    def __init__(self, name, action=None, transitions=None, timeout=None, retries=0, on_alarm=None, on_timeout=None):
+        # transitions maps an event name to the next step name, to None (stay), or
+        # to a callable taking the event arguments and returning either of those.
+        self.name = name
+        self.action = action
+        self.transitions = transitions or {}
+        self.timeout = timeout
+        self.retries = retries
+        self.on_alarm = on_alarm
+        self.on_timeout = on_timeout
+
+
+class MacroEngine:
+    def __init__(self, loop_thread, steps=(), global_transitions=None, on_transition=None, on_stall=None):
+        self.loop_thread = loop_thread
+        self.steps = {}
+        self.global_transitions = global_transitions or {}
+        self.on_transition = on_transition
+        self.on_stall = on_stall
+        self.state = None
+        self.attempts = 0
+        # True while a failed step is being entered again for a retry, so its
+        # action can resend the command without redoing per-entry bookkeeping.
+        self.retrying = False
+        self.entry_id = 0
+        self.timer = None
+        self.load(steps)
+
+    @property
+    def running(self):
+        return self.state is not None
+
+    def load(self, steps, global_transitions=None):
+        self.steps = {step.name: step for step in steps}
+        if global_transitions is not None:
+            self.global_transitions = global_transitions
+
+    def start(self, initial, steps=None, global_transitions=None):
+        self.loop_thread.call_soon(self._start, initial, steps, global_transitions)
+
+    def _start(self, initial, steps, global_transitions):
+        self._cancel_timer()
+        self.state = None
+        if steps is not None:
+            self.load(steps, global_transitions)
+        self.enter(initial)
+
+    def stop(self):
+        self.loop_thread.call_soon(self._stop)
+
+    def _stop(self):
+        self._cancel_timer()
+        self.entry_id += 1
+        self.state = None
+
+    def post(self, event, *args):
+        self.loop_thread.call_soon(self._handle, None, event, args)
+
+    def bind(self, event):
+        # A callback tied to the current step entry; if it fires after the engine
+        # has moved on (late completion, stale timer) it is dropped.
+        entry_id = self.entry_id
+
+        def callback(*args):
+            self.loop_thread.call_soon(self._handle, entry_id, event, args)
+        return callback
+
+    def _handle(self, entry_id, event, args):
+        if self.state is None or (entry_id is not None and entry_id != self.entry_id):
+            return
+        step = self.steps[self.state]
+        if event in step.transitions:
+            target = step.transitions[event]
+        elif event in self.global_transitions:
+            target = self.global_transitions[event]
+        elif event == 'alarm':
+            self._fail(step, step.on_alarm, event, args)
+            return
+        elif event == 'timeout':
+            self._fail(step, step.on_timeout, event, args)
+            return
+        else:
+            return
+        if callable(target):
+            target = target(*args)
+        if target is not None and self.state is not None:
+            self.enter(target, event)
+
+    def _fail(self, step, handler, event, args):
+        if self.attempts < step.retries:
+            self.attempts += 1
+            self.enter(step.name, event, retry=True)
+            return
+        target = handler(*args) if callable(handler) else handler
+        if target is not None:
+            self.enter(target, event)
+        else:
+            self._cancel_timer()
+            if self.on_stall:
+                self.on_stall(step.name, event, args)
+
+    def enter(self, name, event=None, retry=False):
+        self._cancel_timer()
+        previous = self.state
+        step = self.steps[name]
+        self.state = name
+        self.entry_id += 1
+        self.retrying = retry
+        if not retry:
+            self.attempts = 0
+        if self.on_transition:
+            self.on_transition(previous, name, event)
+        if step.timeout:
+            self.timer = self.loop_thread.call_later(step.timeout, self.bind('timeout'))
+        if step.action:
+            step.action()
+
+    def _cancel_timer(self):
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
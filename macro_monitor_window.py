@@ -10,6 +10,14 @@ class MacroMonitorWindow(tk.Tk):
         super().__init__()
 
         self.offsets_frame = None
+        self.repeatability_frame = None
+        self.repeatability_table = None
+        self.histogram_canvas = None
+        self.timeouts_frame = None
+        self.timeouts_table = None
+        self.latency_frame = None
+        self.latency_table = None
+        self.export_latency_button = None
         self.offsets_table = None
         self.cycle_table = None
         self.cycle_frame = None
@@ -29,10 +37,13 @@ class MacroMonitorWindow(tk.Tk):
         self.create_sequence_status_table()
         self.create_cycle_table()
         self.create_offsets_table()
+        self.create_repeatability_table()
+        self.create_timeouts_table()
+        self.create_latency_table()
 
         # Emergency Stop Button
         self.emergency_stop_button = ttk.Button(self, text="Emergency Stop", command=self.handle_emergency_stop)
-        self.emergency_stop_button.grid(row=2, column=0, columnspan=2, pady=10, padx=5, sticky='ew')
+        self.emergency_stop_button.grid(row=5, column=0, columnspan=2, pady=10, padx=5, sticky='ew')
 
         # Configuring grid
         self.columnconfigure(0, weight=1)
@@ -41,12 +52,19 @@ class MacroMonitorWindow(tk.Tk):
         self.rowconfigure(1, weight=1)
         self.rowconfigure(2, weight=1)
         self.rowconfigure(3, weight=1)
+        self.rowconfigure(4, weight=1)
+        self.rowconfigure(5, weight=1)
 
         # Dispatcher register events
-        self.dispatcher.register_event("macro_update", self.update_status)
-        self.dispatcher.register_event("cycle_update", self.update_cycle_info)
-        self.dispatcher.register_event("offset_update", self.update_offsets)
-        self.dispatcher.register_event("total_cycles_update", self.update_total_cycles)
+        self.dispatcher.register_event("macro_update", self.update_status, tk=True)
+        self.dispatcher.register_event("cycle_update", self.update_cycle_info, tk=True)
+        self.dispatcher.register_event("offset_update", self.update_offsets, tk=True)
+        self.dispatcher.register_event("total_cycles_update", self.update_total_cycles, tk=True)
+        self.dispatcher.register_event("timeout_update", self.update_timeouts, tk=True)
+        self.dispatcher.register_event("latency_update", self.update_latency, tk=True)
+        self.dispatcher.register_event("repeatabilityUpdate", self.update_repeatability_summary, tk=True)
+        # Opened mid-run: fetch the summary so far rather than wait for the next one.
+        self.dispatcher.emit("requestRepeatability")
 
     def create_sequence_status_table(self):
         self.sequence_status_table = ttk.Treeview(self, columns=("Description", "Status"), show='headings', style="Treeview", height=6)
@@ -112,22 +130,58 @@ class MacroMonitorWindow(tk.Tk):
         for offset in offsets_data:
             self.offsets_table.insert("", "end", values=offset)
 
-        # Emergency Stop Button
-        self.emergency_stop_button = ttk.Button(self, text="Emergency Stop", command=self.handle_emergency_stop)
-        self.emergency_stop_button.grid(row=2, column=0, columnspan=2, pady=10, padx=5, sticky='ew')
-
-        # Configuring grid
-        self.columnconfigure(0, weight=1)
-        self.columnconfigure(1, weight=1)
-        self.rowconfigure(0, weight=1)
-        self.rowconfigure(1, weight=1)
-        self.rowconfigure(2, weight=1)
-        self.rowconfigure(3, weight=1)
-
-        self.dispatcher.register_event("macro_update", self.update_status)
-        self.dispatcher.register_event("cycle_update", self.update_cycle_info)
-        self.dispatcher.register_event("offset_update", self.update_offsets)
-        self.dispatcher.register_event("total_cycles_update", self.update_total_cycles)
+    def create_repeatability_table(self):
+        self.repeatability_frame = ttk.LabelFrame(self, text='Repeatability')
+        self.repeatability_frame.grid(row=2, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+
+        self.repeatability_table = ttk.Treeview(self.repeatability_frame, columns=("Statistic", "Offset", "Angle"),
+                                                show='headings', height=8)
+        self.repeatability_table.column("Statistic", anchor="e", width=70)
+        self.repeatability_table.column("Offset", anchor="center", width=80)
+        self.repeatability_table.column("Angle", anchor="center", width=80)
+        self.repeatability_table.heading("Statistic", text="")
+        self.repeatability_table.heading("Offset", text="mm")
+        self.repeatability_table.heading("Angle", text="deg")
+        self.repeatability_table.grid(row=0, column=0, sticky="nsew")
+
+        for label in ("N", "Mean", "Sigma", "Min", "Max"):
+            self.repeatability_table.insert("", "end", values=(label, "-", "-"))
+        # Whole-run figures, from the periodic repeatability summary
+        for label in ("3 Sigma", "Cpk", "Drift"):
+            self.repeatability_table.insert("", "end", iid=label, values=(label, "-", "-"))
+
+        # Offset histogram, redrawn from the accumulator's bins on each update
+        self.histogram_canvas = tk.Canvas(self.repeatability_frame, width=230, height=60, bg="white",
+                                          highlightthickness=0)
+        self.histogram_canvas.grid(row=1, column=0, pady=(5, 0))
+
+    def create_timeouts_table(self):
+        self.timeouts_frame = ttk.LabelFrame(self, text='Timeouts')
+        self.timeouts_frame.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+
+        self.timeouts_table = ttk.Treeview(self.timeouts_frame, columns=("Command", "Count"), show='', height=3)
+        self.timeouts_table.column("Command", anchor="e", width=90)
+        self.timeouts_table.column("Count", anchor="w", width=40)
+        self.timeouts_table.grid(row=0, column=0, sticky="nsew")
+
+        for command in ("MTRS", "MALN", "T1"):
+            self.timeouts_table.insert("", "end", iid=command, values=(f"{command}:", "0"))
+
+    def create_latency_table(self):
+        self.latency_frame = ttk.LabelFrame(self, text='Latency (ms)')
+        self.latency_frame.grid(row=4, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+
+        columns = ("Step", "N", "p50", "p95", "p99")
+        self.latency_table = ttk.Treeview(self.latency_frame, columns=columns, show='headings', height=6)
+        for column in columns:
+            self.latency_table.column(column, anchor="e" if column == "Step" else "center",
+                                      width=110 if column == "Step" else 55)
+            self.latency_table.heading(column, text="" if column == "Step" else column)
+        self.latency_table.grid(row=0, column=0, sticky="nsew")
+
+        self.export_latency_button = ttk.Button(self.latency_frame, text="Export",
+                                                command=lambda: self.dispatcher.emit("exportLatencies"))
+        self.export_latency_button.grid(row=1, column=0, pady=(5, 0), sticky="e")
 
     def apply_status_colors(self):
         for idx, step in enumerate(self.steps_data):
@@ -159,7 +213,7 @@ class MacroMonitorWindow(tk.Tk):
             self.cycle_table.item(item_id, values=cycle)
 
     def update_offsets(self, data):
-        positional_offset, angular_offset = data
+        positional_offset, angular_offset, offset_stats, angle_stats = data
         offsets_data = [
             (str(positional_offset), ' mm'),
             (str(angular_offset), ' deg')
@@ -167,6 +221,71 @@ class MacroMonitorWindow(tk.Tk):
         for idx, offset in enumerate(offsets_data):
             item_id = self.offsets_table.get_children()[idx]
             self.offsets_table.item(item_id, values=offset)
+        self.update_repeatability(offset_stats, angle_stats)
+
+    def update_repeatability(self, offset_stats, angle_stats):
+        def fmt(stats, key):
+            value = stats[key]
+            if value is None:
+                return "-"
+            return str(value) if key == 'count' else f"{value:.3f}"
+
+        rows = [("N", 'count'), ("Mean", 'mean'), ("Sigma", 'sigma'), ("Min", 'min'), ("Max", 'max')]
+        for item_id, (label, key) in zip(self.repeatability_table.get_children(), rows):
+            self.repeatability_table.item(item_id, values=(label, fmt(offset_stats, key), fmt(angle_stats, key)))
+        self.draw_histogram(offset_stats['histogram'])
+
+    def update_repeatability_summary(self, summary):
+        # summary is RepeatabilitySeries.summary(); either side may be None.
+        def fmt(stats, key):
+            if stats is None or stats[key] is None:
+                return "-"
+            return f"{stats[key]:+.3f}" if key == 'drift' else f"{stats[key]:.3f}"
+
+        for label, key in (("3 Sigma", 'three_sigma'), ("Cpk", 'cpk'), ("Drift", 'drift')):
+            self.repeatability_table.item(label, values=(label, fmt(summary['offset_mm'], key),
+                                                         fmt(summary['angle_deg'], key)))
+
+    def draw_histogram(self, histogram):
+        # histogram is {bin index: count}; sorted here, once per redraw.
+        canvas = self.histogram_canvas
+        canvas.delete("all")
+        if not histogram:
+            return
+        bins = sorted(histogram.items())
+        width = int(canvas.cget("width"))
+        height = int(canvas.cget("height"))
+        first, last = bins[0][0], bins[-1][0]
+        bar_width = width / (last - first + 1)
+        tallest = max(count for _, count in bins)
+        for index, count in bins:
+            x = (index - first) * bar_width
+            canvas.create_rectangle(x, height - height * count / tallest, x + max(bar_width - 1, 1), height,
+                                    fill="dark blue", outline="")
+
+    def update_timeouts(self, counts):
+        # Watchdog expiries this run, by command; other commands get a row on
+        # their first timeout.
+        for command in self.timeouts_table.get_children():
+            if command not in counts:
+                self.timeouts_table.item(command, values=(f"{command}:", "0"))
+        for command, count in counts.items():
+            if self.timeouts_table.exists(command):
+                self.timeouts_table.item(command, values=(f"{command}:", str(count)))
+            else:
+                self.timeouts_table.insert("", "end", iid=command, values=(f"{command}:", str(count)))
+        self.timeouts_table.configure(height=max(3, len(self.timeouts_table.get_children())))
+
+    def update_latency(self, snapshot):
+        # One row per interval seen this run, in sequence order.
+        def ms(ns):
+            return "-" if ns is None else f"{ns / 1e6:.1f}"
+
+        self.latency_table.delete(*self.latency_table.get_children())
+        for name, stats in snapshot.items():
+            self.latency_table.insert("", "end", values=(name, stats['count'], ms(stats['p50']), ms(stats['p95']),
+                                                         ms(stats['p99'])))
+        self.latency_table.configure(height=max(6, len(snapshot)))
 
     def update_total_cycles(self, new_total):
         self.cycle_frame.config(text=f"Total Cycles: {new_total}")
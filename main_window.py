@@ -1,28 +1,43 @@
 # main_window.py
 
+import atexit
+import logging
 import sys
 import os
+import time
 import tkinter as tk
-from datetime import datetime
-from tkinter import ttk, scrolledtext, Menu
+from tkinter import ttk, Menu, messagebox
 import subprocess
 import serial
 import serial.tools.list_ports
 
 from ui_frames import SerialControlFrame, TCPControlFrame, MacroControlFrame, StatusFrame
+import services
 from services import SerialService, TCPService, MacroService
+from transport import EventLoopThread
 from event_dispatcher import EventDispatcher
 from event_dispatcher import register_events
+from alarm_panel import AlarmPanel
+from log_sink import LogSink
+from log_view import LogModel, LogView
+from macro_config import apply_macro_config, load_macro_config
 from macro_monitor_window import MacroMonitorWindow
+from menu_bar.macro_settings import MacroConfig
+from results_store import ResultsStore
 
 
 class MainWindow(tk.Tk):
     def __init__(self):
         super().__init__()
         self.macro_monitor_window = None
+        self.macro_config_window = None
+        self.alarm_panel = None
         self.completed_cycles = None
         self.total_cycles = None
         self.status_frame = None
+        self.log_model = None
+        self.log_sink = LogSink().start()
+        atexit.register(self.log_sink.close)
         self.log_display = None
         self.serial_connected = False
         self.tcp_connected = False
@@ -32,17 +47,25 @@ class MainWindow(tk.Tk):
         self.ntb_control = None
         self.available_ports = []
         self.dispatcher = EventDispatcher()
-        self.serial_service = SerialService(dispatcher=self.dispatcher)
-        self.tcp_service = TCPService(dispatcher=self.dispatcher)
+        self.loop_thread = EventLoopThread().start()
+        self.results_store = ResultsStore().start()
+        atexit.register(self.results_store.close)
+        self.serial_service = SerialService(dispatcher=self.dispatcher, loop_thread=self.loop_thread,
+                                            results_store=self.results_store)
+        self.tcp_service = TCPService(dispatcher=self.dispatcher, loop_thread=self.loop_thread)
         self.macro_service = MacroService(dispatcher=self.dispatcher,
                                           serial_service=self.serial_service,
-                                          tcp_service=self.tcp_service)
+                                          tcp_service=self.tcp_service,
+                                          loop_thread=self.loop_thread,
+                                          results_store=self.results_store)
         self.scan_com_ports()
         self.create_control_frames()
         self.create_log_frame()
         self.create_status_frame()
         self.create_menu_bar()
         self.register_events()
+        apply_macro_config(load_macro_config(), self.dispatcher)
+        self.dispatcher.attach_tk(self)
         self.configure_grid()
         print("MainWindow initialized.")
 
@@ -52,7 +75,7 @@ class MainWindow(tk.Tk):
             self.serial_service,
             self.tcp_service,
             self.macro_service,
-            self.log_to_display,
+            self.log_batch_to_display,
             self.clear_log_display,
             self.export_log,
             self.scan_com_ports,
@@ -60,7 +83,9 @@ class MainWindow(tk.Tk):
             self.update_serial_connection_status,
             self.update_tcp_connection_status,
             self.update_macro_running_status,
-            self.update_completed_cycles_display
+            self.update_completed_cycles_display,
+            self.show_alarms,
+            self.show_warning
         )
 
     def scan_com_ports(self):
@@ -97,29 +122,21 @@ class MainWindow(tk.Tk):
         self.ntb_control.add(macro_control_tab, text="   Macro   ")
 
     def create_log_frame(self):
-        self.log_display = scrolledtext.ScrolledText(self, wrap=tk.WORD, height=22, width=62)
+        self.log_model = LogModel()
+        self.log_display = LogView(self, self.log_model, height=22, width=62)
         self.log_display.grid(row=0, column=1, rowspan=2, sticky="", padx=5, pady=5)
         fallback_fonts = ("Consolas", "Courier New", "Lucida Console", "monospace")
-        self.log_display.configure(bg="#000040", fg="yellow", font=(fallback_fonts, 10))
+        self.log_display.configure_text(bg="#000040", fg="yellow", font=(fallback_fonts, 10))
 
     def export_log(self):
-        print("export_log")
-        log_content = self.log_display.get("1.0", tk.END)
-
-        # Ensure the directory exists
-        log_dir = "LOGS"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-
-        # Write the log content to a file
-        log_file_path = os.path.join(log_dir, "log_output.txt")
-        with open(log_file_path, "w") as log_file:
-            log_file.write(log_content)
-
-        self.log_to_display("Log exported to log_output.txt", "System")
+        # Everything logged this session is already on disk; exporting copies the
+        # sink's files on its own thread once the queued entries are written.
+        log_file_path = os.path.join("LOGS", "log_output.txt")
+        self.log_sink.export(log_file_path, on_done=lambda path: self.dispatcher.emit(
+            'logToDisplay', f"Log exported to {os.path.basename(path)}", "System"))
 
     def clear_log_display(self):
-        self.log_display.delete('1.0', tk.END)
+        self.log_display.clear()
         print("Log Display cleared")
 
     def create_status_frame(self):
@@ -127,35 +144,47 @@ class MainWindow(tk.Tk):
         self.status_frame.grid(row=1, column=0, padx=5, pady=(0, 5), sticky="")
 
     def log_to_display(self, message, source):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {source} {message}"
-        self.log_display.insert(tk.END, f"{log_message}\n")
-        self.log_display.see(tk.END)
+        self.log_batch_to_display([(time.time(), message, source)])
+
+    def log_batch_to_display(self, entries):
+        # One model append and one render for everything logged since the last
+        # tick; the sink streams the same entries to disk. Each entry carries
+        # the time it was emitted, not the time it reached the Tk thread.
+        self.log_sink.write_entries(entries)
+        self.log_display.append([f"[{time.strftime('%H:%M:%S', time.localtime(stamp))}] {source} {message}"
+                                 for stamp, message, source in entries])
 
     def update_serial_connection_status(self, status):
-        print("debug this function from MainWindow0")
         self.serial_connected = status
         self.dispatcher.emit('updateButtonStates')
 
     def update_tcp_connection_status(self, status):
-        print("debug this function from MainWindow1")
         self.tcp_connected = status
         self.dispatcher.emit('updateButtonStates')
 
     def update_macro_running_status(self, status):
-        print("debug this function from MainWindow2")
         self.macro_running = status
-        print(f'macro running status: {status}')
+
+    def show_alarms(self, entries):
+        # showAlarm is batched: one (emit time, record) tuple per alarm since
+        # the last tick.
+        self.show_alarm_panel().add_alarms([record for _, record in entries])
+
+    @staticmethod
+    def show_warning(title, message):
+        messagebox.showwarning(title, message)
+
+    def show_alarm_panel(self):
+        if self.alarm_panel is None or not self.alarm_panel.winfo_exists():
+            self.alarm_panel = AlarmPanel(self, self.dispatcher, self.results_store.path)
+        else:
+            self.alarm_panel.deiconify()
+            self.alarm_panel.lift()
+        return self.alarm_panel
 
     def update_completed_cycles_display(self, completed_cycles):
-        print("debug this function from MainWindow3")
-        print(f"Updating completed cycles value: {completed_cycles}")
+        # Coalesced to the latest value per pump tick; Tk redraws on its own.
         self.completed_cycles_value.set(completed_cycles)
-        print(f"New value in IntVar: {self.completed_cycles_value.get()}")
-        try:
-            self.update_idletasks()
-        except Exception as e:
-            print(f"Caught an exception: {e}")
 
     def on_tab_change(self):  # forces immediate update
         self.ntb_control.update_idletasks()
@@ -175,11 +204,16 @@ class MainWindow(tk.Tk):
         settings_menu.add_command(label="TCP Config", command=self.show_tcp_config)
         settings_menu.add_command(label="Macro Settings", command=self.show_macro_config)
         settings_menu.add_command(label="Simulator Settings", command=self.show_simulator_settings)
+        settings_menu.add_separator()
+        self.trace_events = tk.BooleanVar(value=False)
+        settings_menu.add_checkbutton(label="Trace Events", variable=self.trace_events,
+                                      command=self.toggle_event_tracing)
 
         menu_bar.add_cascade(label="Settings", menu=settings_menu)
 
         windows_menu = Menu(menu_bar, tearoff=0)
         windows_menu.add_command(label="Macro Status", command=self.show_macro_status)
+        windows_menu.add_command(label="Alarms", command=self.show_alarm_panel)
         windows_menu.add_command(label="NXC100 Simulator", command=self.launch_simulator)
         menu_bar.add_cascade(label="Windows", menu=windows_menu)
 
@@ -190,6 +224,18 @@ class MainWindow(tk.Tk):
 
         self.config(menu=menu_bar)
 
+    def toggle_event_tracing(self):
+        if self.trace_events.get():
+            self.dispatcher.reset_trace()
+            self.dispatcher.enable_tracing()
+            services.log.setLevel(logging.DEBUG)
+            self.log_to_display("enabled", "Tracing:")
+        else:
+            self.dispatcher.disable_tracing()
+            services.log.setLevel(logging.NOTSET)
+            for line in self.dispatcher.trace_report():
+                self.log_to_display(line, "Trace:")
+
     @staticmethod
     def show_about():
         subprocess.Popen(["python", "menu_bar/about_window.py"])
@@ -215,9 +261,11 @@ class MainWindow(tk.Tk):
     def show_tcp_config():
         subprocess.Popen(["python", "menu_bar/tcp_config.py"])
 
-    @staticmethod
-    def show_macro_config():
-        subprocess.Popen(["python", "menu_bar/macro_settings.py"])
+    def show_macro_config(self):
+        if self.macro_config_window is None or not self.macro_config_window.winfo_exists():
+            self.macro_config_window = MacroConfig(self, self.dispatcher)
+        else:
+            self.macro_config_window.lift()
 
     @staticmethod
     def show_simulator_settings():
@@ -232,5 +280,6 @@ class MainWindow(tk.Tk):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(asctime)s %(name)s: %(message)s")
     main_window = MainWindow()
     main_window.mainloop()
@@ -1,9 +1,20 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import messagebox, ttk
 
-class MacroConfig(tk.Tk):
-    def __init__(self):
-        super().__init__()
+from macro_config import MACRO_CONFIG_PATH, apply_macro_config, load_macro_config, save_macro_config
+from recovery import ACTIONS, DEFAULT_CODE, PAUSE, TIMEOUT_CODE
+from services import STEP_TIMEOUTS
+from settle import MAX_WAIT, MIN_DWELL
+
+
+class MacroConfig(tk.Toplevel):
+    def __init__(self, parent, dispatcher, path=MACRO_CONFIG_PATH):
+        # Runs in the app's own process so Save reaches the macro through the
+        # dispatcher straight away; the same settings are applied at startup.
+        super().__init__(parent)
+        self.dispatcher = dispatcher
+        self.path = path
+        self.config_data = load_macro_config(path)
         self.title("Macro Configuration")
 
         # Total Cycles
@@ -39,6 +50,86 @@ class MacroConfig(tk.Tk):
         self.emergency_stop_button = ttk.Button(self, text="Emergency Stop", command=self.emergency_stop)
         self.emergency_stop_button.grid(row=4, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
+        # Recovery policies, one row per alarm code ('*' for all others,
+        # 'timeout' for a step whose watchdog ran out)
+        self.recovery_frame = ttk.LabelFrame(self, text="Recovery")
+        self.recovery_frame.grid(row=5, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+        self.recovery_table = ttk.Treeview(self.recovery_frame, columns=("Code", "Action", "Attempts", "Delay"),
+                                           show='headings', height=5)
+        for column in ("Code", "Action", "Attempts", "Delay"):
+            self.recovery_table.column(column, width=80, anchor="center")
+            self.recovery_table.heading(column, text=column)
+        self.recovery_table.grid(row=0, column=0, columnspan=4, padx=5, pady=5, sticky="nsew")
+        self.recovery_table.bind("<<TreeviewSelect>>", self.show_selected_policy)
+
+        self.code_var = tk.StringVar(value=DEFAULT_CODE)
+        self.code_entry = ttk.Combobox(self.recovery_frame, textvariable=self.code_var,
+                                       values=(DEFAULT_CODE, TIMEOUT_CODE), width=8)
+        self.code_entry.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
+        self.action_var = tk.StringVar(value=PAUSE)
+        self.action_dropdown = ttk.Combobox(self.recovery_frame, textvariable=self.action_var, values=ACTIONS,
+                                            state='readonly', width=8)
+        self.action_dropdown.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self.attempts_var = tk.IntVar(value=1)
+        self.attempts_spinbox = ttk.Spinbox(self.recovery_frame, from_=0, to=10, textvariable=self.attempts_var,
+                                            width=6)
+        self.attempts_spinbox.grid(row=1, column=2, padx=5, pady=5, sticky="ew")
+        self.delay_var = tk.DoubleVar(value=0.0)
+        self.delay_spinbox = ttk.Spinbox(self.recovery_frame, from_=0.0, to=60.0, increment=0.5,
+                                         textvariable=self.delay_var, width=6)
+        self.delay_spinbox.grid(row=1, column=3, padx=5, pady=5, sticky="ew")
+
+        self.set_policy_button = ttk.Button(self.recovery_frame, text="Set", command=self.set_policy)
+        self.set_policy_button.grid(row=2, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        self.remove_policy_button = ttk.Button(self.recovery_frame, text="Remove", command=self.remove_policy)
+        self.remove_policy_button.grid(row=2, column=2, columnspan=2, padx=5, pady=5, sticky="ew")
+
+        recovery = self.config_data.get('recovery', {})
+        for code, policy in recovery.items():
+            if isinstance(policy, str):
+                policy = {'action': policy}
+            self.show_policy(code, policy.get('action', PAUSE), policy.get('attempts', 1), policy.get('delay', 0.0))
+        if not self.recovery_table.exists(DEFAULT_CODE):
+            self.show_policy(DEFAULT_CODE, PAUSE, 1, 0.0)
+
+        # Watchdog timeouts in seconds, 0 for none
+        self.timeouts_frame = ttk.LabelFrame(self, text="Step Timeouts (sec, 0 = off)")
+        self.timeouts_frame.grid(row=6, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+        timeouts = dict(STEP_TIMEOUTS, **self.config_data.get('step_timeouts', {}))
+        self.timeout_vars = {}
+        for row, (mnemonic, seconds) in enumerate(timeouts.items()):
+            ttk.Label(self.timeouts_frame, text=f"{mnemonic}:").grid(row=row, column=0, padx=5, pady=2, sticky="w")
+            self.timeout_vars[mnemonic] = tk.DoubleVar(value=seconds)
+            ttk.Spinbox(self.timeouts_frame, from_=0.0, to=600.0, increment=1.0,
+                        textvariable=self.timeout_vars[mnemonic]).grid(row=row, column=1, padx=5, pady=2, sticky="ew")
+        self.timeouts_frame.columnconfigure(1, weight=1)
+
+        # Settle stage after MALN: at least the dwell, then until the XG-X
+        # answers the query with the expected reply, at most the max wait
+        self.settle_frame = ttk.LabelFrame(self, text="Settle")
+        self.settle_frame.grid(row=7, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+        settle = dict(min_dwell=MIN_DWELL, max_wait=MAX_WAIT, query="", expected="")
+        settle.update(self.config_data.get('settle', {}))
+        self.min_dwell_var = tk.DoubleVar(value=settle['min_dwell'])
+        self.max_wait_var = tk.DoubleVar(value=settle['max_wait'])
+        self.query_var = tk.StringVar(value=settle['query'] or "")
+        self.expected_var = tk.StringVar(value=settle['expected'] or "")
+        for row, (text, widget) in enumerate((
+                ("Min Dwell (sec):", ttk.Spinbox(self.settle_frame, from_=0.0, to=60.0, increment=0.1,
+                                                 textvariable=self.min_dwell_var)),
+                ("Max Wait (sec):", ttk.Spinbox(self.settle_frame, from_=0.0, to=120.0, increment=0.5,
+                                                textvariable=self.max_wait_var)),
+                ("XG-X Query:", ttk.Entry(self.settle_frame, textvariable=self.query_var)),
+                ("Expected Reply:", ttk.Entry(self.settle_frame, textvariable=self.expected_var)))):
+            ttk.Label(self.settle_frame, text=text).grid(row=row, column=0, padx=5, pady=2, sticky="w")
+            widget.grid(row=row, column=1, padx=5, pady=2, sticky="ew")
+        self.settle_frame.columnconfigure(1, weight=1)
+
+        self.save_button = ttk.Button(self, text="Save", command=self.save)
+        self.save_button.grid(row=8, column=0, padx=10, pady=(5, 10), sticky="ew")
+        self.close_button = ttk.Button(self, text="Close", command=self.destroy)
+        self.close_button.grid(row=8, column=1, padx=10, pady=(5, 10), sticky="ew")
+
         # Configure grid
         self.columnconfigure(1, weight=1)
 
@@ -46,6 +137,63 @@ class MacroConfig(tk.Tk):
         print("Emergency stop triggered")
         # Implement emergency stop logic here
 
-if __name__ == "__main__":
-    app = MacroConfig()
-    app.mainloop()
+    def show_policy(self, code, action, attempts, delay):
+        values = (code, action, attempts, delay)
+        if self.recovery_table.exists(code):
+            self.recovery_table.item(code, values=values)
+        else:
+            self.recovery_table.insert("", "end", iid=code, values=values)
+
+    def show_selected_policy(self, _event=None):
+        selection = self.recovery_table.selection()
+        if selection:
+            code, action, attempts, delay = self.recovery_table.item(selection[0], "values")
+            self.code_var.set(code)
+            self.action_var.set(action)
+            self.attempts_var.set(attempts)
+            self.delay_var.set(delay)
+
+    def set_policy(self):
+        code = self.code_var.get().strip()
+        if not code:
+            return
+        try:
+            attempts = max(0, self.attempts_var.get())
+            delay = max(0.0, self.delay_var.get())
+        except tk.TclError:
+            messagebox.showwarning("Macro Configuration", "Attempts and delay must be numbers", parent=self)
+            return
+        self.show_policy(code, self.action_var.get(), attempts, delay)
+
+    def remove_policy(self):
+        # The default stays; set it to pause rather than removing it.
+        for code in self.recovery_table.selection():
+            if code != DEFAULT_CODE:
+                self.recovery_table.delete(code)
+
+    def save(self):
+        config = dict(self.config_data)
+        config['recovery'] = {}
+        for code in self.recovery_table.get_children():
+            _, action, attempts, delay = self.recovery_table.item(code, "values")
+            config['recovery'][code] = {'action': action, 'attempts': int(attempts), 'delay': float(delay)}
+        try:
+            config['step_timeouts'] = {mnemonic: max(0.0, var.get()) for mnemonic, var in self.timeout_vars.items()}
+        except tk.TclError:
+            messagebox.showwarning("Macro Configuration", "Step timeouts must be numbers", parent=self)
+            return
+        try:
+            config['settle'] = {'min_dwell': max(0.0, self.min_dwell_var.get()),
+                                'max_wait': max(0.0, self.max_wait_var.get()),
+                                'query': self.query_var.get().strip(),
+                                'expected': self.expected_var.get().strip()}
+        except tk.TclError:
+            messagebox.showwarning("Macro Configuration", "Dwell and wait must be numbers", parent=self)
+            return
+        try:
+            save_macro_config(config, self.path)
+        except OSError as e:
+            messagebox.showwarning("Macro Configuration", f"Could not save {self.path}: {e}", parent=self)
+            return
+        self.config_data = config
+        apply_macro_config(config, self.dispatcher)
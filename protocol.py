@@ -0,0 +1,165 @@
+# protocol.py
+
+from functools import lru_cache
+from zlib import adler32
+
+ACK = '@'
+COMPLETION = '$'
+NO_ALARM = '0000'
+
+# Completions whose payload has a fixed length. For these the checksum is
+# only present if the frame is two characters longer (the simulator's MALN
+# completion leaves it off); every other frame ends in a checksum.
+PAYLOAD_LENGTHS = {
+    'MALN': 10,
+}
+
+
+# Host commands by name: (unit, mnemonic, default parameters).
+COMMANDS = {
+    'MTRS': ('2', 'MTRS', 'G100AL'),
+    'MALN': ('2', 'MALN', '1009000'),
+    'CSOL0': ('2', 'CSOL', 'A0'),
+    'CSOL1': ('2', 'CSOL', 'A1'),
+    'CCHK0': ('2', 'CCHK', 'A0'),
+    'CCHK1': ('2', 'CCHK', 'A1'),
+    'HRST': ('1', 'HRST', ''),
+    'CCLR': ('2', 'CCLR', 'E'),
+    'CEMG': ('2', 'CEMG', ''),
+}
+
+HEX_BYTE = [f"{value:02X}" for value in range(256)]
+
+# Acknowledgements and payload-free completions repeat byte for byte every
+# cycle, so their parsed Frames are shared. Frames are read-only by contract.
+FRAME_CACHE_SIZE = 1024
+frame_cache = {}
+
+
+def checksum(frame):
+    # Sum of the ASCII codes after the header, modulo 256, as two hex digits.
+    return HEX_BYTE[sum(frame[1:].encode('ascii', 'replace')) & 0xFF]
+
+
+@lru_cache(maxsize=256)
+def build_command(mnemonic, parameters='', unit='2'):
+    # '$' + unit + mnemonic + parameters + checksum, e.g. $2MTRSG100ALDD.
+    frame = f"${unit}{mnemonic}{parameters}"
+    return frame + checksum(frame)
+
+
+def named_command(name, parameters=None, unit=None):
+    default_unit, mnemonic, default_parameters = COMMANDS[name]
+    return build_command(mnemonic, default_parameters if parameters is None else parameters,
+                         default_unit if unit is None else unit)
+
+
+@lru_cache(maxsize=256)
+def encode_command(command):
+    # Wire bytes for a command; the handful sent every cycle are encoded once.
+    return f"{command}\r\n".encode('ascii')
+
+
+def received_sum(data):
+    # Byte sum of data[1:-2], the part a received checksum covers. Adler-32's
+    # low half is 1 + sum(data) mod 65521, which is the plain sum for anything
+    # shorter than 257 bytes and much faster to get than sum() in Python.
+    if len(data) > 256:
+        return sum(data[1:-2])
+    return (adler32(data) & 0xFFFF) - 1 - data[0] - data[-2] - data[-1]
+
+
+class Frame:
+    __slots__ = ('header', 'unit', 'seq', 'status', 'alarm', 'subcode', 'mnemonic', 'payload', 'checksum',
+                 'valid', 'line')
+
+    def __init__(self, line, mnemonic, payload, checksum, valid):
+        self.header = line[0]
+        self.unit = line[1]
+        self.seq = line[2]
+        self.status = line[3]
+        self.alarm = line[4:8]
+        self.subcode = line[8:12]
+        self.mnemonic = mnemonic
+        self.payload = payload
+        self.checksum = checksum
+        self.valid = valid
+        self.line = line
+
+    @property
+    def ok(self):
+        return self.alarm == NO_ALARM and self.subcode == NO_ALARM
+
+    @property
+    def is_ack(self):
+        return self.header == ACK
+
+    @property
+    def is_completion(self):
+        return self.header == COMPLETION
+
+    def __repr__(self):
+        return f"Frame({self.line!r})"
+
+    def __str__(self):
+        return self.line
+
+
+def parse_frame(data):
+    # One pass over a received '@' acknowledgement or '$' completion (bytes,
+    # without the line terminator):
+    #   [0] header  [1] unit  [2] seq  [3] status  [4:8] alarm  [8:12] subcode
+    #   completions only: [12:16] mnemonic, then the payload
+    #   both: a 2 character checksum at the end
+    # Returns None for anything that is not an NXC100 response.
+    frame = frame_cache.get(data)
+    if frame is not None:
+        return frame
+    if len(data) < 14:
+        return None
+    try:
+        line = data.decode()
+    except UnicodeDecodeError:
+        return None
+    header = line[0]
+    if header == COMPLETION:
+        mnemonic = line[12:16]
+        length = PAYLOAD_LENGTHS.get(mnemonic)
+        if length is None or len(line) == length + 18:
+            payload = line[16:-2]
+            received = line[-2:]
+        else:
+            payload = line[16:]
+            received = None
+    elif header == ACK:
+        mnemonic = ''
+        payload = line[12:-2]
+        received = line[-2:]
+    else:
+        return None
+    valid = received is None or received == HEX_BYTE[received_sum(data) & 0xFF]
+    frame = Frame(line, mnemonic, payload, received, valid)
+    if not payload and valid:
+        if len(frame_cache) >= FRAME_CACHE_SIZE:
+            frame_cache.clear()
+        frame_cache[data] = frame
+    return frame
+
+
+def parse_line(line):
+    return parse_frame(line.encode('ascii', 'replace'))
+
+
+def maln_offset(payload):
+    # MALN payload: 4 digit distance in 0.01 mm, then a 6 character angle in
+    # 0.01 deg with an optional leading '-'. Returns (mm, deg); either is None
+    # if it does not parse.
+    try:
+        offset_mm = int(payload[:4]) / 100
+    except ValueError:
+        offset_mm = None
+    try:
+        angle_deg = int(payload[4:10]) / 100
+    except ValueError:
+        angle_deg = None
+    return offset_mm, angle_deg
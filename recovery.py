@@ -0,0 +1,73 @@
+# recovery.py
+
+from collections import Counter
+
+from alarms import get_alarm_database
+
+# What the macro does when a step fails with an alarm:
+#   PAUSE  hold where it is for the operator (the default)
+#   RETRY  send the step's command again, after delay seconds
+#   CLEAR  send CCLR, then resend the step's command
+#   RESET  send HRST, then resend the step's command
+#   ABORT  stop the sequence, keeping the results so far
+PAUSE = 'pause'
+RETRY = 'retry'
+CLEAR = 'clear'
+RESET = 'reset'
+ABORT = 'abort'
+ACTIONS = (PAUSE, RETRY, CLEAR, RESET, ABORT)
+
+# Policy used for alarm codes without one of their own.
+DEFAULT_CODE = '*'
+# Pseudo alarm code for a step whose watchdog ran out.
+TIMEOUT_CODE = 'timeout'
+
+
+class RecoveryPolicy:
+    def __init__(self, action, attempts=1, delay=0.0):
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown recovery action {action!r}, expected one of {', '.join(ACTIONS)}")
+        self.action = action
+        self.attempts = max(0, int(attempts))
+        self.delay = max(0.0, float(delay))
+
+    def __str__(self):
+        if self.action in (PAUSE, ABORT):
+            return self.action
+        return f"{self.action} x{self.attempts}"
+
+
+class RecoveryPolicies:
+    def __init__(self, default=None):
+        # Alarm code -> RecoveryPolicy. Attempts are counted per code and reset
+        # at the start of every cycle; once a code's attempts are used up the
+        # sequence is aborted rather than left stalled.
+        self.policies = {DEFAULT_CODE: default or RecoveryPolicy(PAUSE)}
+        self.attempts = Counter()
+
+    def set_policy(self, code, action, attempts=1, delay=0.0):
+        policy = RecoveryPolicy(action, attempts, delay)
+        if code not in (DEFAULT_CODE, TIMEOUT_CODE) and code not in get_alarm_database():
+            print(f"Recovery policy for alarm {code}, which is not in the alarm table")
+        self.policies[code] = policy
+        return policy
+
+    def remove_policy(self, code):
+        if code != DEFAULT_CODE:
+            self.policies.pop(code, None)
+
+    def policy_for(self, code):
+        return self.policies.get(code, self.policies[DEFAULT_CODE])
+
+    def next_action(self, code):
+        # (action, policy) for another occurrence of code in this cycle.
+        policy = self.policy_for(code)
+        if policy.action in (PAUSE, ABORT):
+            return policy.action, policy
+        self.attempts[code] += 1
+        if self.attempts[code] > policy.attempts:
+            return ABORT, policy
+        return policy.action, policy
+
+    def reset(self):
+        self.attempts.clear()
@@ -0,0 +1,194 @@
+# repeatability.py
+#
+# Repeatability statistics for MALN offsets, recorded per cycle by
+# ResultsStore. Run directly to summarise a stored run:
+#
+#   python repeatability.py [results.sqlite3] [run_id]
+
+import math
+import sqlite3
+import sys
+from collections import Counter
+
+import numpy as np
+
+from results_store import RESULTS_PATH
+
+DRIFT_WINDOW = 50
+
+
+def capability(mean, sigma, lower=None, upper=None):
+    # Cpk against whichever spec limits are set; one-sided if only one is.
+    if not sigma or (lower is None and upper is None):
+        return None
+    margins = []
+    if upper is not None:
+        margins.append(upper - mean)
+    if lower is not None:
+        margins.append(mean - lower)
+    return min(margins) / (3 * sigma)
+
+
+def rolling_mean(values, window=DRIFT_WINDOW):
+    if values.size < window:
+        return np.empty(0)
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    return (cumulative[window:] - cumulative[:-window]) / window
+
+
+def summarize(values, lower=None, upper=None, window=DRIFT_WINDOW):
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return None
+    mean = float(values.mean())
+    sigma = float(values.std(ddof=1)) if values.size > 1 else 0.0
+    low, high = float(values.min()), float(values.max())
+    # Drift is how far the rolling mean has wandered over the run.
+    means = rolling_mean(values, window)
+    return {
+        'count': int(values.size),
+        'mean': mean,
+        'sigma': sigma,
+        'three_sigma': 3 * sigma,
+        'min': low,
+        'max': high,
+        'range': high - low,
+        'cpk': capability(mean, sigma, lower, upper),
+        'drift': float(means[-1] - means[0]) if means.size else 0.0,
+        'drift_range': float(means.max() - means.min()) if means.size else 0.0,
+    }
+
+
+class RepeatabilitySeries:
+    def __init__(self, capacity=1024):
+        # Offsets and angles in one growable array; None is stored as NaN so a
+        # cycle without a MALN result keeps its place.
+        self.data = np.empty((capacity, 2))
+        self.count = 0
+        self.offset_limits = (None, None)
+        self.angle_limits = (None, None)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def offsets(self):
+        return self.data[:self.count, 0]
+
+    @property
+    def angles(self):
+        return self.data[:self.count, 1]
+
+    def append(self, offset_mm, angle_deg):
+        if self.count == len(self.data):
+            self.data = np.concatenate((self.data, np.empty_like(self.data)))
+        self.data[self.count] = (np.nan if offset_mm is None else offset_mm,
+                                 np.nan if angle_deg is None else angle_deg)
+        self.count += 1
+
+    def extend(self, rows):
+        rows = np.asarray(rows, dtype=float).reshape(-1, 2)
+        while self.count + len(rows) > len(self.data):
+            self.data = np.concatenate((self.data, np.empty_like(self.data)))
+        self.data[self.count:self.count + len(rows)] = rows
+        self.count += len(rows)
+
+    def clear(self):
+        self.count = 0
+
+    def set_limits(self, offset_limits=None, angle_limits=None):
+        if offset_limits is not None:
+            self.offset_limits = tuple(offset_limits)
+        if angle_limits is not None:
+            self.angle_limits = tuple(angle_limits)
+
+    def summary(self, window=DRIFT_WINDOW):
+        return {
+            'offset_mm': summarize(self.offsets, *self.offset_limits, window=window),
+            'angle_deg': summarize(self.angles, *self.angle_limits, window=window),
+        }
+
+
+class RunningStats:
+    def __init__(self, bin_width):
+        # Welford's update: O(1) per value, no history kept. The histogram is
+        # sparse (bin index -> count), so it needs no range up front; it is
+        # handed out unsorted and ordered only where it is drawn.
+        self.bin_width = bin_width
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.histogram = Counter()
+
+    def add(self, value):
+        if value is None:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.histogram[math.floor(value / self.bin_width)] += 1
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def sigma(self):
+        return math.sqrt(self.variance)
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'sigma': self.sigma,
+            'min': self.min,
+            'max': self.max,
+            'bin_width': self.bin_width,
+            'histogram': dict(self.histogram),
+        }
+
+
+def format_summary(label, stats, unit):
+    if stats is None:
+        return f"{label}: no data"
+    cpk = "n/a" if stats['cpk'] is None else f"{stats['cpk']:.2f}"
+    return (f"{label}: n={stats['count']} mean {stats['mean']:.3f}{unit} sigma {stats['sigma']:.3f}{unit} "
+            f"3sigma {stats['three_sigma']:.3f}{unit} range {stats['range']:.3f}{unit} "
+            f"Cpk {cpk} drift {stats['drift']:+.3f}{unit}")
+
+
+def load_run(path=RESULTS_PATH, run_id=None):
+    connection = sqlite3.connect(path)
+    try:
+        if run_id is None:
+            row = connection.execute("SELECT run_id FROM runs ORDER BY started_at DESC LIMIT 1").fetchone()
+            if row is None:
+                return None, RepeatabilitySeries()
+            run_id = row[0]
+        rows = connection.execute("SELECT offset_mm, angle_deg FROM cycles WHERE run_id = ? ORDER BY cycle",
+                                  (run_id,)).fetchall()
+    finally:
+        connection.close()
+    series = RepeatabilitySeries(max(1, len(rows)))
+    series.extend(rows)
+    return run_id, series
+
+
+if __name__ == "__main__":
+    run_id, series = load_run(*sys.argv[1:3])
+    if run_id is None:
+        print("No runs recorded")
+        sys.exit(1)
+    summary = series.summary()
+    print(f"Run {run_id}")
+    print(format_summary("Offset", summary['offset_mm'], "mm"))
+    print(format_summary("Angle", summary['angle_deg'], "deg"))
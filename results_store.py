@@ -0,0 +1,173 @@
+# results_store.py
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+RESULTS_PATH = os.path.join("RESULTS", "results.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at REAL,
+    sequence TEXT,
+    mode TEXT,
+    total_cycles INTEGER
+);
+CREATE TABLE IF NOT EXISTS cycles (
+    run_id TEXT,
+    cycle INTEGER,
+    timestamp REAL,
+    offset_mm REAL,
+    angle_deg REAL,
+    cycle_s REAL,
+    alarms TEXT
+);
+CREATE TABLE IF NOT EXISTS step_latencies (
+    run_id TEXT,
+    cycle INTEGER,
+    step TEXT,
+    seconds REAL
+);
+CREATE TABLE IF NOT EXISTS cycle_edges (
+    run_id TEXT,
+    cycle INTEGER,
+    edge TEXT,
+    ns INTEGER
+);
+CREATE TABLE IF NOT EXISTS alarms (
+    timestamp REAL,
+    code TEXT,
+    subcode TEXT,
+    command TEXT,
+    run_id TEXT,
+    cycle INTEGER,
+    line TEXT
+);
+CREATE INDEX IF NOT EXISTS cycles_run ON cycles (run_id, cycle);
+CREATE INDEX IF NOT EXISTS cycles_time ON cycles (timestamp);
+CREATE INDEX IF NOT EXISTS step_latencies_run ON step_latencies (run_id, step);
+CREATE INDEX IF NOT EXISTS cycle_edges_run ON cycle_edges (run_id, cycle);
+CREATE INDEX IF NOT EXISTS alarms_time ON alarms (timestamp);
+CREATE INDEX IF NOT EXISTS alarms_code ON alarms (code, timestamp);
+"""
+
+
+class CycleRecord:
+    def __init__(self, cycle):
+        self.cycle = cycle
+        self.timestamp = time.time()
+        self.started_at = time.perf_counter()
+        self.started_ns = time.perf_counter_ns()
+        self.finished_at = None
+        self.offset_mm = None
+        self.angle_deg = None
+        self.latencies = {}
+        # Edge name -> ns since the cycle started, see latency.py.
+        self.edges = {'start': 0}
+        self.alarms = []
+
+    def mark(self, edge):
+        self.edges[edge] = time.perf_counter_ns() - self.started_ns
+
+    @property
+    def duration(self):
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def as_dict(self):
+        return {
+            'cycle': self.cycle,
+            'timestamp': self.timestamp,
+            'offset_mm': self.offset_mm,
+            'angle_deg': self.angle_deg,
+            'cycle_s': self.duration,
+            'latencies': dict(self.latencies),
+            'edges': dict(self.edges),
+            'alarms': list(self.alarms),
+        }
+
+
+class ResultsStore:
+    def __init__(self, path=RESULTS_PATH):
+        # Append-only per-cycle results. Rows are queued and written by one
+        # thread that owns the connection, committing after every cycle so a
+        # crash keeps everything up to the last completed one.
+        self.path = path
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, name="results-store", daemon=True)
+            self.thread.start()
+        return self
+
+    def begin_run(self, sequence, mode, total_cycles):
+        started_at = time.time()
+        run_id = datetime.fromtimestamp(started_at).strftime("%Y%m%d_%H%M%S_%f")
+        self.queue.put(("INSERT INTO runs VALUES (?, ?, ?, ?, ?)",
+                        [(run_id, started_at, sequence, mode, total_cycles)]))
+        return run_id
+
+    def record_cycle(self, run_id, record):
+        self.queue.put(("INSERT INTO cycles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [(run_id, record.cycle, record.timestamp, record.offset_mm, record.angle_deg,
+                          record.duration, ",".join(record.alarms))]))
+        if record.latencies:
+            self.queue.put(("INSERT INTO step_latencies VALUES (?, ?, ?, ?)",
+                            [(run_id, record.cycle, step, seconds) for step, seconds in record.latencies.items()]))
+        self.queue.put(("INSERT INTO cycle_edges VALUES (?, ?, ?, ?)",
+                        [(run_id, record.cycle, edge, ns) for edge, ns in record.edges.items()]))
+
+    def record_alarm(self, record):
+        self.queue.put(("INSERT INTO alarms VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [(record.timestamp, record.code, record.subcode, record.command, record.run_id,
+                          record.cycle, record.line)]))
+
+    def flush(self, timeout=5.0):
+        done = threading.Event()
+        self.queue.put((None, done))
+        return done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        if self.thread and self.thread.is_alive():
+            self.queue.put((None, None))
+            self.thread.join(timeout)
+
+    def connect(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def run(self):
+        try:
+            connection = self.connect()
+        except sqlite3.Error as e:
+            print(f"Results store unavailable: {e}")
+            return
+        while True:
+            statement, rows = self.queue.get()
+            try:
+                with connection:
+                    # Whatever else is already queued goes in the same commit.
+                    while statement is not None:
+                        connection.executemany(statement, rows)
+                        try:
+                            statement, rows = self.queue.get_nowait()
+                        except queue.Empty:
+                            break
+            except sqlite3.Error as e:
+                print(f"Results write failed: {e}")
+            if statement is None:
+                if rows is None:
+                    connection.close()
+                    return
+                rows.set()
@@ -1,32 +1,42 @@
 # services.py
 
-import socket
-import threading
+import asyncio
+from collections import Counter, deque
+from concurrent.futures import Future
 import tkinter as tk
 from tkinter import messagebox
+import os
 import serial
+import sqlite3
 import time
-from alarms import alarm_dict
+import logging
+from alarm_index import AlarmRecord
+from command_queue import CommandQueue, CommandAlarm, CommandTimeout
+from latency import LatencyStats, export_run, format_latency
+from macro_engine import MacroEngine, Step
+from protocol import COMMANDS, encode_command, maln_offset, named_command, parse_frame
+from recovery import ABORT, CLEAR, PAUSE, RESET, TIMEOUT_CODE, RecoveryPolicies
+from repeatability import RepeatabilitySeries, RunningStats, format_summary
+from results_store import CycleRecord
+from settle import UNCHANGED, SettleDetector, xgx_query_condition
+from transport import SerialTransport, TCPTransport, shared_loop_thread
+
+# Per-command, per-frame and per-cycle detail. Silent unless switched on with
+# Settings > Trace Events (or a logging configuration of your own).
+log = logging.getLogger(__name__)
 
 
 class SerialService:
-    def __init__(self, dispatcher=None):
+    def __init__(self, dispatcher=None, loop_thread=None, results_store=None):
         self.dispatcher = dispatcher
-        self.read_thread = None
+        self.results_store = results_store
+        self.loop_thread = loop_thread or shared_loop_thread
+        self.transport = None
         self.serial_port = None
         self.serial_port_name = None
         self.baud_rate = 9600
-        self.commands = {
-            'MTRS': '$2MTRSG100ALDD',
-            'MALN': '$2MALN1009000B4',
-            'CSOL0': '$2CSOLA0D4',
-            'CSOL1': '$2CSOLA1D5',
-            'CCHK0': '$2CCHKA0BC',
-            'CCHK1': '$2CCHKA1BD',
-            'HRST': '$1HRST72',
-            'CCLR': '$2CCLRE9B',
-        }
-        self.response_callback = None
+        self.commands = {name: named_command(name) for name in COMMANDS}
+        self.command_queue = CommandQueue(self.write_command, self.loop_thread, on_timeout=self.handle_command_timeout)
 
     def connect_serial_port(self, serial_port):
         self.serial_port_name = serial_port
@@ -48,7 +58,7 @@ class SerialService:
             print(f"Serial port {self.serial_port_name} opened at {self.baud_rate} baud.")
             self.dispatcher.emit('logToDisplay', f"at {self.baud_rate} baud.", f"Opened {self.serial_port_name}")
             time.sleep(0.5)
-            threading.Thread(target=self.read_from_port, args=(self.serial_port,), daemon=True).start()
+            self.read_from_port(self.serial_port)
             self.dispatcher.emit('updateSerialConnectionStatus', True)
             print(f"Serial port {self.serial_port_name} opened and read thread started.")
 
@@ -77,57 +87,73 @@ class SerialService:
             self.stop_reading()
 
     def stop_reading(self):
-        if self.read_thread and self.read_thread.is_alive():
-            self.read_thread.join()
+        self.command_queue.cancel_all("Serial port closed")
+        if self.transport:
+            self.transport.close()
+            self.transport = None
 
-    def send_serial_command(self, command, callback=None):
+    def send_serial_command(self, command, callback=None, timeout=None):
+        # Returns a Future that resolves to the '$' completion frame, or fails with
+        # CommandAlarm / CommandTimeout. callback still sees the ack and completion.
         if self.serial_port is None or not self.serial_port.is_open:
             print("Error: No open port to send command")
             messagebox.showerror("Serial Port Error", "Attempted to send command with no open port.")
             return
-        print(f"Sending command: {command}")
+        return self.command_queue.submit(command, callback, timeout)
+
+    def write_command(self, command):
         self.dispatcher.emit('logToDisplay', f"Sent: {command}", self.serial_port_name)
-        self.serial_port.write(f"{command}\r\n".encode('utf-8'))
-        self.response_callback = callback
+        self.transport.write(encode_command(command))
+
+    def command(self, name, parameters=None, unit=None):
+        # The stock command, or a variant with other parameters (station, angle)
+        # with its checksum computed.
+        if parameters is None and unit is None:
+            return self.commands[name]
+        return named_command(name, parameters, unit)
 
-    def move_to_ready_station(self):
-        command = self.commands['MTRS']
-        print(f"Sending: {command}")
+    def handle_command_timeout(self, entry):
+        print(f"Command timed out: {entry.command}")
+        self.dispatcher.emit('logToDisplay', f"No completion for {entry.command}", 'Timeout:')
+
+    def move_to_ready_station(self, parameters=None):
+        command = self.command('MTRS', parameters)
+        log.debug(f"Sending: {command}")
         self.send_serial_command(command)
 
-    def align_wafer(self):
-        command = self.commands['MALN']
-        print(f"Sending: {command}")
+    def align_wafer(self, parameters=None):
+        command = self.command('MALN', parameters)
+        log.debug(f"Sending: {command}")
         self.send_serial_command(command)
 
     def chuck_hold(self):
         command = self.commands['CSOL1']
-        print(f"Sending: {command}")
+        log.debug(f"Sending: {command}")
         self.send_serial_command(command)
 
     def chuck_release(self):
         command = self.commands['CSOL0']
-        print(f"Sending: {command}")
+        log.debug(f"Sending: {command}")
         self.send_serial_command(command)
 
     def solenoid_on(self):
         command = self.commands['CCHK1']
-        print(f"Sending: {command}")
+        log.debug(f"Sending: {command}")
         self.send_serial_command(command)
 
     def solenoid_off(self):
-        command = self.commands['CCHK2']
-        print(f"Sending: {command}")
+        command = self.commands['CCHK0']
+        log.debug(f"Sending: {command}")
         self.send_serial_command(command)
 
     def hardware_reset(self):
         command = self.commands['HRST']
-        print(f"Sending: {command}")
+        log.debug(f"Sending: {command}")
         self.send_serial_command(command)
 
     def send_custom_serial(self, custom_command):
         command = custom_command
-        print(f"Sending custom command: {command}")
+        log.debug(f"Sending custom command: {command}")
         self.send_serial_command(command)
 
     def emergency_stop(self):
@@ -136,194 +162,347 @@ class SerialService:
             print("Error: No open port to send emergency stop command")
             messagebox.showerror("Serial Port Error", "Attempted to send emergency stop with no open port.")
             return
-        command = "$2CEMG4E"
+        command = self.commands['CEMG']
         self.dispatcher.emit('logToDisplay', f"Sent: {command}", self.serial_port_name)
-        self.serial_port.write(f"{command}\r\n".encode('utf-8'))
+        self.transport.write(encode_command(command))
+        self.command_queue.cancel_all("Emergency stop")
         print("Emergency stop command sent")
 
     def send_clear_command(self):
         command = self.commands['CCLR']
-        print(f"Sending: {command}")
+        log.debug(f"Sending: {command}")
         self.send_serial_command(command)
 
     def read_from_port(self, serial_port):
         self.serial_port = serial_port
         print(f"Reading from {self.serial_port}.")
+        self.stop_reading()
+        self.transport = SerialTransport(self.loop_thread, serial_port, self.handle_frame, self.handle_read_error)
+        self.transport.open()
 
-        while self.serial_port and self.serial_port.is_open:
-            try:
-                line = self.serial_port.readline()
-                if line:
-                    line = line.decode('utf-8').strip()
-                    print(f"Complete message received: {line}")
-                    if '@' or '$' in line and len(line) >= 12:
-                        error_code = line[4:12]
-                        print(error_code)
-                        if error_code != "00000000":
-                            alarm_code = line[4:8]
-                            print(alarm_code)
-                            subcode = line[8:12]
-                            print(subcode)
-                            print(f"Error detected in response. Alarm: {alarm_code}, Subcode: {subcode}")
-                            self.show_alarm_messagebox(alarm_code, subcode)
-                            # self.dispatcher.emit('emergencyStop')
-                        else:
-                            print("Valid response, no errors detected.")
-                            self.dispatcher.emit('receivedData', f'Received: {line}', self.serial_port_name)
-                            if self.response_callback:
-                                self.response_callback(line)
-                    else:
-                        print("Message format incorrect or too short.")
-            except serial.SerialException as e:
-                print(f"Read failed: {str(e)}")
-            except Exception as e:
-                print(f"Unhandled exception: {str(e)}")
-                break
+    def raise_alarm(self, frame, entry=None):
+        # Runs on the reader's loop thread: resolve the alarm text, queue it
+        # for the alarm history and hand the record to the Tk thread, which
+        # shows it in the alarm panel. Nothing here waits on the operator.
+        command = entry.command if entry else frame.mnemonic or None
+        record = AlarmRecord(frame.alarm, frame.subcode, frame.mnemonic, frame.line, command,
+                             self.dispatcher.get('runId'), self.dispatcher.get('macroCycle'))
+        if self.results_store:
+            self.results_store.record_alarm(record)
+        self.dispatcher.emit('logToDisplay', f"{record}{record.subcode_note}", self.serial_port_name)
+        self.dispatcher.emit('showAlarm', record)
 
     @staticmethod
-    def show_alarm_messagebox(alarm, subcode):
-        alarm_data = alarm_dict.get(alarm, None)
+    def handle_read_error(error):
+        print(f"Read failed: {str(error)}")
 
-        if alarm_data is None:
-            alarm_info = {
-                "Message": "Unknown message",
-            }
-        else:
-            alarm_info = next(iter(alarm_data.values()), {
-                "Message": "Unknown message",
-                "Cause": "Unknown cause",
-                "Potential Causes": ["Unknown potential causes"]
-            })
-
-        message = alarm_info.get("Message", "Unknown message")
-        cause = alarm_info.get("Cause", "Unknown cause")
-        potential_causes = alarm_info.get("Potential Causes", ["Unknown potential causes"])
-        potential_causes_formatted = "\n".join([f"• {cause}" for cause in potential_causes])
-        formatted_message = (
-            f"Alarm: {alarm}\n\n"
-            f"{message}\n\n"
-            f"{cause}\n\n"
-            f"Potential Causes:\n{potential_causes_formatted}\n\n"
-            f"Subcode: {subcode}"
-        )
+    def handle_frame(self, data):
+        try:
+            frame = parse_frame(data.strip())
+            if frame is None:
+                log.debug(f"Message format incorrect or too short: {data!r}")
+            elif not frame.valid:
+                self.dispatcher.emit('logToDisplay', f"Checksum mismatch, dropped {frame.line}", self.serial_port_name)
+            elif frame.ok:
+                self.dispatcher.emit('receivedData', f'Received: {frame.line}', self.serial_port_name)
+                self.command_queue.dispatch(frame)
+            else:
+                log.debug(f"Error detected in response. Alarm: {frame.alarm}, Subcode: {frame.subcode}")
+                entry = self.command_queue.dispatch(frame)
+                self.raise_alarm(frame, entry)
+                # self.dispatcher.emit('emergencyStop')
+        except Exception as e:
+            print(f"Unhandled exception: {str(e)}")
 
-        root = tk.Toplevel()
-        root.withdraw()
-        messagebox.showerror("Alarm", formatted_message)
-        root.destroy()
+
+class PendingResponse:
+    def __init__(self, command, response, capture=False):
+        # capture marks a macro T1; only its reply goes on to the macro.
+        self.command = command
+        self.response = response
+        self.capture = capture
+        self.timer = None
 
 
 class TCPService:
-    def __init__(self, dispatcher=None):
+    def __init__(self, dispatcher=None, loop_thread=None):
         self.port = None
         self.ip_address = None
         self.dispatcher = dispatcher
-        self.socket = None
+        self.loop_thread = loop_thread or shared_loop_thread
+        self.transport = None
+        self.timeout = 5.0
+        self.pending_responses = deque()
+
+    @property
+    def connected(self):
+        return self.transport is not None and self.transport.connected
 
     def connect_tcp_socket(self, ip_address, port, timeout=5.0):
         self.ip_address = ip_address
         self.port = port
-        
+        self.timeout = timeout
+
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(timeout)
-            self.socket.connect((ip_address, int(port)))
+            self.transport = TCPTransport(self.loop_thread, self.handle_received_data, self.handle_connection_lost)
+            self.transport.connect(ip_address, int(port), timeout)
             self.dispatcher.emit('logToDisplay', f"Connected to {ip_address}:{port}", 'TCP')
             self.dispatcher.emit('updateTCPConnectionStatus', True)
             print(f"Connected to {ip_address}:{port}")
             return True
-        except socket.error as e:
+        except (OSError, asyncio.TimeoutError) as e:
+            self.transport = None
             self.dispatcher.emit('logToDisplay', f"Connection timed out {ip_address}:{port}", 'TCP')
             self.dispatcher.emit('updateTCPConnectionStatus', False)
             print(f"Connection failed to {ip_address}:{port}: {e}")
             return False
 
     def close_tcp_socket(self):
-        if self.socket:
-            self.socket.close()
-            self.socket = None
+        if self.transport:
+            self.transport.close()
+            self.transport = None
+            self.loop_thread.call_soon(self.cancel_pending_responses, ConnectionAbortedError("TCP connection closed"))
             self.dispatcher.emit('logToDisplay', f"Closed {self.ip_address}:{self.port}", 'TCP')
             self.dispatcher.emit('updateTCPConnectionStatus', False)
             print(f"Disconnected from {self.ip_address}:{self.port}")
 
-    def send_tcp_data(self, tcp_data):
-        if self.socket:
-            try:
-                tcp_data_with_terminator = tcp_data + '\r\n'
-                self.socket.sendall(tcp_data_with_terminator.encode('utf-8'))
-                self.dispatcher.emit('logToDisplay', f"Data sent: {tcp_data}", 'TCP')
-                print(f"Data sent: {tcp_data_with_terminator}")
-                self.handle_received_data()
-            except socket.error as e:
-                self.dispatcher.emit('logToDisplay', f"Data send failed: {e}", 'TCP')
-                print(f"Failed to send data: {e}")
-                self.dispatcher.emit('updateTCPConnectionStatus', False)
+    def send_tcp_data(self, tcp_data, timeout=None, capture=False):
+        # Fire-and-await: returns at once with a Future that resolves to the reply
+        # (or raises TimeoutError); the reply is also dispatched as before.
+        # timeout defaults to the connection's; 0 waits for as long as it takes.
+        if self.connected:
+            response = Future()
+            self.loop_thread.call_soon(self.queue_request, self.transport, tcp_data, response,
+                                       self.timeout if timeout is None else timeout, capture)
+            return response
         else:
+            # May run on the loop thread (settle queries), so the warning is
+            # shown by the Tk side.
             self.dispatcher.emit('logToDisplay', f"Not connected", 'TCP')
             self.dispatcher.emit('updateTCPConnectionStatus', False)
-            messagebox.showwarning('Warning', "No active TCP connection to send data.")
+            self.dispatcher.emit('showWarning', 'Warning', "No active TCP connection to send data.")
 
-    def handle_received_data(self):
-        if self.socket:
-            try:
-                data = self.socket.recv(1024).decode('utf-8').strip()
-                self.dispatcher.emit('logToDisplay', f"Data received: {data}", 'TCP')
-                print(f"Data received: {data}")
-                self.handle_response(data)
-            except socket.timeout:
-                self.dispatcher.emit('logToDisplay', "Data receive timeout", 'TCP')
-                print("Receive timeout")
-                self.dispatcher.emit('handleResponseT1')
-            except socket.error as e:
-                self.dispatcher.emit('logToDisplay', f"Data receive failed: {e}", 'TCP')
-                print(f"Failed to receive data: {e}")
-                self.dispatcher.emit('handleResponseT1')
+    def queue_request(self, transport, tcp_data, response, timeout, capture=False):
+        try:
+            tcp_data_with_terminator = tcp_data + '\r\n'
+            transport.write(tcp_data_with_terminator.encode('utf-8'))
+            self.dispatcher.emit('logToDisplay', f"Data sent: {tcp_data}", 'TCP')
+        except (OSError, RuntimeError, AttributeError) as e:
+            self.dispatcher.emit('logToDisplay', f"Data send failed: {e}", 'TCP')
+            print(f"Failed to send data: {e}")
+            self.dispatcher.emit('updateTCPConnectionStatus', False)
+            response.set_exception(ConnectionError(f"Data send failed: {e}"))
+            return
+        pending = PendingResponse(tcp_data.strip(), response, capture)
+        if timeout:
+            pending.timer = self.loop_thread.loop.call_later(timeout, self.expire_request, pending)
+        self.pending_responses.append(pending)
 
-    def handle_response(self, data):
+    def take_pending_response(self, data):
+        # XG-X replies echo the command ("T1") or report "ER,<command>,<code>", so
+        # a late reply is matched to its own request rather than the oldest one.
+        fields = data.split(',')
+        command = fields[1] if fields[0] == 'ER' and len(fields) > 1 else fields[0]
+        for pending in self.pending_responses:
+            if pending.command.split(',')[0] == command:
+                self.pending_responses.remove(pending)
+                return pending
+        if self.pending_responses:
+            return self.pending_responses.popleft()
+        return None
+
+    def handle_received_data(self, frame):
+        data = frame.decode('utf-8', errors='replace').strip()
+        self.dispatcher.emit('logToDisplay', f"Data received: {data}", 'TCP')
+        pending = self.take_pending_response(data)
+        if pending:
+            if pending.timer:
+                pending.timer.cancel()
+            pending.response.set_result(data)
+        self.handle_response(data, pending)
+
+    def expire_request(self, pending):
+        if pending not in self.pending_responses:
+            return
+        self.pending_responses.remove(pending)
+        pending.response.set_exception(TimeoutError(f"No reply to {pending.command}"))
+        # A missed T1 is not a capture; the macro's T1 watchdog decides what
+        # happens next.
+        self.dispatcher.emit('logToDisplay', f"No reply to {pending.command}", 'TCP')
+        print("Receive timeout")
+
+    def cancel_pending_responses(self, error):
+        while self.pending_responses:
+            pending = self.pending_responses.popleft()
+            if pending.timer:
+                pending.timer.cancel()
+            pending.response.set_exception(error)
+
+    def handle_connection_lost(self, error):
+        self.dispatcher.emit('logToDisplay', f"Data receive failed: {error or 'connection closed by peer'}", 'TCP')
+        print(f"Failed to receive data: {error}")
+        self.cancel_pending_responses(ConnectionError("TCP connection lost"))
+        if self.transport:
+            self.transport.close()
+            self.transport = None
+        self.dispatcher.emit('updateTCPConnectionStatus', False)
+
+    def handle_response(self, data, pending=None):
+        # Only the reply to a macro capture completes one; a manual Trig 1, or
+        # a reply that turns up after its request was given up, does not.
         data = data.strip()
-        if data == "T1":
-            print("Received expected response: T1")
-            self.dispatcher.emit('handleResponseT1')
+        if data == "T1" and pending is not None:
+            if pending.capture:
+                self.dispatcher.emit('handleResponseT1')
         else:
             self.dispatcher.emit('logToDisplay', f"Unexpected response: {data}", 'TCP')
-            print(f"Unexpected response: {data}")
+            log.debug(f"Unexpected response: {data}")
 
     # COMMANDS
     def trigger_one(self):
         command = "T1"
         self.send_tcp_data(command)
-        print("Triggering T1")
+        log.debug("Triggering T1")
+
+    def trigger_capture(self, timeout=None):
+        # T1 for the macro; its reply is awaited for as long as the macro's T1
+        # watchdog allows.
+        self.send_tcp_data("T1", timeout or 0, capture=True)
+        log.debug("Triggering T1 capture")
 
     def trigger_two(self):
-        command = "T2\r\n"
+        command = "T2"
         self.send_tcp_data(command)
-        print("Triggering T2")
+        log.debug("Triggering T2")
 
     def prev_camera(self):
-        command = "FW,PV\r\n"
+        command = "FW,PV"
         self.send_tcp_data(command)
-        print("Previous Camera View")
+        log.debug("Previous Camera View")
 
     def next_camera(self):
-        command = "FW,NX\r\n"
+        command = "FW,NX"
         self.send_tcp_data(command)
-        print("Next Camera View")
+        log.debug("Next Camera View")
 
     def send_custom_tcp(self, custom_command):
         self.send_tcp_data(custom_command)
-        print(f"Sending tcp command: {custom_command}")
+        log.debug(f"Sending tcp command: {custom_command}")
         self.dispatcher.emit('logToDisplay', f"Sent: {custom_command}", "TCP")
 
+# Watchdog per macro command, in seconds, by mnemonic (T1 is the XG-X trigger).
+# 0 disables a watchdog; a mnemonic not listed uses the command queue default.
+STEP_TIMEOUTS = {
+    'MTRS': 30.0,
+    'MALN': 30.0,
+    'CSOL': 10.0,
+    'CCLR': 10.0,
+    'HRST': 60.0,
+    'T1': 10.0,
+}
+
+# The full repeatability summary (3 sigma, Cpk, drift) is recomputed over the
+# whole run, a few ms at 100k cycles, so it goes out at most this often.
+REPEATABILITY_INTERVAL = 1.0
+
 
 class MacroService:
-    def __init__(self, dispatcher=None, serial_service=None, tcp_service=None):
+    def __init__(self, dispatcher=None, serial_service=None, tcp_service=None, loop_thread=None, results_store=None):
         self.dispatcher = dispatcher
+        self.loop_thread = loop_thread or shared_loop_thread
         self.serial_service = serial_service
         self.tcp_service = tcp_service
+        self.results_store = results_store
+        self.run_id = None
         self.macro_running = False
         self.total_cycles = None
         self.completed_cycles = 0
+        self.started_cycles = 0
         self.stop_requested = False
+        # Pipelined mode starts the next MTRS while the XG-X is still answering
+        # T1. capture_hold is the interlock: how long after T1 is sent the wafer
+        # must stay still before the aligner may move again.
+        self.pipelined = False
+        self.capture_hold = 0.5
+        self.capture_pending = False
+        self.t1_waiting = False
+        self.sequence_started_at = None
+        # One CycleRecord per started cycle, oldest first; in pipelined mode the
+        # oldest may still be waiting on T1 while the newest is moving.
+        self.cycles = deque()
+        self.step_entered_at = None
+        self.repeatability = RepeatabilitySeries()
+        self.repeatability_published_at = None
+        self.offset_stats = RunningStats(bin_width=0.01)
+        self.angle_stats = RunningStats(bin_width=0.05)
+        self.t1_sent_at = None
+        self.motion_durations = []
+        self.capture_durations = []
+        self.settle = SettleDetector(self.loop_thread)
+        self.engine = MacroEngine(self.loop_thread, on_transition=self.handle_transition, on_stall=self.handle_stall)
+        self.sequences = {
+            'alignment': self.alignment_steps,
+            'chuck': self.chuck_steps,
+        }
+        self.sequence_name = 'alignment'
+        # Per-command parameter overrides for macro steps, e.g. {'MALN': ...}.
+        self.command_parameters = {}
+        # What to do when a command step fails with an alarm, by alarm code.
+        # recovery_plan is (action, policy, step to resume) while recovering.
+        self.recovery = RecoveryPolicies()
+        self.recovery_plan = None
+        self.resuming = False
+        self.step_timeouts = dict(STEP_TIMEOUTS)
+        self.step_mnemonic = None
+        self.timeout_counts = Counter()
+        self.capture_watchdog = None
+        # Edge-to-edge latencies of every stored cycle, by interval.
+        self.latency = LatencyStats()
+
+    # SEQUENCE TABLES
+    def alignment_steps(self):
+        steps = [
+            Step('mtrs', self.run_sequence, {'complete': 'maln'}, on_alarm=self.handle_alarm,
+                 on_timeout=self.handle_timeout),
+            Step('maln', self.send_command_maln, {'complete': 'settle'}, on_alarm=self.handle_alarm,
+                 on_timeout=self.handle_timeout),
+            Step('settle', self.wait_for_settle, {'settled': 'trigger'}),
+            Step('trigger', self.send_command_t1, {'captured': self.handle_capture,
+                                                   'hold_elapsed': self.handle_capture_hold}),
+            Step('gap', self.wait_between_cycles, {'next': 'mtrs'}),
+            Step('done', self.finish_sequence),
+            *self.recovery_steps(),
+        ]
+        # A pipelined T1 reply (or its watchdog) lands while the next cycle is
+        # already moving.
+        return steps, {'captured': self.handle_capture, 'capture_timeout': self.handle_capture_timeout}
+
+    def chuck_steps(self):
+        steps = [
+            Step('chuck_hold', self.run_chuck_cycle, {'complete': 'chuck_release'}, on_alarm=self.handle_alarm,
+                 on_timeout=self.handle_timeout),
+            Step('chuck_release', lambda: self.send_step_command('CSOL0'), {'complete': self.end_chuck_cycle},
+                 on_alarm=self.handle_alarm, on_timeout=self.handle_timeout),
+            Step('gap', self.wait_between_cycles, {'next': 'chuck_hold'}),
+            Step('done', self.finish_sequence),
+            *self.recovery_steps(),
+        ]
+        return steps, {}
+
+    def recovery_steps(self):
+        # Shared by every sequence: a failed recovery command ends the run.
+        return [
+            Step('recover', self.run_recovery, {'complete': self.resume_after_recovery},
+                 on_alarm='aborted', on_timeout=self.handle_timeout),
+            Step('aborted', self.abort_sequence),
+        ]
+
+    def select_sequence(self, name):
+        if name not in self.sequences:
+            self.dispatcher.emit('logToDisplay', f"Unknown sequence {name}", "MacroService")
+            return
+        self.sequence_name = name
+        self.dispatcher.emit('logToDisplay', name, "Sequence:")
 
     def initialize_sequence(self, total_cycles):
         print("Initializing Sequence")
@@ -331,22 +510,381 @@ class MacroService:
         self.stop_requested = False
         self.dispatcher.emit('updateMacroRunningStatus', self.macro_running)
         self.completed_cycles = 0
+        self.started_cycles = 0
+        self.capture_pending = False
+        self.t1_waiting = False
+        self.cancel_capture_watchdog()
+        self.timeout_counts.clear()
+        self.dispatcher.emit('timeout_update', {})
+        self.latency.reset()
+        self.dispatcher.emit('latency_update', {})
+        self.cycles.clear()
+        self.step_entered_at = None
+        self.repeatability.clear()
+        self.repeatability_published_at = None
+        self.offset_stats.reset()
+        self.angle_stats.reset()
+        self.motion_durations = []
+        self.capture_durations = []
+        self.settle.reset_statistics()
+        self.sequence_started_at = time.perf_counter()
         self.total_cycles = int(total_cycles)
-        self.dispatcher.emit('logToDisplay', f"{total_cycles} Cycles\n\n", 'Initializing Sequence for')
-        self.run_sequence()
+        mode = "pipelined" if self.pipelined else "serial"
+        if self.results_store:
+            self.run_id = self.results_store.begin_run(self.sequence_name, mode, self.total_cycles)
+        self.dispatcher.set('runId', self.run_id)
+        self.dispatcher.emit('logToDisplay', f"{total_cycles} Cycles ({mode})\n\n", 'Initializing Sequence for')
+        steps, global_transitions = self.sequences[self.sequence_name]()
+        self.engine.start(steps[0].name, steps, global_transitions)
+
+    def begin_cycle(self):
+        if self.resuming:
+            # Resending the first command of a cycle after a retry or a recovery.
+            return
+        log.debug("Running sequence")
+        self.recovery.reset()
+        self.started_cycles += 1
+        self.cycles.append(CycleRecord(self.started_cycles))
+        self.dispatcher.set('macroCycle', self.started_cycles)
+        self.dispatcher.emit('logToDisplay', f"{self.total_cycles}=======", f'=======Starting Cycle {self.started_cycles} of')
 
     def run_sequence(self):
-        if self.macro_running and not self.stop_requested:
-            print("Running sequence")
-            self.dispatcher.emit('logToDisplay', f"{self.total_cycles}=======", f'=======Starting Cycle {self.completed_cycles + 1} of')
-            self.send_command_mtrs()
+        self.begin_cycle()
+        self.send_command_mtrs()
+
+    def run_chuck_cycle(self):
+        self.begin_cycle()
+        self.send_step_command('CSOL1')
+
+    def end_chuck_cycle(self):
+        self.complete_cycle()
+        self.increment_cycle_count()
+        return 'done' if self.completed_cycles >= self.total_cycles else 'gap'
+
+    def handle_transition(self, previous, step, event):
+        # Entering a step again, by an engine retry or after a recovery, only
+        # resends its command; the cycle it belongs to has already begun.
+        self.resuming = self.engine.retrying or (previous == 'recover' and event == 'complete')
+        now = time.perf_counter()
+        if previous:
+            self.record_step_latency(previous, now)
+        self.step_entered_at = now
+
+    def record_step_latency(self, step, now):
+        # Time spent in a step counts towards the newest cycle, the one moving.
+        if self.step_entered_at is None or not self.cycles or step in ('gap', 'done'):
+            return
+        record = self.cycles[-1]
+        if record.finished_at is None:
+            record.latencies[step] = record.latencies.get(step, 0.0) + now - self.step_entered_at
+
+    def complete_cycle(self):
+        now = time.perf_counter()
+        record = self.cycles.popleft()
+        if not self.cycles and self.engine.state:
+            # Not pipelined: the step that just ended belongs to this cycle.
+            self.record_step_latency(self.engine.state, now)
+            self.step_entered_at = now
+        record.finished_at = now
+        record.mark('end')
+        self.store_cycle(record)
+        return record
+
+    def store_cycle(self, record):
+        if self.results_store and self.run_id:
+            self.results_store.record_cycle(self.run_id, record)
+        self.dispatcher.emit('logToData', record.as_dict())
+        self.latency.add_edges(record.edges)
+        self.dispatcher.emit('latency_update', self.latency.snapshot())
+        if record.offset_mm is not None or record.angle_deg is not None:
+            self.offset_stats.add(record.offset_mm)
+            self.angle_stats.add(record.angle_deg)
+            self.dispatcher.emit('offset_update', (record.offset_mm, record.angle_deg,
+                                                   self.offset_stats.snapshot(), self.angle_stats.snapshot()))
+            self.repeatability.append(record.offset_mm, record.angle_deg)
+            now = time.perf_counter()
+            if (self.repeatability_published_at is None
+                    or now - self.repeatability_published_at >= REPEATABILITY_INTERVAL):
+                self.publish_repeatability()
+
+    def store_unfinished_cycles(self):
+        # Cycles cut short by a stop or a stall are kept too, without a duration.
+        while self.cycles:
+            self.store_cycle(self.cycles.popleft())
+
+    def wait_between_cycles(self):
+        self.loop_thread.call_later(0.1, self.engine.bind('next'))
 
     def stop_sequence(self):
         print("Stopping Sequence")
+        if self.macro_running:
+            self.report_throughput()
+            self.report_settle_statistics()
+            self.report_repeatability()
+            self.report_latency()
+        self.engine.stop()
+        self.settle.cancel()
+        self.loop_thread.call_soon(self.cancel_capture_watchdog)
+        self.loop_thread.call_soon(self.store_unfinished_cycles)
+        self.dispatcher.set('runId', None)
+        self.dispatcher.set('macroCycle', None)
         self.macro_running = False
         self.stop_requested = True
         self.dispatcher.emit('updateMacroRunningStatus', self.macro_running)
 
+    def handle_stall(self, step, event, args):
+        # No recovery configured: hold the macro where it is, as before.
+        print(f"{step.upper()} {event} received, macro paused")
+        self.note_cycle_alarm(event, args[0] if args else None)
+        self.dispatcher.emit('logToDisplay', f"{event} during {step.upper()}, macro paused", "Macro")
+
+    def note_cycle_alarm(self, event, error=None):
+        if not self.cycles:
+            return
+        if isinstance(error, CommandAlarm):
+            self.cycles[-1].alarms.append(f"{error.alarm_code}:{error.subcode}")
+        else:
+            self.cycles[-1].alarms.append(event)
+
+    # RECOVERY
+    def handle_alarm(self, error):
+        # Step.on_alarm for the command steps: the step to go to, or None to
+        # stall (PAUSE, handled by handle_stall).
+        return self.recover(error.alarm_code, f"{error.alarm_code}:{error.subcode}", 'alarm', error)
+
+    def handle_timeout(self, error=None):
+        # Step.on_timeout: the step's command watchdog ran out. Timeouts go
+        # through the recovery policy for TIMEOUT_CODE; one during a recovery
+        # ends the run.
+        step = self.engine.state
+        self.count_timeout(step, self.step_mnemonic)
+        if step == 'recover':
+            self.note_cycle_alarm('timeout', error)
+            return 'aborted'
+        return self.recover(TIMEOUT_CODE, f"{self.step_mnemonic} timeout", 'timeout', error)
+
+    def recover(self, code, description, event, error=None):
+        step = self.engine.state
+        action, policy = self.recovery.next_action(code)
+        outcome = action if action == policy.action else f"{action}, {policy} used up"
+        self.dispatcher.emit('logToDisplay', f"{description} during {step.upper()}, {outcome}", "Recovery:")
+        if action == PAUSE:
+            return None
+        self.note_cycle_alarm(event, error)
+        if action == ABORT:
+            return 'aborted'
+        self.recovery_plan = (action, policy, step)
+        return 'recover'
+
+    def run_recovery(self):
+        action, policy, step = self.recovery_plan
+        if action == CLEAR:
+            self.send_step_command('CCLR')
+        elif action == RESET:
+            self.send_step_command('HRST')
+        else:
+            self.loop_thread.call_later(policy.delay, self.engine.bind('complete'))
+
+    def resume_after_recovery(self):
+        action, policy, step = self.recovery_plan
+        self.recovery_plan = None
+        self.dispatcher.emit('logToDisplay', f"resending {step.upper()}", "Recovery:")
+        return step
+
+    def abort_sequence(self):
+        print("Aborting sequence")
+        self.dispatcher.emit('logToDisplay', "Sequence aborted", "Macro")
+        self.dispatcher.emit("stopSequence")
+
+    # WATCHDOG
+    def step_timeout(self, mnemonic):
+        return self.step_timeouts.get(mnemonic)
+
+    def set_step_timeout(self, mnemonic, seconds):
+        # seconds of 0 or None disables the watchdog for that command.
+        try:
+            seconds = max(0.0, float(seconds or 0))
+        except (TypeError, ValueError):
+            self.dispatcher.emit('logToDisplay', f"{mnemonic} {seconds!r} is not a number of seconds", "Watchdog:")
+            return
+        self.step_timeouts[mnemonic] = seconds
+        limit = f"{self.step_timeouts[mnemonic]:.1f}s" if self.step_timeouts[mnemonic] else "off"
+        self.dispatcher.emit('logToDisplay', f"{mnemonic} {limit}", "Watchdog:")
+
+    def count_timeout(self, step, mnemonic):
+        self.timeout_counts[mnemonic] += 1
+        seconds = self.step_timeout(mnemonic)
+        self.dispatcher.emit('stepTimeout', step, mnemonic, seconds)
+        self.dispatcher.emit('timeout_update', dict(self.timeout_counts))
+        self.dispatcher.emit('logToDisplay', f"{mnemonic} gave no completion within {seconds}s in "
+                                             f"{step.upper()}", "Watchdog:")
+
+    def arm_capture_watchdog(self):
+        self.cancel_capture_watchdog()
+        seconds = self.step_timeout('T1')
+        if seconds:
+            self.capture_watchdog = self.loop_thread.call_later(seconds, self.engine.post, 'capture_timeout')
+
+    def cancel_capture_watchdog(self):
+        if self.capture_watchdog:
+            self.capture_watchdog.cancel()
+            self.capture_watchdog = None
+
+    def handle_capture_timeout(self):
+        # Global transition: the XG-X did not answer T1 in time. Under a RETRY
+        # policy, while the wafer is still in place (trigger step, no newer
+        # cycle started) T1 is sent again; once a pipelined cycle has moved on,
+        # or the engine is in a recovery, that capture is given up and the
+        # cycle closed without it. CCLR and HRST go to the NXC100 and do
+        # nothing for a missed capture, so CLEAR and RESET pause instead.
+        self.capture_watchdog = None
+        step = self.engine.state
+        self.count_timeout(step, 'T1')
+        action, policy = self.recovery.next_action(TIMEOUT_CODE)
+        outcome = action if action == policy.action else f"{action}, {policy} used up"
+        in_place = step == 'trigger' and len(self.cycles) == 1
+        if action in (CLEAR, RESET):
+            outcome = f"{action} does not apply to T1, macro paused"
+            action = PAUSE
+        elif action != PAUSE and action != ABORT and not in_place:
+            outcome = "capture skipped, wafer has moved on"
+        self.dispatcher.emit('logToDisplay', f"T1 timeout during {step.upper()}, {outcome}", "Recovery:")
+        if self.cycles:
+            self.cycles[0].alarms.append('timeout')
+        if action == PAUSE:
+            return None
+        if action == ABORT:
+            return 'aborted'
+        if not in_place:
+            self.t1_sent_at = None
+            return self.handle_capture()
+        self.capture_pending = False
+        self.trigger_capture()
+        return None
+
+    def set_recovery_policy(self, code, action, attempts=1, delay=0.0):
+        # code is an alarm code from the alarm table, or '*' for all others.
+        try:
+            policy = self.recovery.set_policy(code, action, attempts, delay)
+        except (TypeError, ValueError) as e:
+            self.dispatcher.emit('logToDisplay', str(e), "Recovery:")
+            return
+        self.dispatcher.emit('logToDisplay', f"alarm {code} -> {policy}", "Recovery:")
+        if code == TIMEOUT_CODE and policy.action in (CLEAR, RESET):
+            self.dispatcher.emit('logToDisplay', f"{policy.action} applies to command timeouts only, "
+                                                 "a T1 timeout pauses", "Recovery:")
+
+    def clear_recovery_policies(self):
+        # Every code back to the default of pausing for the operator.
+        self.recovery = RecoveryPolicies()
+
+    def set_pipelined_mode(self, enabled, capture_hold=None):
+        self.pipelined = bool(enabled)
+        if capture_hold is not None:
+            self.capture_hold = max(0.0, float(capture_hold))
+        mode = f"pipelined, {self.capture_hold:.2f}s capture hold" if self.pipelined else "serial"
+        self.dispatcher.emit('logToDisplay', mode, "Macro mode:")
+
+    def set_settle_parameters(self, min_dwell=None, max_wait=None, poll_interval=None, condition=UNCHANGED):
+        try:
+            self.settle.configure(min_dwell, max_wait, poll_interval, condition)
+        except (TypeError, ValueError):
+            self.dispatcher.emit('logToDisplay', f"min {min_dwell!r}, max {max_wait!r} are not numbers of seconds",
+                                 "Settle:")
+            return
+        self.dispatcher.emit('logToDisplay', f"min {self.settle.min_dwell:.2f}s, max {self.settle.max_wait:.2f}s, "
+                                             f"poll {self.settle.poll_interval:.2f}s", "Settle:")
+
+    def set_settle_query(self, command=None, expected=None):
+        # Settled once the XG-X answers command with a reply starting with
+        # expected (after the minimum dwell); no command goes back to the
+        # dwell alone.
+        if command:
+            self.settle.configure(condition=xgx_query_condition(self.tcp_service, command, expected or command))
+            self.dispatcher.emit('logToDisplay', f"XG-X {command} -> {expected or command}", "Settle query:")
+        else:
+            self.settle.configure(condition=None)
+            self.dispatcher.emit('logToDisplay', "off, dwell only", "Settle query:")
+
+    def report_settle_statistics(self):
+        summary = self.settle.summary()
+        if summary is None:
+            return
+        self.dispatcher.emit('logToDisplay', f"n={summary['count']} mean {summary['mean']:.2f}s min {summary['min']:.2f}s "
+                                             f"p95 {summary['p95']:.2f}s max {summary['max']:.2f}s "
+                                             f"timeouts {summary['timeouts']}", "Settle times:")
+
+    def set_command_parameters(self, name, parameters=None):
+        if name not in COMMANDS:
+            self.dispatcher.emit('logToDisplay', f"Unknown command {name}", "Macro command:")
+            return
+        if parameters is None:
+            self.command_parameters.pop(name, None)
+        else:
+            self.command_parameters[name] = parameters
+        command = self.serial_service.command(name, parameters)
+        self.dispatcher.emit('logToDisplay', f"{name} -> {command}", "Macro command:")
+
+    def set_repeatability_limits(self, offset_limits=None, angle_limits=None):
+        # (lower, upper) spec limits for Cpk; either side may be None.
+        self.repeatability.set_limits(offset_limits, angle_limits)
+
+    def publish_repeatability(self):
+        # Full summary (3 sigma, Cpk, drift) of the run so far, for the Macro
+        # Monitor. Loop thread only, like store_cycle.
+        self.repeatability_published_at = time.perf_counter()
+        summary = self.repeatability.summary()
+        self.dispatcher.emit('repeatabilityUpdate', summary)
+        return summary
+
+    def request_repeatability(self):
+        # From any thread, e.g. a Macro Monitor opened mid-run.
+        self.loop_thread.call_soon(self.publish_repeatability)
+
+    def report_repeatability(self):
+        if not len(self.repeatability):
+            return
+        summary = self.publish_repeatability()
+        self.dispatcher.emit('logToDisplay', format_summary("offset", summary['offset_mm'], "mm"), "Repeatability:")
+        self.dispatcher.emit('logToDisplay', format_summary("angle", summary['angle_deg'], "deg"), "Repeatability:")
+
+    def report_latency(self):
+        for name, stats in self.latency.snapshot().items():
+            self.dispatcher.emit('logToDisplay', format_latency(name, stats), "Latency:")
+
+    def export_latencies(self, destination=None):
+        # Per-cycle edges and intervals of the current (or last) run as CSV,
+        # read back from the results store once its queue has been written.
+        if not self.results_store or not self.run_id:
+            self.dispatcher.emit('logToDisplay', "No run recorded to export", "Latency:")
+            return
+        run_id = self.run_id
+        destination = destination or os.path.join(os.path.dirname(self.results_store.path) or '.',
+                                                  f"latency_{run_id}.csv")
+
+        def export():
+            self.results_store.flush()
+            try:
+                count = export_run(self.results_store.path, run_id, destination)
+                self.dispatcher.emit('logToDisplay', f"{count} cycles exported to {destination}", "Latency:")
+            except (OSError, sqlite3.Error) as e:
+                self.dispatcher.emit('logToDisplay', f"Export failed: {e}", "Latency:")
+
+        return self.loop_thread.run_in_executor(export)
+
+    def report_throughput(self):
+        if not self.motion_durations or not self.capture_durations or self.sequence_started_at is None:
+            return
+        elapsed = time.perf_counter() - self.sequence_started_at
+        actual = 3600.0 * self.completed_cycles / elapsed
+        # What the same step timings would give if every cycle ran end to end,
+        # including the 0.1 s gap serial mode leaves between cycles.
+        serial_cycle = (sum(self.motion_durations) / len(self.motion_durations)
+                        + sum(self.capture_durations) / len(self.capture_durations) + 0.1)
+        serial = 3600.0 / serial_cycle
+        mode = "pipelined" if self.pipelined else "serial"
+        self.dispatcher.emit('logToDisplay', f"{actual:.0f} cycles/h ({mode}), serial equivalent {serial:.0f} cycles/h, x{actual / serial:.2f}", "Throughput:")
+
     def reset_sequence(self):
         print("Resetting sequence")
         self.completed_cycles = 0
@@ -354,84 +892,142 @@ class MacroService:
         self.macro_running = False
         self.stop_requested = False
 
+    def send_step_command(self, key, on_response=None):
+        # Sends one NXC100 command for the current step and routes its '$'
+        # completion, alarm or timeout back into the engine.
+        complete = self.engine.bind('complete')
+        alarm = self.engine.bind('alarm')
+        timeout = self.engine.bind('timeout')
+        # Edges go to the cycle that is moving when the command is sent.
+        record = self.cycles[-1] if self.cycles else None
+        edge = key.lower()
+
+        def handle_response(frame):
+            if record is not None:
+                record.mark(f"{edge}_ack" if frame.is_ack else f"{edge}_complete")
+            if on_response is None:
+                if frame.is_completion:
+                    complete()
+            elif on_response(frame):
+                complete()
+
+        def handle_failure(future):
+            if future.cancelled():
+                return
+            error = future.exception()
+            if isinstance(error, CommandAlarm):
+                alarm(error)
+            elif isinstance(error, CommandTimeout):
+                timeout(error)
+
+        command = self.serial_service.command(key, self.command_parameters.get(key))
+        self.step_mnemonic = COMMANDS[key][1]
+        if record is not None:
+            record.mark(f"{edge}_sent")
+        future = self.serial_service.send_serial_command(command, handle_response,
+                                                         self.step_timeout(self.step_mnemonic))
+        if future is not None:
+            future.add_done_callback(handle_failure)
+        return future
+
     def send_command_mtrs(self):
-        if self.stop_requested:
-            return
-        print("Sending command: MTRS")
+        log.debug("Sending command: MTRS")
         self.dispatcher.emit('moveToReadyPosition')
-        self.serial_service.send_serial_command(self.serial_service.commands['MTRS'], self.handle_response_mtrs)
+        self.send_step_command('MTRS', self.handle_response_mtrs)
 
-    def handle_response_mtrs(self, message):
-        if self.stop_requested:
-            return
-        if '@' in message:
-            print("MTRS acknowledgement received")
-        if '$' in message:
-            mtrs_index = message.find('MTRS')
-            if mtrs_index >= 8:
-                pre_mtrs = message[mtrs_index - 8:mtrs_index]
-                if pre_mtrs == '00000000':
-                    print("MTRS positive completion received")
-                    self.send_command_maln()
-                else:
-                    print("MTRS alarm received")
-                    pass  # pause the macro
+    def handle_response_mtrs(self, frame):
+        if frame.is_completion and frame.ok:
+            log.debug("MTRS positive completion received")
+            return True
+        return False
 
     def send_command_maln(self):
-        if self.stop_requested:
-            return
-        print("Sending command: MALN")
-        self.serial_service.send_serial_command(self.serial_service.commands['MALN'], self.handle_response_maln)
+        log.debug("Sending command: MALN")
+        self.send_step_command('MALN', self.handle_response_maln)
 
-    def handle_response_maln(self, message):
-        if self.stop_requested:
-            return
-        if '@' in message:
-            print("MALN acknowledgement received")
+    def handle_response_maln(self, frame):
+        if frame.is_ack:
             self.dispatcher.emit('logToDisplay', 'Wafer...', 'Aligning')
-        if '$' in message:
-            maln_index = message.find('MALN')
-            if maln_index >= 8:
-                pre_mtrs = message[maln_index - 8:maln_index]
-                if pre_mtrs == '00000000':
-                    print("MALN positive completion received")
-                    distance_start = maln_index + 4
-                    distance_raw = message[distance_start:distance_start + 4]
-                    try:
-                        distance_value = int(distance_raw)
-                        distance = f"{distance_value / 100:.2f}"
-                    except ValueError:
-                        distance = "Invalid distance format"
-                    angle_start = distance_start + 4
-                    angle_raw = message[angle_start:angle_start + 6]
-                    angle_sign = '-' if angle_raw[0] == '-' else ''
-                    try:
-                        angle_value = int(angle_raw.lstrip('-'))
-                        angle = f"{angle_value / 100:.2f}"
-                    except ValueError:
-                        angle = "Invalid angle format"
-                    log_message = f"{distance}mm {angle_sign}{angle}deg"
-                    self.dispatcher.emit('logToDisplay', log_message, "Offset:")
-                    self.wait_3_seconds()
-                else:
-                    pass
-
-    def wait_3_seconds(self):
-        print("Waiting for 3 seconds")
-        self.dispatcher.emit('logToDisplay', '3 secs.', 'Waiting for')
-        threading.Timer(3, self.send_command_t1).start()
+        elif frame.is_completion and frame.ok:
+            log.debug("MALN positive completion received")
+            offset_mm, angle_deg = maln_offset(frame.payload)
+            if self.cycles:
+                self.cycles[-1].offset_mm = offset_mm
+                self.cycles[-1].angle_deg = angle_deg
+            distance = "Invalid distance format" if offset_mm is None else f"{offset_mm:.2f}"
+            angle = "Invalid angle format" if angle_deg is None else f"{angle_deg:.2f}"
+            self.dispatcher.emit('logToDisplay', f"{distance}mm {angle}deg", "Offset:")
+            return True
+        return False
+
+    def wait_for_settle(self):
+        log.debug("Waiting for wafer to settle")
+        self.dispatcher.emit('logToDisplay', f'settle (min {self.settle.min_dwell:.2f} secs.)', 'Waiting for')
+        if self.cycles:
+            self.cycles[-1].mark('settle_start')
+        self.settle.start(self.handle_settled)
+
+    def handle_settled(self, settled):
+        if self.cycles:
+            self.cycles[-1].mark('settle_end')
+        if not settled:
+            self.dispatcher.emit('logToDisplay', f'not confirmed after {self.settle.max_wait:.2f} secs.', 'Settle')
+        self.engine.post('settled')
 
     def send_command_t1(self):
-        if self.stop_requested:
+        if self.cycles:
+            self.motion_durations.append(time.perf_counter() - self.cycles[-1].started_at)
+        if self.capture_pending:
+            # The previous cycle's T1 is still outstanding; fire once it answers.
+            self.t1_waiting = True
             return
-        print("Sending command: T1")
-        self.dispatcher.emit('triggerOne')
+        self.trigger_capture()
+
+    def trigger_capture(self):
+        log.debug("Sending command: T1")
+        self.capture_pending = True
+        self.t1_sent_at = time.perf_counter()
+        if self.cycles:
+            self.cycles[0].mark('t1_sent')
+        self.arm_capture_watchdog()
+        self.dispatcher.emit('triggerCapture', self.step_timeout('T1'))
+        if self.pipelined:
+            self.loop_thread.call_later(self.capture_hold, self.engine.bind('hold_elapsed'))
 
     def handle_response_t1(self):
-        if self.stop_requested:
-            return
-        print("Acknowledgment received for T1")
-        self.dispatcher.emit('incrementCycleCount')
+        self.engine.post('captured')
+
+    def handle_capture(self):
+        if not self.capture_pending:
+            # A T1 reply with no macro capture waiting for it.
+            self.dispatcher.emit('logToDisplay', "T1 reply with no capture pending, ignored", "Macro")
+            return None
+        self.cancel_capture_watchdog()
+        self.capture_pending = False
+        if self.t1_sent_at is not None:
+            self.capture_durations.append(time.perf_counter() - self.t1_sent_at)
+        if self.cycles:
+            if self.t1_sent_at is not None:
+                self.cycles[0].latencies['capture'] = self.capture_durations[-1]
+                self.cycles[0].mark('t1_received')
+            self.complete_cycle()
+        self.increment_cycle_count()
+        if self.completed_cycles >= self.total_cycles:
+            return 'done'
+        if self.t1_waiting:
+            self.t1_waiting = False
+            self.trigger_capture()
+            return None
+        if self.engine.state == 'trigger':
+            # Still waiting on this cycle (serial mode, or the reply beat the
+            # capture hold); the next cycle starts after the usual gap.
+            return 'gap'
+        return None
+
+    def handle_capture_hold(self):
+        if self.started_cycles < self.total_cycles:
+            return 'mtrs'
+        return None
 
     def update_total_cycles(self, new_total):
         try:
@@ -446,25 +1042,23 @@ class MacroService:
             self.dispatcher.emit('logToDisplay', str(e), "MacroService")
 
     def increment_cycle_count(self):
-        if self.stop_requested or self.total_cycles is None:
+        if self.total_cycles is None:
             return
         self.completed_cycles += 1
         self.dispatcher.emit('logToDisplay', f"{self.completed_cycles} of {self.total_cycles}=======\n\n", "=======Completed Cycle:")
-        print(f"Emitting updateCompletedCycles event with value: {self.completed_cycles}")
         self.dispatcher.emit("updateCompletedCycles", self.completed_cycles)
-        print(f"New cycle count: {self.completed_cycles}")
-        if self.completed_cycles >= int(self.total_cycles):
-            print("Total cycles reached, stopping sequence")
-            self.dispatcher.emit('logToData', {})
-            self.dispatcher.emit("stopSequence")
-            self.dispatcher.emit("updateCompletedCycles", self.total_cycles)
-            self.show_completion_messagebox()
-        else:
-            threading.Timer(0.1, self.run_sequence).start()
+
+    def finish_sequence(self):
+        print("Total cycles reached, stopping sequence")
+        self.dispatcher.emit("stopSequence")
+        self.dispatcher.emit("updateCompletedCycles", self.total_cycles)
+        self.dispatcher.emit('sequenceCompleted')
 
     def emergency_stop_sequence(self):
         print("Emergency stop triggered")
         self.stop_requested = True
+        self.engine.stop()
+        self.settle.cancel()
         self.dispatcher.emit('updateMacroRunningStatus', self.macro_running)
         self.dispatcher.emit('logToDisplay', "Emergency stop activated", 'Macro')
         self.macro_running = False
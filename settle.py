@@ -0,0 +1,129 @@
+# settle.py
+
+import time
+from concurrent.futures import Future
+
+# configure() default for "leave as it is", so that condition=None can clear
+# a condition set earlier.
+UNCHANGED = object()
+
+# Default settle window in seconds: the old fixed wait, and the longest a
+# condition is polled for before the stage times out.
+MIN_DWELL = 3.0
+MAX_WAIT = 10.0
+
+
+class SettleDetector:
+    def __init__(self, loop_thread, min_dwell=MIN_DWELL, max_wait=MAX_WAIT, poll_interval=0.1, condition=None):
+        # condition() is polled once min_dwell has passed. It may return a bool or
+        # a Future resolving to one (e.g. an XG-X query); None means the dwell alone
+        # is enough, which is the old fixed 3 s wait.
+        self.loop_thread = loop_thread
+        self.min_dwell = min_dwell
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+        self.condition = condition
+        self.on_settled = None
+        self.started_at = None
+        self.timer = None
+        self.run_id = 0
+        self.settle_times = []
+        self.timeouts = 0
+
+    def configure(self, min_dwell=None, max_wait=None, poll_interval=None, condition=UNCHANGED):
+        if min_dwell is not None:
+            self.min_dwell = max(0.0, float(min_dwell))
+        if max_wait is not None:
+            self.max_wait = max(self.min_dwell, float(max_wait))
+        if poll_interval is not None:
+            self.poll_interval = max(0.01, float(poll_interval))
+        if condition is not UNCHANGED:
+            self.condition = condition or None
+
+    def reset_statistics(self):
+        self.settle_times = []
+        self.timeouts = 0
+
+    def start(self, on_settled):
+        self.cancel()
+        self.on_settled = on_settled
+        self.started_at = time.perf_counter()
+        self.timer = self.loop_thread.call_later(self.min_dwell, self.check, self.run_id)
+
+    def cancel(self):
+        self.run_id += 1
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
+
+    def check(self, run_id):
+        if run_id != self.run_id:
+            return
+        if self.condition is None:
+            self.finish(run_id, True)
+            return
+        try:
+            ready = self.condition()
+        except Exception as e:
+            print(f"Settle condition failed: {e}")
+            ready = False
+        if isinstance(ready, Future):
+            ready.add_done_callback(lambda future: self.loop_thread.call_soon(self.evaluate, run_id, future))
+        else:
+            self.evaluate(run_id, ready)
+
+    def evaluate(self, run_id, ready):
+        if run_id != self.run_id:
+            return
+        if isinstance(ready, Future):
+            ready = not ready.cancelled() and ready.exception() is None and bool(ready.result())
+        if ready:
+            self.finish(run_id, True)
+        elif time.perf_counter() - self.started_at >= self.max_wait:
+            self.finish(run_id, False)
+        else:
+            self.timer = self.loop_thread.call_later(self.poll_interval, self.check, run_id)
+
+    def finish(self, run_id, settled):
+        if run_id != self.run_id:
+            return
+        self.run_id += 1
+        self.timer = None
+        self.settle_times.append(time.perf_counter() - self.started_at)
+        if not settled:
+            self.timeouts += 1
+        on_settled, self.on_settled = self.on_settled, None
+        if on_settled:
+            on_settled(settled)
+
+    def summary(self):
+        if not self.settle_times:
+            return None
+        times = sorted(self.settle_times)
+        return {
+            'count': len(times),
+            'mean': sum(times) / len(times),
+            'min': times[0],
+            'max': times[-1],
+            'p95': times[min(len(times) - 1, int(0.95 * len(times)))],
+            'timeouts': self.timeouts,
+        }
+
+
+def xgx_query_condition(tcp_service, command, expected):
+    # Builds a condition that sends command to the XG-X and is satisfied when the
+    # reply starts with expected. Not settled while the XG-X is disconnected.
+    def condition():
+        if not tcp_service.connected:
+            return False
+        response = tcp_service.send_tcp_data(command)
+        if response is None:
+            return False
+        ready = Future()
+
+        def resolve(future):
+            ready.set_result(not future.cancelled() and future.exception() is None
+                             and future.result().startswith(expected))
+        response.add_done_callback(resolve)
+        return ready
+    return condition
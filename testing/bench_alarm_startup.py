@@ -0,0 +1,78 @@
+# bench_alarm_startup.py
+#
+# Startup cost of the alarm table: time and resident memory growth for importing
+# alarms, resolving the first alarm, and loading the whole table. Each case
+# runs in a fresh interpreter.
+#
+#   python testing/bench_alarm_startup.py [old_alarms.py] [runs]
+#
+# old_alarms.py is the former dict literal module (git show <rev>:alarms.py),
+# timed both cold (compiled from source) and warm (from its .pyc).
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+PROBE = """
+import json, os, sys, time
+def rss():
+    # Current resident set in KB (Linux); 0 where /proc is not available.
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, AttributeError):
+        return 0
+sys.path.insert(0, {path!r})
+before = rss()
+started = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - started
+print(json.dumps([elapsed, rss() - before]))
+"""
+
+CASES = (
+    ("import alarms", ROOT, "import alarms"),
+    ("first alarm lookup", ROOT,
+     "import alarm_index\nalarm_index.get_alarm_index().describe('1105', '0005')"),
+    ("full alarm_dict", ROOT, "import alarms\nalarms.alarm_dict"),
+)
+
+
+def probe(path, body, env=None):
+    output = subprocess.run([sys.executable, "-c", PROBE.format(path=path, body=body)], env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def report(label, path, body, runs, env=None):
+    results = [probe(path, body, env) for _ in range(runs)]
+    elapsed = min(result[0] for result in results)
+    rss = min(result[1] for result in results)
+    print(f"{label:>28}: {elapsed * 1000:7.2f} ms  +{rss:6d} KB RSS")
+
+
+def main():
+    legacy = sys.argv[1] if len(sys.argv) > 1 else None
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else RUNS
+    # Everything is timed from .pyc files unless marked cold.
+    warm = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    for label, path, body in CASES:
+        probe(path, body, warm)
+        report(label, path, body, runs, warm)
+    if legacy:
+        with tempfile.TemporaryDirectory() as directory:
+            with open(legacy, 'rb') as source, open(os.path.join(directory, "alarms.py"), 'wb') as copy:
+                copy.write(source.read())
+            cold = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+            report("old dict literal (cold)", directory, "import alarms", runs, cold)
+            probe(directory, "import alarms", warm)
+            report("old dict literal (warm)", directory, "import alarms", runs, warm)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# bench_frame_parser.py
+#
+# Replays NXC100 response frames through protocol.parse_frame() and through
+# the slicing/find() parsing it replaced, and reports frames per second.
+#
+#   python testing/bench_frame_parser.py [capture.txt] [repeats]
+#
+# A capture is one frame per line; lines from an exported log ("... Received:
+# $2...") work too. Without one a synthetic alignment run is generated.
+#
+# The target is TARGET frames/s over a replayed capture, which parse_frame
+# meets because acknowledgements and payload-free completions come from the
+# frame cache. Frames with a payload (MALN) are parsed afresh every time and
+# run at roughly half the target: slicing out the fields and building the
+# Frame alone cost about a microsecond in CPython. That is an accepted
+# limitation; one MALN frame arrives per alignment cycle, so it is nowhere
+# near the serial line's own rate.
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from protocol import checksum, parse_frame  # noqa: E402
+
+TARGET = 1e6
+CYCLES = 25000
+REPEATS = 5
+
+
+def synthetic_capture(cycles):
+    rng = random.Random(0)
+    frames = []
+    for _ in range(cycles):
+        frames.append("@2300000000015")
+        frames.append("$23200000000MTRS5D")
+        frames.append("@2100000000013")
+        body = f"$24200000000MALN{rng.randint(14, 21):04}{rng.randint(-18000, 18000):06}"
+        # The simulator leaves the checksum off MALN completions; the
+        # controller does not.
+        frames.append(body + checksum(body) if rng.random() < 0.5 else body)
+        if rng.random() < 0.01:
+            alarm = f"$242{rng.randint(1000, 9999)}0000MALN0017010851"
+            frames.append(alarm + checksum(alarm))
+    return frames
+
+
+def load_capture(path):
+    frames = []
+    with open(path, encoding='utf-8', errors='replace') as capture:
+        for line in capture:
+            line = line.strip()
+            if 'Received: ' in line:
+                line = line.split('Received: ', 1)[1]
+            if line[:1] in ('@', '$'):
+                frames.append(line)
+    return frames
+
+
+def legacy_parse(data):
+    # What handle_frame/handle_response_maln did per frame before.
+    line = data.decode('utf-8', errors='replace').strip()
+    if len(line) < 12:
+        return None
+    error_code = line[4:12]
+    if error_code != "00000000":
+        return line[4:8], line[8:12]
+    index = line.find('MALN')
+    if index >= 8 and line[index - 8:index] == '00000000':
+        return line[index + 4:index + 8], line[index + 8:index + 14]
+    return line
+
+
+def measure(parse, frames, repeats):
+    best = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for data in frames:
+            parse(data)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return len(frames) / best
+
+
+def main():
+    frames = load_capture(sys.argv[1]) if len(sys.argv) > 1 else synthetic_capture(CYCLES)
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else REPEATS
+    frames = [frame.encode('ascii', 'replace') for frame in frames]
+
+    parsed = [parse_frame(data) for data in frames]
+    rejected = sum(1 for frame in parsed if frame is None)
+    bad_checksum = sum(1 for frame in parsed if frame is not None and not frame.valid)
+    print(f"{len(frames)} frames, {rejected} not recognised, {bad_checksum} checksum mismatches, "
+          f"target {TARGET / 1e6:.1f} M frames/s")
+
+    # Frames with a payload are never shared, so they show the uncached cost.
+    with_payload = [data for data, frame in zip(frames, parsed) if frame is not None and frame.payload]
+    for name, parse, subset in (("parse_frame", parse_frame, frames),
+                                ("  payload only", parse_frame, with_payload),
+                                ("legacy slicing", legacy_parse, frames)):
+        if not subset:
+            continue
+        rate = measure(parse, subset, repeats)
+        print(f"{name:>15}: {rate / 1e6:6.2f} M frames/s  ({1e9 / rate:6.0f} ns/frame)"
+              f"{'' if rate >= TARGET or parse is legacy_parse else '  below target'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# bench_repeatability.py
+#
+# Times a full repeatability summary (mean, sigma, range, Cpk, rolling drift)
+# for growing run lengths, i.e. the cost of recomputing it after one cycle.
+#
+#   python testing/bench_repeatability.py [max_cycles]
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from repeatability import RepeatabilitySeries  # noqa: E402
+
+MAX_CYCLES = 200000
+REPEATS = 20
+
+
+def main():
+    max_cycles = int(sys.argv[1]) if len(sys.argv) > 1 else MAX_CYCLES
+    rng = np.random.default_rng(0)
+    offsets = rng.normal(0.15, 0.01, max_cycles)
+    angles = rng.normal(0.0, 0.05, max_cycles)
+
+    cycles = 1000
+    while cycles <= max_cycles:
+        series = RepeatabilitySeries()
+        series.set_limits(offset_limits=(None, 0.3), angle_limits=(-0.5, 0.5))
+        series.extend(np.column_stack((offsets[:cycles], angles[:cycles])))
+        started = time.perf_counter()
+        for _ in range(REPEATS):
+            series.append(offsets[cycles - 1], angles[cycles - 1])
+            series.summary()
+        elapsed = (time.perf_counter() - started) / REPEATS
+        print(f"{cycles:>7} cycles: {elapsed * 1000:7.2f} ms per append + summary")
+        cycles *= 10 if cycles < max_cycles // 10 else 2
+
+
+if __name__ == "__main__":
+    main()
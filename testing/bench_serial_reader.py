@@ -0,0 +1,112 @@
+# bench_serial_reader.py
+#
+# Pushes frames through a loopback pseudo-terminal and reports throughput and
+# latency for the framed reader and for the old readline() loop.
+#
+#   python testing/bench_serial_reader.py [frame_count]
+
+import os
+import sys
+import threading
+import time
+import tty
+
+import serial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from framing import SerialReader  # noqa: E402
+
+FRAME_COUNT = 5000
+TERMINATORS = (b'\r\n', b'\r', b'\n')
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def open_loopback():
+    master_fd, slave_fd = os.openpty()
+    tty.setraw(master_fd)
+    tty.setraw(slave_fd)
+    port = serial.Serial(os.ttyname(slave_fd), 9600, timeout=1)
+    return master_fd, slave_fd, port
+
+
+def write_frames(master_fd, frame_count, pace):
+    for seq in range(frame_count):
+        # Every third frame ends in a bare CR, which readline() cannot see until
+        # the next LF arrives.
+        terminator = TERMINATORS[seq % len(TERMINATORS)]
+        os.write(master_fd, f"$2{seq:06d}MTRS{time.perf_counter_ns()}".encode('ascii') + terminator)
+        if pace:
+            time.sleep(pace)
+
+
+def run_framed(frame_count, pace):
+    master_fd, slave_fd, port = open_loopback()
+    latencies = []
+    done = threading.Event()
+
+    def on_frame(frame):
+        latencies.append(time.perf_counter_ns() - int(frame[12:]))
+        if len(latencies) >= frame_count:
+            done.set()
+
+    reader = SerialReader(port, on_frame)
+    reader.start()
+    started = time.perf_counter()
+    write_frames(master_fd, frame_count, pace)
+    done.wait(30)
+    elapsed = time.perf_counter() - started
+    reader.stop(timeout=0)
+    port.close()
+    os.close(master_fd)
+    os.close(slave_fd)
+    return latencies, elapsed
+
+
+def run_readline(frame_count, pace):
+    master_fd, slave_fd, port = open_loopback()
+    latencies = []
+
+    def read_loop():
+        while len(latencies) < frame_count:
+            line = port.readline()
+            if not line:
+                continue
+            for part in line.decode('utf-8').split('\r'):
+                part = part.strip()
+                if part:
+                    latencies.append(time.perf_counter_ns() - int(part[12:]))
+
+    thread = threading.Thread(target=read_loop, daemon=True)
+    thread.start()
+    started = time.perf_counter()
+    write_frames(master_fd, frame_count, pace)
+    thread.join(frame_count * 1.5)
+    elapsed = time.perf_counter() - started
+    port.close()
+    os.close(master_fd)
+    os.close(slave_fd)
+    return latencies, elapsed
+
+
+def report(name, latencies, elapsed):
+    if not latencies:
+        print(f"{name:>10}: no frames received")
+        return
+    print(f"{name:>10}: {len(latencies):6d} frames  {len(latencies) / elapsed:10.0f} frames/s  "
+          f"p50 {percentile(latencies, 50) / 1e6:8.3f} ms  "
+          f"p99 {percentile(latencies, 99) / 1e6:8.3f} ms")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else FRAME_COUNT
+    print(f"Burst of {count} frames")
+    report("framed", *run_framed(count, 0))
+    report("readline", *run_readline(count, 0))
+    print("Paced, 200 frames at 5 ms intervals (bare CR terminators stall readline)")
+    report("framed", *run_framed(200, 0.005))
+    report("readline", *run_readline(200, 0.005))
@@ -0,0 +1,18 @@
+# conftest.py
+#
+# The modules under test live at the top of the repo, next to main_window.py.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from transport import EventLoopThread  # noqa: E402
+
+
+@pytest.fixture
+def loop_thread():
+    loop_thread = EventLoopThread(name="test-loop").start()
+    yield loop_thread
+    loop_thread.stop()
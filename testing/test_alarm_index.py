@@ -0,0 +1,72 @@
+# test_alarm_index.py
+
+from alarm_index import AlarmIndex, parse_subcode_key
+from alarms import get_alarm_database
+
+ALARMS = {
+    '0201': {
+        '0001:001F': {'Message': 'range'},
+        '0010': {'Message': 'exact'},
+        '0040:0030': {'Message': 'written high:low'},
+    },
+    '0300': {
+        '0000': {'Message': 'only'},
+    },
+}
+
+
+def naive_key(entries, subcode):
+    # Narrowest entry covering subcode, by a linear scan.
+    value = int(subcode, 16)
+    covering = []
+    for key in entries:
+        low, high = parse_subcode_key(key)
+        if low <= value <= high:
+            covering.append((high - low, low, high, key))
+    return min(covering)[3] if covering else None
+
+
+def test_range_bounds_are_inclusive():
+    index = AlarmIndex(ALARMS)
+    assert index.find_key('0201', '0000') is None
+    assert index.find_key('0201', '0001') == '0001:001F'
+    assert index.find_key('0201', '001F') == '0001:001F'
+    assert index.find_key('0201', '0020') is None
+
+
+def test_exact_subcode_inside_a_range_wins():
+    index = AlarmIndex(ALARMS)
+    assert index.find_key('0201', '000F') == '0001:001F'
+    assert index.find_key('0201', '0010') == '0010'
+    assert index.find_key('0201', '0011') == '0001:001F'
+
+
+def test_high_low_keys_are_put_in_order():
+    index = AlarmIndex(ALARMS)
+    assert index.find_key('0201', '002F') is None
+    assert index.find_key('0201', '0030') == '0040:0030'
+    assert index.find_key('0201', '0040') == '0040:0030'
+    assert index.find_key('0201', '0041') is None
+
+
+def test_unknown_code_or_subcode():
+    index = AlarmIndex(ALARMS)
+    assert index.find_key('9999', '0001') is None
+    assert index.find_key('0201', 'zz') is None
+    assert index.describe('0300', '0001') == ({'Message': 'only'}, None)
+    assert index.describe('9999', '0001') == (None, None)
+
+
+def test_matches_a_linear_scan_of_the_alarm_table():
+    alarms = get_alarm_database()
+    index = AlarmIndex(alarms)
+    for code in alarms.codes():
+        entries = alarms.get(code)
+        for key in entries:
+            try:
+                low, high = parse_subcode_key(key)
+            except ValueError:
+                continue
+            for value in {low - 1, low, high, high + 1} - {-1}:
+                subcode = f"{value:04X}"
+                assert index.find_key(code, subcode) == naive_key(entries, subcode), (code, subcode)
@@ -0,0 +1,70 @@
+# test_alarms.py
+
+import ast
+import os
+import subprocess
+
+import pytest
+
+import alarms
+from alarms import ALARMS_PATH, AlarmDatabase, write_alarm_file
+
+ALARMS = {
+    '0020': {'0001': {'Message': 'CPU COMMUNICATION ERROR', 'Potential Causes': ['a', 'b']}},
+    '0201': {'0001:001F': {'Message': 'range'}, '0010': {'Message': 'exact µ'}},
+}
+
+
+def legacy_alarm_dict():
+    # The alarm_dict literal alarms.py held before the table moved to
+    # alarms.jsonl, read from the repository's first commit.
+    root = os.path.dirname(ALARMS_PATH)
+    try:
+        first = subprocess.run(['git', 'rev-list', '--max-parents=0', 'HEAD'], cwd=root, capture_output=True,
+                               text=True, check=True).stdout.split()[-1]
+        source = subprocess.run(['git', 'show', f'{first}:alarms.py'], cwd=root, capture_output=True,
+                                text=True, encoding='utf-8', check=True).stdout
+    except (OSError, IndexError, subprocess.CalledProcessError):
+        pytest.skip("git history not available")
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Assign) and [target.id for target in node.targets] == ['alarm_dict']:
+            return ast.literal_eval(node.value)
+    pytest.skip("first commit has no alarm_dict literal")
+
+
+def test_jsonl_matches_the_legacy_dict():
+    legacy = legacy_alarm_dict()
+    database = AlarmDatabase()
+    try:
+        assert database.codes() == list(legacy)
+        assert database.load_all() == legacy
+    finally:
+        database.close()
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "alarms.jsonl")
+    write_alarm_file(ALARMS, path)
+    database = AlarmDatabase(path)
+    try:
+        assert '0201' in database and '9999' not in database
+        assert database.get('0201') == ALARMS['0201']
+        assert list(database.entries) == ['0201']
+        assert database.load_all() == ALARMS
+        assert database.get('9999', {}) == {}
+        with pytest.raises(KeyError):
+            database['9999']
+    finally:
+        database.close()
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "alarms.jsonl"
+    path.write_bytes(b"")
+    database = AlarmDatabase(str(path))
+    assert database.codes() == []
+    assert database.get('0020') is None
+
+
+def test_alarm_dict_is_the_whole_table():
+    assert alarms.alarm_dict == alarms.get_alarm_database().load_all()
@@ -0,0 +1,109 @@
+# test_command_queue.py
+
+import pytest
+
+from command_queue import CommandAlarm, CommandCancelled, CommandQueue, CommandTimeout
+from protocol import checksum, parse_line
+
+MTRS = "$2MTRSG100ALDD"
+MALN = "$2MALN1009000B4"
+HRST = "$1HRST72"
+
+
+def frame(body):
+    return parse_line(body + checksum(body))
+
+
+def ack(unit):
+    return frame(f"@{unit}0000000000")
+
+
+def completion(unit, mnemonic, alarm='0000'):
+    return frame(f"${unit}00{alarm}0000{mnemonic}")
+
+
+def queue(loop_thread, **kwargs):
+    sent = []
+    return CommandQueue(sent.append, loop_thread, **kwargs), sent
+
+
+def test_completion_resolves_the_matching_command(loop_thread):
+    commands, sent = queue(loop_thread)
+    responses = []
+    mtrs = commands.submit(MTRS, responses.append)
+    maln = commands.submit(MALN)
+    assert sent == [MTRS, MALN]
+    commands.dispatch(completion('2', 'MALN'))
+    assert maln.done() and not mtrs.done()
+    result = completion('2', 'MTRS')
+    commands.dispatch(result)
+    assert mtrs.result(0) is result
+    assert responses == [result]
+    assert commands.in_flight() == []
+
+
+def test_acks_go_to_the_oldest_unacknowledged_command_of_their_unit(loop_thread):
+    commands, _ = queue(loop_thread)
+    responses = []
+    commands.submit(MTRS, lambda frame: responses.append(('MTRS', frame.header)))
+    commands.submit(HRST, lambda frame: responses.append(('HRST', frame.header)))
+    commands.submit(MALN, lambda frame: responses.append(('MALN', frame.header)))
+    commands.dispatch(ack('1'))
+    commands.dispatch(ack('2'))
+    commands.dispatch(ack('2'))
+    assert responses == [('HRST', '@'), ('MTRS', '@'), ('MALN', '@')]
+    assert all(entry.acknowledged for entry in commands.in_flight())
+
+
+def test_alarm_completion_fails_the_command(loop_thread):
+    commands, _ = queue(loop_thread)
+    future = commands.submit(MTRS)
+    commands.dispatch(completion('2', 'MTRS', alarm='0201'))
+    with pytest.raises(CommandAlarm) as error:
+        future.result(0)
+    assert error.value.alarm_code == '0201'
+    assert commands.in_flight() == []
+
+
+def test_unmatched_frames_are_ignored(loop_thread):
+    commands, _ = queue(loop_thread)
+    future = commands.submit(MTRS)
+    assert commands.dispatch(completion('2', 'MALN')) is None
+    assert commands.dispatch(ack('1')) is None
+    assert not future.done()
+
+
+def test_backlog_waits_for_a_free_slot(loop_thread):
+    commands, sent = queue(loop_thread, max_in_flight=1)
+    commands.submit(MTRS)
+    maln = commands.submit(MALN)
+    assert sent == [MTRS]
+    commands.dispatch(completion('2', 'MTRS'))
+    assert sent == [MTRS, MALN]
+    assert [entry.future for entry in commands.in_flight()] == [maln]
+
+
+def test_timeout_frees_the_slot_for_the_backlog(loop_thread):
+    commands, sent = queue(loop_thread, max_in_flight=1)
+    timed_out = []
+    commands.on_timeout = timed_out.append
+    mtrs = commands.submit(MTRS, timeout=0.05)
+    maln = commands.submit(MALN, timeout=5.0)
+    with pytest.raises(CommandTimeout):
+        mtrs.result(2.0)
+    assert [entry.command for entry in timed_out] == [MTRS]
+    assert sent == [MTRS, MALN]
+    # A late completion for the expired command finds nothing waiting.
+    assert commands.dispatch(completion('2', 'MTRS')) is None
+    commands.dispatch(completion('2', 'MALN'))
+    assert maln.result(0).mnemonic == 'MALN'
+
+
+def test_cancel_all_fails_in_flight_and_backlog(loop_thread):
+    commands, _ = queue(loop_thread, max_in_flight=1)
+    futures = [commands.submit(MTRS), commands.submit(MALN)]
+    commands.cancel_all("port closed")
+    for future in futures:
+        with pytest.raises(CommandCancelled):
+            future.result(0)
+    assert commands.in_flight() == [] and not commands.backlog
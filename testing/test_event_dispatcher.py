@@ -0,0 +1,133 @@
+# test_event_dispatcher.py
+#
+# Tk cannot run here, so a stand-in root collects after() callbacks and the
+# tests run the pump by hand.
+
+import threading
+import time
+
+import pytest
+
+from event_dispatcher import BATCH_APPEND, LATEST_WINS, EventDispatcher
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+
+    def tick(self):
+        callbacks, self.scheduled = self.scheduled, []
+        for callback in callbacks:
+            callback()
+
+
+def attached():
+    dispatcher = EventDispatcher()
+    root = FakeRoot()
+    dispatcher.attach_tk(root)
+    return dispatcher, root
+
+
+def emit_from_thread(dispatcher, event_name, *args):
+    thread = threading.Thread(target=dispatcher.emit, args=(event_name, *args))
+    thread.start()
+    thread.join()
+
+
+def test_service_handlers_run_inline_off_the_tk_thread():
+    dispatcher, root = attached()
+    calls = []
+    dispatcher.register_event('stopSequence', lambda: calls.append(('service', threading.current_thread())))
+    dispatcher.register_event('stopSequence', lambda: calls.append(('ui', threading.current_thread())), tk=True)
+    emit_from_thread(dispatcher, 'stopSequence')
+    assert [name for name, _ in calls] == ['service']
+    assert calls[0][1] is not threading.current_thread()
+    root.tick()
+    assert [name for name, _ in calls] == ['service', 'ui']
+    assert calls[1][1] is threading.current_thread()
+
+
+def test_events_without_tk_handlers_are_not_queued():
+    dispatcher, root = attached()
+    dispatcher.register_event('handleResponseT1', lambda: None)
+    emit_from_thread(dispatcher, 'handleResponseT1')
+    assert not dispatcher.pending
+
+
+def test_tk_thread_runs_every_handler_at_once():
+    dispatcher, root = attached()
+    calls = []
+    dispatcher.register_event('stopSequence', lambda: calls.append('service'))
+    dispatcher.register_event('stopSequence', lambda: calls.append('ui'), tk=True)
+    dispatcher.emit('stopSequence')
+    assert calls == ['service', 'ui']
+
+
+def test_unattached_dispatcher_runs_everything_inline():
+    dispatcher = EventDispatcher()
+    calls = []
+    dispatcher.register_event('updateMacroRunningStatus', calls.append, tk=True)
+    emit_from_thread(dispatcher, 'updateMacroRunningStatus', True)
+    assert calls == [True]
+
+
+def test_batches_keep_order_with_pass_through_events():
+    dispatcher, root = attached()
+    dispatcher.set_event_policy('logToDisplay', BATCH_APPEND)
+    seen = []
+    dispatcher.register_event('logToDisplay', lambda items: seen.append([item[1:] for item in items]), tk=True)
+    dispatcher.register_event('updateMacroRunningStatus', lambda status: seen.append(status), tk=True)
+    emit_from_thread(dispatcher, 'logToDisplay', 'a', 'Macro')
+    emit_from_thread(dispatcher, 'logToDisplay', 'b', 'Macro')
+    emit_from_thread(dispatcher, 'updateMacroRunningStatus', False)
+    emit_from_thread(dispatcher, 'logToDisplay', 'c', 'Macro')
+    root.tick()
+    assert seen == [[('a', 'Macro'), ('b', 'Macro')], False, [('c', 'Macro')]]
+
+
+def test_batch_items_carry_their_emit_time():
+    dispatcher, root = attached()
+    dispatcher.set_event_policy('logToDisplay', BATCH_APPEND)
+    batches = []
+    dispatcher.register_event('logToDisplay', batches.append, tk=True)
+    before = time.time()
+    dispatcher.emit('logToDisplay', 'a', 'Macro')
+    time.sleep(0.02)
+    dispatcher.emit('logToDisplay', 'b', 'Macro')
+    root.tick()
+    (first, second), = batches
+    assert before <= first[0] < second[0] - 0.01
+
+
+def test_batched_events_reject_keyword_arguments():
+    dispatcher, root = attached()
+    dispatcher.set_event_policy('logToDisplay', BATCH_APPEND)
+    with pytest.raises(TypeError):
+        dispatcher.emit('logToDisplay', 'a', source='Macro')
+
+
+def test_latest_wins_delivers_only_the_newest_value():
+    dispatcher, root = attached()
+    dispatcher.set_event_policy('updateCompletedCycles', LATEST_WINS)
+    values = []
+    dispatcher.register_event('updateCompletedCycles', values.append, tk=True)
+    for value in range(5):
+        emit_from_thread(dispatcher, 'updateCompletedCycles', value)
+    root.tick()
+    assert values == [4]
+
+
+def test_tk_thread_emit_runs_after_queued_work():
+    dispatcher, root = attached()
+    dispatcher.set_event_policy('logToDisplay', BATCH_APPEND)
+    seen = []
+    dispatcher.register_event('logToDisplay', lambda items: seen.extend(item[1] for item in items), tk=True)
+    dispatcher.register_event('clearLogDisplay', lambda: seen.append('clear'), tk=True)
+    dispatcher.emit('logToDisplay', 'a', 'Macro')
+    dispatcher.emit('clearLogDisplay')
+    dispatcher.emit('logToDisplay', 'b', 'Macro')
+    root.tick()
+    assert seen == ['a', 'clear', 'b']
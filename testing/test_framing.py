@@ -0,0 +1,42 @@
+# test_framing.py
+
+from framing import LineFramer
+
+
+def test_splits_every_terminated_line():
+    framer = LineFramer()
+    assert framer.feed(b"@2300000000015\r\n$23200000000MTRS5D\r\n") == [b"@2300000000015", b"$23200000000MTRS5D"]
+    assert not framer.buffer
+
+
+def test_keeps_a_partial_line_for_the_next_read():
+    framer = LineFramer()
+    assert framer.feed(b"@23000") == []
+    assert framer.feed(b"00000015\r\n$232000") == [b"@2300000000015"]
+    assert framer.feed(b"00000MTRS5D\r\n") == [b"$23200000000MTRS5D"]
+
+
+def test_terminator_split_across_reads():
+    framer = LineFramer()
+    assert framer.feed(b"@2300000000015\r") == [b"@2300000000015"]
+    assert framer.feed(b"\n@2100000000013\n") == [b"@2100000000013"]
+
+
+def test_bare_cr_or_lf_ends_a_line():
+    framer = LineFramer()
+    assert framer.feed(b"a\rb\nc\r\n\r\nd") == [b"a", b"b", b"c"]
+    assert bytes(framer.buffer) == b"d"
+
+
+def test_unterminated_garbage_is_dropped():
+    framer = LineFramer(max_frame_length=16)
+    assert framer.feed(b"x" * 17) == []
+    assert framer.overflows == 1
+    assert framer.feed(b"@2300000000015\r\n") == [b"@2300000000015"]
+
+
+def test_reset_drops_the_partial_line():
+    framer = LineFramer()
+    framer.feed(b"@23000")
+    framer.reset()
+    assert framer.feed(b"@2100000000013\r\n") == [b"@2100000000013"]
@@ -0,0 +1,49 @@
+# test_latency.py
+
+import numpy as np
+import pytest
+
+from latency import PERCENTILES, LatencyHistogram, intervals
+
+
+@pytest.mark.parametrize("name", ["lognormal", "uniform", "exponential"])
+def test_percentiles_track_numpy(name):
+    rng = np.random.default_rng(0)
+    values = {
+        'lognormal': lambda: rng.lognormal(np.log(5e6), 0.5, 20000),
+        'uniform': lambda: rng.uniform(1e3, 1e9, 20000),
+        'exponential': lambda: rng.exponential(2e5, 20000),
+    }[name]().astype(np.int64)
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.add(value)
+    # Buckets keep the top 6 bits, so a bucket's middle is within 1/64 of
+    # every value in it.
+    for q in (1, *PERCENTILES):
+        assert histogram.percentile(q) == pytest.approx(np.percentile(values, q), rel=1 / 64)
+
+
+def test_percentile_never_exceeds_the_largest_value():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    for value in (992, 992, 992):
+        # The bottom of the 992-1007 bucket; its middle would be 1000.
+        histogram.add(value)
+    assert histogram.percentile(50) == 992
+    assert histogram.snapshot()['max'] == 992
+
+
+def test_percentile_never_falls_below_the_smallest_value():
+    histogram = LatencyHistogram()
+    # The top of the 992-1007 bucket; its middle would be 1000.
+    histogram.add(1007)
+    assert histogram.percentile(50) == 1007
+    histogram.add(1006)
+    for q in (1, 50, 99):
+        assert 1006 <= histogram.percentile(q) <= 1007
+
+
+def test_intervals_need_both_edges():
+    edges = {'start': 0, 'mtrs_sent': 10, 'mtrs_ack': 25, 'mtrs_complete': 400, 'maln_sent': 410, 'end': 1000}
+    assert intervals(edges) == [('MTRS ack', 15), ('MTRS move', 375), ('MTRS > MALN', 10), ('cycle', 1000)]
+    assert intervals({'start': 0}) == []
@@ -0,0 +1,28 @@
+# test_log_sink.py
+
+import os
+import time
+
+import log_sink
+from log_sink import LogSink
+
+
+def test_idle_sink_does_not_fsync(tmp_path, monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(log_sink.os, 'fsync', lambda fd: (synced.append(fd), real_fsync(fd)))
+    sink = LogSink(directory=str(tmp_path), fsync_interval=0.01).start()
+    try:
+        sink.write_entries([(time.time(), "MTRS sent", "Serial:")])
+        assert sink.flush()
+        assert len(synced) == 1
+        time.sleep(0.1)
+        assert sink.flush()
+        assert len(synced) == 1
+        sink.write_entries([(time.time(), "MALN sent", "Serial:")])
+        assert sink.flush()
+        assert len(synced) == 2
+    finally:
+        sink.close()
+    with open(sink.paths[0], encoding='utf-8') as f:
+        assert [line.split("] ", 1)[1] for line in f.read().splitlines()] == ["Serial: MTRS sent", "Serial: MALN sent"]
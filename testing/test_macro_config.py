@@ -0,0 +1,84 @@
+# test_macro_config.py
+
+from event_dispatcher import EventDispatcher
+from macro_config import apply_macro_config, load_macro_config, save_macro_config
+from recovery import ABORT, DEFAULT_CODE, PAUSE, RETRY, TIMEOUT_CODE
+from services import STEP_TIMEOUTS, MacroService
+from settle import MAX_WAIT, MIN_DWELL
+
+
+def configured_macro(loop_thread):
+    dispatcher = EventDispatcher()
+    macro = MacroService(dispatcher, None, None, loop_thread)
+    dispatcher.register_event('logToDisplay', lambda message, source: None)
+    dispatcher.register_event('setRecoveryPolicy', macro.set_recovery_policy)
+    dispatcher.register_event('clearRecoveryPolicies', macro.clear_recovery_policies)
+    dispatcher.register_event('setStepTimeout', macro.set_step_timeout)
+    dispatcher.register_event('setSettleParameters', macro.set_settle_parameters)
+    dispatcher.register_event('setSettleQuery', macro.set_settle_query)
+    return dispatcher, macro
+
+
+def test_missing_or_unreadable_file_loads_as_empty(tmp_path):
+    assert load_macro_config(str(tmp_path / "missing.json")) == {}
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json")
+    assert load_macro_config(str(broken)) == {}
+    broken.write_text("[1, 2]")
+    assert load_macro_config(str(broken)) == {}
+
+
+def test_saved_config_loads_back(tmp_path):
+    path = str(tmp_path / "settings" / "macro_settings.json")
+    config = {'recovery': {'0020': {'action': RETRY, 'attempts': 2, 'delay': 0.5}},
+              'step_timeouts': {'MALN': 45.0}}
+    save_macro_config(config, path)
+    assert load_macro_config(path) == config
+
+
+def test_config_sets_policies_and_watchdogs(loop_thread):
+    dispatcher, macro = configured_macro(loop_thread)
+    apply_macro_config({'recovery': {'0020': {'action': RETRY, 'attempts': 2, 'delay': 0.5},
+                                     TIMEOUT_CODE: ABORT},
+                        'step_timeouts': {'MALN': 45.0, 'T1': 0}}, dispatcher)
+    policy = macro.recovery.policy_for('0020')
+    assert (policy.action, policy.attempts, policy.delay) == (RETRY, 2, 0.5)
+    assert macro.recovery.policy_for(TIMEOUT_CODE).action == ABORT
+    assert macro.recovery.policy_for('0100').action == PAUSE
+    assert macro.step_timeouts['MALN'] == 45.0
+    assert macro.step_timeouts['T1'] == 0.0
+    assert macro.step_timeouts['MTRS'] == STEP_TIMEOUTS['MTRS']
+
+
+def test_code_removed_from_config_goes_back_to_default(loop_thread):
+    dispatcher, macro = configured_macro(loop_thread)
+    apply_macro_config({'recovery': {DEFAULT_CODE: {'action': RETRY}, '0020': {'action': ABORT}}}, dispatcher)
+    apply_macro_config({'recovery': {'0100': {'action': ABORT}}}, dispatcher)
+    assert macro.recovery.policy_for('0020').action == PAUSE
+    assert macro.recovery.policy_for('0100').action == ABORT
+
+
+def test_bad_entries_are_skipped(loop_thread):
+    dispatcher, macro = configured_macro(loop_thread)
+    apply_macro_config({'recovery': {'0020': {'action': 'rewind'}, '0100': {'action': RETRY, 'attempts': None}},
+                        'step_timeouts': {'MALN': 'soon'}}, dispatcher)
+    assert macro.recovery.policy_for('0020').action == PAUSE
+    assert macro.recovery.policy_for('0100').action == PAUSE
+    assert macro.step_timeouts['MALN'] == STEP_TIMEOUTS['MALN']
+
+
+def test_config_sets_the_settle_stage(loop_thread):
+    dispatcher, macro = configured_macro(loop_thread)
+    apply_macro_config({'settle': {'min_dwell': 0.5, 'max_wait': 4.0, 'query': 'T2', 'expected': 'T2,1'}},
+                       dispatcher)
+    assert (macro.settle.min_dwell, macro.settle.max_wait) == (0.5, 4.0)
+    assert macro.settle.condition is not None
+    apply_macro_config({'settle': {'query': ''}}, dispatcher)
+    assert macro.settle.condition is None
+    assert macro.settle.min_dwell == 0.5
+
+
+def test_bad_settle_values_are_skipped(loop_thread):
+    dispatcher, macro = configured_macro(loop_thread)
+    apply_macro_config({'settle': {'min_dwell': 'soon', 'max_wait': None}}, dispatcher)
+    assert (macro.settle.min_dwell, macro.settle.max_wait) == (MIN_DWELL, MAX_WAIT)
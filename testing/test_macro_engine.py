@@ -0,0 +1,109 @@
+# test_macro_engine.py
+
+import threading
+
+from macro_engine import MacroEngine, Step
+
+
+def settle(loop_thread):
+    # Everything queued on the loop before this call has run once it returns.
+    done = threading.Event()
+    loop_thread.call_soon(done.set)
+    assert done.wait(2.0)
+
+
+def started(loop_thread, steps, initial='a', **kwargs):
+    engine = MacroEngine(loop_thread, **kwargs)
+    engine.start(initial, steps)
+    settle(loop_thread)
+    return engine
+
+
+def test_transitions_follow_the_table(loop_thread):
+    engine = started(loop_thread, [Step('a', transitions={'go': 'b'}), Step('b', transitions={'go': 'c'}),
+                                   Step('c')])
+    engine.post('go')
+    settle(loop_thread)
+    assert engine.state == 'b'
+
+
+def test_stale_bind_callbacks_are_dropped(loop_thread):
+    engine = started(loop_thread, [Step('a', transitions={'go': 'b'}), Step('b', transitions={'go': 'c'}),
+                                   Step('c')])
+    stale = engine.bind('go')
+    engine.post('go')
+    settle(loop_thread)
+    stale()
+    settle(loop_thread)
+    assert engine.state == 'b'
+
+
+def test_callable_transition_picks_the_target(loop_thread):
+    engine = started(loop_thread, [Step('a', transitions={'go': lambda value: 'c' if value else None}),
+                                   Step('c')])
+    engine.post('go', False)
+    settle(loop_thread)
+    assert engine.state == 'a'
+    engine.post('go', True)
+    settle(loop_thread)
+    assert engine.state == 'c'
+
+
+def test_alarm_and_timeout_route_to_their_handlers(loop_thread):
+    errors = []
+
+    def on_timeout(error):
+        errors.append(error)
+        return 'timed_out'
+
+    steps = [Step('a', on_alarm='alarmed', on_timeout=on_timeout), Step('alarmed'), Step('timed_out')]
+    engine = started(loop_thread, steps)
+    engine.post('alarm', 'E1')
+    settle(loop_thread)
+    assert engine.state == 'alarmed'
+
+    engine = started(loop_thread, steps)
+    engine.post('timeout', 'T1')
+    settle(loop_thread)
+    assert engine.state == 'timed_out'
+    assert errors == ['T1']
+
+
+def test_unhandled_alarm_stalls(loop_thread):
+    stalls = []
+    engine = started(loop_thread, [Step('a')], on_stall=lambda *args: stalls.append(args))
+    engine.post('alarm', 'E1')
+    settle(loop_thread)
+    assert engine.state == 'a'
+    assert stalls == [('a', 'alarm', ('E1',))]
+
+
+def test_retry_enters_the_step_again_before_its_handler(loop_thread):
+    entries = []
+    engine = MacroEngine(loop_thread)
+    steps = [Step('a', lambda: entries.append(engine.retrying), retries=1, on_alarm='alarmed'), Step('alarmed')]
+    engine.start('a', steps)
+    settle(loop_thread)
+    engine.post('alarm')
+    settle(loop_thread)
+    assert engine.state == 'a'
+    engine.post('alarm')
+    settle(loop_thread)
+    assert engine.state == 'alarmed'
+    assert entries == [False, True]
+
+
+def test_step_timeout_fires_timeout_event(loop_thread):
+    done = threading.Event()
+    engine = started(loop_thread, [Step('a', timeout=0.01, on_timeout='b'), Step('b', done.set)])
+    assert done.wait(2.0)
+    assert engine.state == 'b'
+
+
+def test_stop_drops_pending_events(loop_thread):
+    engine = started(loop_thread, [Step('a', transitions={'go': 'b'}), Step('b')])
+    go = engine.bind('go')
+    engine.stop()
+    go()
+    settle(loop_thread)
+    assert not engine.running
@@ -0,0 +1,317 @@
+# test_macro_service.py
+#
+# MacroService sequences against a scripted NXC100 and XG-X on a real loop
+# thread; steps are shortened so a run takes a fraction of a second.
+
+import socket
+import threading
+import time
+
+from command_queue import CommandQueue
+from event_dispatcher import EventDispatcher
+from protocol import checksum, named_command, parse_line
+from results_store import ResultsStore
+from services import MacroService, TCPService
+
+MALN_COMPLETION = "$24200000000MALN0017010851"
+
+
+class ScriptedSerial:
+    # Stands in for SerialService: acknowledges and completes every command
+    # after delay, fails the next failures[mnemonic] sends with an alarm and
+    # never answers mnemonics in silent.
+    def __init__(self, loop_thread, failures=None, silent=(), delay=0.01):
+        self.loop_thread = loop_thread
+        self.failures = dict(failures or {})
+        self.silent = set(silent)
+        self.delay = delay
+        self.sent = []
+        self.command_queue = CommandQueue(self.write, loop_thread, default_timeout=2.0)
+
+    def command(self, name, parameters=None, unit=None):
+        return named_command(name, parameters, unit)
+
+    def send_serial_command(self, command, callback=None, timeout=None):
+        return self.command_queue.submit(command, callback, timeout)
+
+    def write(self, command):
+        self.sent.append(command)
+        unit, mnemonic = command[1], command[2:6]
+        if mnemonic in self.silent:
+            return
+        ack = f"@{unit}0000000000"
+        self.loop_thread.call_later(0.001, self.feed, ack + checksum(ack))
+        if self.failures.get(mnemonic):
+            self.failures[mnemonic] -= 1
+            body = f"${unit}0201000001{mnemonic}"
+        elif mnemonic == 'MALN':
+            body = MALN_COMPLETION
+        else:
+            body = f"${unit}0000000000{mnemonic}"
+        self.loop_thread.call_later(self.delay, self.feed, body + checksum(body))
+
+    def feed(self, line):
+        self.command_queue.dispatch(parse_line(line))
+
+    def count(self, mnemonic):
+        return sum(1 for command in self.sent if command[2:6] == mnemonic)
+
+
+class ScriptedXGX:
+    # A TCP server standing in for the XG-X: echoes the n-th T1 after delay if
+    # answer(n) is true and never replies to it otherwise.
+    def __init__(self, answer=lambda trigger: True, delay=0.0):
+        self.answer = answer
+        self.delay = delay
+        self.triggers = 0
+        self.server = socket.create_server(('127.0.0.1', 0))
+        self.port = self.server.getsockname()[1]
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        try:
+            connection, _ = self.server.accept()
+        except OSError:
+            return
+        with connection, connection.makefile('rb') as lines:
+            for line in lines:
+                if line.strip() != b"T1":
+                    continue
+                self.triggers += 1
+                if self.answer(self.triggers):
+                    time.sleep(self.delay)
+                    connection.sendall(b"T1\r\n")
+
+    def close(self):
+        self.server.close()
+
+
+class Run:
+    def __init__(self, loop_thread, failures=None, silent=(), capture_delay=0.01, answer_t1=True,
+                 results_store=None, xgx=None, tcp_timeout=5.0, replies=1):
+        self.dispatcher = EventDispatcher()
+        self.serial = ScriptedSerial(loop_thread, failures, silent)
+        self.macro = MacroService(self.dispatcher, self.serial, None, loop_thread, results_store)
+        self.macro.settle.min_dwell = 0.01
+        self.macro.show_completion_messagebox = lambda: None
+        self.logs = []
+        self.triggers = 0
+        self.stopped = threading.Event()
+        self.capture_delay = capture_delay
+        self.answer_t1 = answer_t1
+        self.replies = replies
+        self.loop_thread = loop_thread
+        dispatcher = self.dispatcher
+        dispatcher.register_event('logToDisplay', lambda message, source: self.logs.append(f"{source} {message}"))
+        self.tcp = None
+        if xgx is None:
+            dispatcher.register_event('triggerCapture', self.trigger)
+        else:
+            self.tcp = TCPService(dispatcher, loop_thread)
+            assert self.tcp.connect_tcp_socket('127.0.0.1', xgx.port, tcp_timeout)
+            dispatcher.register_event('triggerOne', self.tcp.trigger_one)
+            dispatcher.register_event('triggerCapture', self.tcp.trigger_capture)
+        dispatcher.register_event('handleResponseT1', self.macro.handle_response_t1)
+        dispatcher.register_event('stopSequence', self.macro.stop_sequence)
+        dispatcher.register_event('stopSequence', self.stopped.set)
+
+    def trigger(self, timeout=None):
+        self.triggers += 1
+        if self.answer_t1 is True or (callable(self.answer_t1) and self.answer_t1(self.triggers)):
+            for reply in range(self.replies):
+                self.loop_thread.call_later(self.capture_delay * (1 + 5 * reply), self.dispatcher.emit,
+                                            'handleResponseT1')
+
+    def start(self, cycles):
+        self.macro.initialize_sequence(cycles)
+        return self
+
+    def wait(self, timeout=5.0):
+        assert self.stopped.wait(timeout), "\n".join(self.logs)
+        time.sleep(0.05)
+        return self
+
+    def close(self):
+        if self.tcp:
+            self.tcp.close_tcp_socket()
+            time.sleep(0.05)
+
+    def logged(self, text):
+        return [line for line in self.logs if text in line]
+
+
+def with_retries(sequence, step_name, retries):
+    def steps():
+        steps, global_transitions = sequence()
+        for step in steps:
+            if step.name == step_name:
+                step.retries = retries
+        return steps, global_transitions
+    return steps
+
+
+def test_runs_every_cycle(loop_thread):
+    run = Run(loop_thread).start(3).wait()
+    assert run.macro.completed_cycles == 3
+    assert run.macro.started_cycles == 3
+    assert run.serial.count('MTRS') == 3
+
+
+def test_engine_retry_resends_without_starting_a_cycle(loop_thread):
+    run = Run(loop_thread, failures={'MTRS': 1})
+    run.macro.sequences['alignment'] = with_retries(run.macro.alignment_steps, 'mtrs', 1)
+    run.start(2).wait()
+    assert run.serial.count('MTRS') == 3
+    assert run.macro.started_cycles == 2
+    assert run.macro.completed_cycles == 2
+    assert len(run.logged("Starting Cycle")) == 2
+
+
+def test_unknown_command_parameters_are_logged_not_stored(loop_thread):
+    run = Run(loop_thread)
+    run.macro.set_command_parameters('MTRX', 'G100AL')
+    assert 'MTRX' not in run.macro.command_parameters
+    assert run.logged("Unknown command MTRX")
+    run.macro.set_command_parameters('MTRS', 'G200AL')
+    assert run.macro.command_parameters['MTRS'] == 'G200AL'
+
+
+def test_stop_clears_the_run_context(loop_thread, tmp_path):
+    # The store is never started; begin_run only needs to hand out an id.
+    run = Run(loop_thread, results_store=ResultsStore(str(tmp_path / "results.sqlite3"))).start(1)
+    assert run.dispatcher.get('runId') is not None
+    run.wait()
+    assert run.dispatcher.get('runId') is None
+    assert run.dispatcher.get('macroCycle') is None
+
+
+def retrying_capture(run, timeout=0.1):
+    run.macro.step_timeouts['T1'] = timeout
+    run.macro.set_recovery_policy('timeout', 'retry', 1)
+    return run
+
+
+def test_capture_timeout_in_place_triggers_again(loop_thread):
+    run = retrying_capture(Run(loop_thread, answer_t1=lambda trigger: trigger > 1))
+    run.start(1).wait()
+    assert run.triggers == 2
+    assert run.logged("T1 timeout during TRIGGER, retry")
+    assert run.macro.completed_cycles == 1
+    assert len(run.macro.capture_durations) == 1
+
+
+def test_capture_timeout_after_the_wafer_moved_on_skips_the_capture(loop_thread):
+    run = retrying_capture(Run(loop_thread, answer_t1=lambda trigger: trigger > 1))
+    run.serial.delay = 0.05
+    run.macro.set_pipelined_mode(True, 0.01)
+    run.start(2).wait()
+    assert run.logged("capture skipped, wafer has moved on")
+    assert run.triggers == 2
+    assert run.macro.completed_cycles == 2
+
+
+def test_capture_timeout_inside_a_recovery_skips_the_capture(loop_thread):
+    run = retrying_capture(Run(loop_thread))
+
+    def fail_next_mtrs(trigger):
+        # Cycle 1's capture goes unanswered and cycle 2's MTRS alarms, so the
+        # watchdog runs out while the engine waits out the retry delay.
+        if trigger == 1:
+            run.serial.failures['MTRS'] = 1
+            return False
+        return True
+
+    run.answer_t1 = fail_next_mtrs
+    run.macro.set_pipelined_mode(True, 0.01)
+    run.macro.set_recovery_policy('*', 'retry', 1, delay=0.3)
+    run.start(2).wait()
+    assert run.logged("T1 timeout during RECOVER, capture skipped")
+    assert run.logged("resending MTRS")
+    assert run.serial.count('MTRS') == 3
+    assert run.macro.completed_cycles == 2
+
+
+def test_capture_timeout_does_not_clear_or_reset(loop_thread):
+    run = Run(loop_thread, answer_t1=False)
+    run.macro.step_timeouts['T1'] = 0.05
+    run.macro.set_recovery_policy('timeout', 'clear', 1)
+    assert run.logged("a T1 timeout pauses")
+    run.start(1)
+    time.sleep(0.5)
+    assert run.logged("T1 timeout during TRIGGER, clear does not apply to T1, macro paused")
+    assert run.serial.count('CCLR') == 0
+    assert run.triggers == 1
+    assert run.macro.engine.state == 'trigger'
+    run.macro.stop_sequence()
+
+
+def test_unanswered_t1_over_tcp_is_a_capture_timeout(loop_thread):
+    # The TCP reply timeout is shorter than the T1 watchdog; only the watchdog
+    # may decide the capture was missed.
+    xgx = ScriptedXGX(answer=lambda trigger: False)
+    run = Run(loop_thread, xgx=xgx, tcp_timeout=0.05)
+    run.macro.step_timeouts['T1'] = 0.3
+    run.macro.set_recovery_policy('timeout', 'abort')
+    try:
+        run.start(1).wait()
+    finally:
+        run.close()
+        xgx.close()
+    assert run.logged("No reply to T1")
+    assert run.macro.timeout_counts['T1'] == 1
+    assert run.macro.completed_cycles == 0
+    assert not run.macro.capture_durations
+
+
+def test_t1_retried_over_tcp_after_a_capture_timeout(loop_thread):
+    xgx = ScriptedXGX(answer=lambda trigger: trigger > 1)
+    run = retrying_capture(Run(loop_thread, xgx=xgx, tcp_timeout=0.05), timeout=0.3)
+    try:
+        run.start(1).wait()
+    finally:
+        run.close()
+        xgx.close()
+    assert xgx.triggers == 2
+    assert run.macro.timeout_counts['T1'] == 1
+    assert run.macro.completed_cycles == 1
+
+
+def test_repeated_t1_reply_does_not_complete_the_next_cycle(loop_thread):
+    # The second reply lands while the next cycle is moving.
+    run = Run(loop_thread, replies=2)
+    run.serial.delay = 0.03
+    run.start(3).wait()
+    assert run.logged("T1 reply with no capture pending, ignored")
+    assert run.macro.completed_cycles == run.macro.started_cycles == 3
+    assert run.serial.count('MTRS') == 3
+
+
+def test_manual_t1_over_tcp_is_not_a_capture(loop_thread):
+    xgx = ScriptedXGX()
+    run = Run(loop_thread, xgx=xgx)
+    run.serial.delay = 0.05
+    try:
+        run.start(2)
+        run.dispatcher.emit('triggerOne')
+        run.wait()
+    finally:
+        run.close()
+        xgx.close()
+    assert xgx.triggers == 3
+    assert run.macro.completed_cycles == run.macro.started_cycles == 2
+    assert run.serial.count('MTRS') == 2
+
+
+def test_repeatability_summary_is_published_during_the_run(loop_thread):
+    run = Run(loop_thread)
+    summaries = []
+    run.dispatcher.register_event('repeatabilityUpdate', summaries.append)
+    run.start(3).wait()
+    # The first cycle's, throttled after that, and the full one at stop.
+    assert len(summaries) >= 2
+    assert summaries[0]['offset_mm']['count'] == 1
+    assert summaries[-1]['offset_mm']['count'] == 3
+    assert round(summaries[-1]['offset_mm']['mean'], 3) == 0.17
+    run.macro.request_repeatability()
+    time.sleep(0.05)
+    assert summaries[-1]['angle_deg']['count'] == 3
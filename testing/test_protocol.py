@@ -0,0 +1,67 @@
+# test_protocol.py
+
+from protocol import checksum, named_command, parse_frame, parse_line
+
+
+def test_ack():
+    frame = parse_line("@2300000000015")
+    assert frame.is_ack and not frame.is_completion
+    assert (frame.unit, frame.seq, frame.status) == ('2', '3', '0')
+    assert frame.mnemonic == '' and frame.payload == ''
+    assert frame.checksum == '15' and frame.valid and frame.ok
+
+
+def test_completion():
+    frame = parse_line("$23200000000MTRS5D")
+    assert frame.is_completion
+    assert (frame.unit, frame.seq, frame.status) == ('2', '3', '2')
+    assert frame.mnemonic == 'MTRS' and frame.payload == ''
+    assert frame.valid and frame.ok
+
+
+def test_completion_with_payload_and_checksum():
+    body = "$24200000000MALN0017010851"
+    frame = parse_line(body + checksum(body))
+    assert frame.payload == '0017010851'
+    assert frame.checksum == checksum(body) and frame.valid
+
+
+def test_checksum_mismatch():
+    frame = parse_line("$23200000000MTRS5E")
+    assert frame.checksum == '5E'
+    assert not frame.valid
+
+
+def test_maln_without_checksum():
+    frame = parse_line("$24200000000MALN0017010851")
+    assert frame.mnemonic == 'MALN'
+    assert frame.payload == '0017010851'
+    assert frame.checksum is None and frame.valid
+
+
+def test_alarm_frame_is_not_ok():
+    body = "$24212340005MALN0017010851"
+    frame = parse_line(body + checksum(body))
+    assert (frame.alarm, frame.subcode) == ('1234', '0005')
+    assert frame.valid and not frame.ok
+
+
+def test_rejects_what_is_not_a_response():
+    assert parse_frame(b"$2MTRS") is None
+    assert parse_frame(b"Ready for commands") is None
+    assert parse_frame(b"@2300000000\xff\xfe15") is None
+
+
+def test_named_commands_match_the_literals_they_replaced():
+    assert named_command('MTRS') == "$2MTRSG100ALDD"
+    assert named_command('MALN') == "$2MALN1009000B4"
+    assert named_command('CCLR') == "$2CCLRE9B"
+    assert named_command('HRST') == "$1HRST72"
+    assert named_command('CSOL0') == "$2CSOLA0D4"
+    assert named_command('CSOL1') == "$2CSOLA1D5"
+
+
+def test_named_command_overrides():
+    assert named_command('MTRS', 'G100AL') == named_command('MTRS')
+    assert named_command('MALN', '') == "$2MALN" + checksum("$2MALN")
+    assert named_command('HRST', unit='2') == "$2HRST" + checksum("$2HRST")
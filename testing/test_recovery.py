@@ -0,0 +1,56 @@
+# test_recovery.py
+
+import pytest
+
+from recovery import ABORT, CLEAR, DEFAULT_CODE, PAUSE, RETRY, RecoveryPolicies, RecoveryPolicy
+
+
+def test_attempts_run_out_into_abort():
+    policies = RecoveryPolicies()
+    policy = policies.set_policy('0020', CLEAR, attempts=2)
+    assert policies.next_action('0020') == (CLEAR, policy)
+    assert policies.next_action('0020') == (CLEAR, policy)
+    assert policies.next_action('0020') == (ABORT, policy)
+    assert policies.next_action('0020') == (ABORT, policy)
+
+
+def test_attempts_are_counted_per_code_and_reset_per_cycle():
+    policies = RecoveryPolicies()
+    policies.set_policy('0020', RETRY, attempts=1)
+    policies.set_policy('0100', RETRY, attempts=1)
+    assert policies.next_action('0020')[0] == RETRY
+    assert policies.next_action('0100')[0] == RETRY
+    assert policies.next_action('0020')[0] == ABORT
+    policies.reset()
+    assert policies.next_action('0020')[0] == RETRY
+
+
+def test_zero_attempts_aborts_at_once():
+    policies = RecoveryPolicies()
+    policies.set_policy('0020', RETRY, attempts=0)
+    assert policies.next_action('0020')[0] == ABORT
+
+
+def test_pause_and_abort_use_no_attempts():
+    policies = RecoveryPolicies()
+    for _ in range(3):
+        assert policies.next_action('0020')[0] == PAUSE
+    policies.set_policy(DEFAULT_CODE, ABORT)
+    assert policies.next_action('0020')[0] == ABORT
+    assert not policies.attempts
+
+
+def test_codes_without_a_policy_use_the_default():
+    policies = RecoveryPolicies()
+    policies.set_policy(DEFAULT_CODE, RETRY, attempts=1)
+    policies.set_policy('0020', PAUSE)
+    assert policies.next_action('0200')[0] == RETRY
+    assert policies.next_action('0020')[0] == PAUSE
+    policies.remove_policy('0020')
+    policies.remove_policy(DEFAULT_CODE)
+    assert policies.policy_for('0020').action == RETRY
+
+
+def test_unknown_action_is_rejected():
+    with pytest.raises(ValueError):
+        RecoveryPolicy('rewind')
@@ -0,0 +1,22 @@
+# test_transport.py
+
+import threading
+
+
+def test_run_in_executor_keeps_blocking_work_off_the_loop(loop_thread):
+    threads = []
+
+    def work(value):
+        threads.append(threading.current_thread())
+        return value * 2
+
+    assert loop_thread.run_in_executor(work, 21).result(2.0) == 42
+    assert threads[0] is not loop_thread.thread
+
+
+def test_run_in_executor_from_the_loop_thread(loop_thread):
+    done = threading.Event()
+    futures = []
+    loop_thread.call_soon(lambda: (futures.append(loop_thread.run_in_executor(sum, (1, 2))), done.set()))
+    assert done.wait(2.0)
+    assert futures[0].result(2.0) == 3
@@ -0,0 +1,216 @@
+# transport.py
+
+import asyncio
+import os
+import threading
+
+from framing import LineFramer, SerialReader
+
+
+class LoopTimer:
+    def __init__(self, loop_thread, delay, callback, args):
+        self.loop_thread = loop_thread
+        self.handle = None
+        self.cancelled = False
+        loop_thread.call_soon(self._schedule, delay, callback, args)
+
+    def _schedule(self, delay, callback, args):
+        if not self.cancelled:
+            self.handle = self.loop_thread.loop.call_later(delay, callback, *args)
+
+    def _cancel_handle(self):
+        if self.handle:
+            self.handle.cancel()
+
+    def cancel(self):
+        self.cancelled = True
+        self.loop_thread.call_soon(self._cancel_handle)
+
+
+class EventLoopThread:
+    def __init__(self, name="transport-loop"):
+        self.name = name
+        self.loop = None
+        self.thread = None
+        self.ready = threading.Event()
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return self
+        self.ready.clear()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self.thread.start()
+        self.ready.wait()
+        return self
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self.ready.set)
+        self.loop.run_forever()
+
+    def stop(self):
+        if self.loop and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(2.0)
+
+    def in_loop_thread(self):
+        return threading.current_thread() is self.thread
+
+    def call_soon(self, callback, *args):
+        self.start()
+        if self.in_loop_thread():
+            self.loop.call_soon(callback, *args)
+        else:
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    def call_later(self, delay, callback, *args):
+        self.start()
+        return LoopTimer(self, delay, callback, args)
+
+    def submit(self, coroutine):
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine, timeout=None):
+        if self.in_loop_thread():
+            raise RuntimeError("EventLoopThread.run() would block its own loop")
+        return self.submit(coroutine).result(timeout)
+
+    def run_in_executor(self, function, *args):
+        # Blocking work (file or database I/O) on the loop's default executor,
+        # from any thread. Returns a concurrent.futures.Future.
+        return self.submit(self._in_executor(function, args))
+
+    async def _in_executor(self, function, args):
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+
+shared_loop_thread = EventLoopThread()
+
+
+class SerialTransport:
+    def __init__(self, loop_thread, serial_port, on_frame, on_error=None):
+        self.loop_thread = loop_thread
+        self.serial_port = serial_port
+        self.on_frame = on_frame
+        self.on_error = on_error
+        self.framer = LineFramer()
+        self.fd = None
+        self.fallback_reader = None
+
+    def open(self):
+        # POSIX ports expose a file descriptor the loop can watch directly. Ports
+        # without one (Windows COM ports) fall back to a single reader thread.
+        try:
+            self.fd = self.serial_port.fileno()
+        except (AttributeError, OSError, NotImplementedError):
+            self.fd = None
+        if self.fd is not None:
+            try:
+                if self.loop_thread.in_loop_thread():
+                    self.loop_thread.loop.add_reader(self.fd, self._on_readable)
+                else:
+                    self.loop_thread.run(self._add_reader(), timeout=2.0)
+                return
+            except (NotImplementedError, OSError, ValueError):
+                self.fd = None
+        self.fallback_reader = SerialReader(self.serial_port, self.on_frame, self.on_error)
+        self.fallback_reader.start()
+
+    async def _add_reader(self):
+        asyncio.get_running_loop().add_reader(self.fd, self._on_readable)
+
+    def _on_readable(self):
+        try:
+            data = os.read(self.fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self._remove_reader()
+            if self.on_error:
+                self.on_error(e)
+            return
+        if not data:
+            self._remove_reader()
+            return
+        for frame in self.framer.feed(data):
+            self.on_frame(frame)
+
+    def _remove_reader(self):
+        if self.fd is not None:
+            self.loop_thread.loop.remove_reader(self.fd)
+            self.fd = None
+
+    def write(self, data):
+        self.serial_port.write(data)
+
+    def close(self):
+        if self.fd is not None:
+            if self.loop_thread.in_loop_thread():
+                self._remove_reader()
+            else:
+                self.loop_thread.call_soon(self._remove_reader)
+        if self.fallback_reader:
+            self.fallback_reader.stop()
+            self.fallback_reader = None
+        self.framer.reset()
+
+
+class TCPTransport:
+    def __init__(self, loop_thread, on_frame, on_close=None):
+        self.loop_thread = loop_thread
+        self.on_frame = on_frame
+        self.on_close = on_close
+        self.framer = LineFramer()
+        self.reader = None
+        self.writer = None
+        self.receive_task = None
+
+    @property
+    def connected(self):
+        return self.writer is not None and not self.writer.is_closing()
+
+    def connect(self, host, port, timeout=5.0):
+        self.loop_thread.run(self._connect(host, port, timeout), timeout + 1.0)
+
+    async def _connect(self, host, port, timeout):
+        self.reader, self.writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        self.receive_task = asyncio.ensure_future(self._receive_loop(self.reader))
+
+    async def _receive_loop(self, reader):
+        # The only place replies are read. A reply split across packets waits in
+        # the framer for its terminator; coalesced replies are handed to on_frame
+        # one at a time.
+        error = None
+        framer = self.framer
+        try:
+            while True:
+                data = await reader.read(4096)
+                if not data:
+                    break
+                for frame in framer.feed(data):
+                    self.on_frame(frame)
+        except asyncio.CancelledError:
+            return
+        except OSError as e:
+            error = e
+        if self.on_close and self.reader is reader:
+            self.on_close(error)
+
+    def write(self, data):
+        # Loop thread only; StreamWriter buffers and flushes in the background.
+        self.writer.write(data)
+
+    def close(self):
+        writer = self.writer
+        receive_task = self.receive_task
+        self.reader = None
+        self.writer = None
+        self.receive_task = None
+        if receive_task:
+            self.loop_thread.call_soon(receive_task.cancel)
+        if writer:
+            self.loop_thread.call_soon(writer.close)
+        self.framer.reset()
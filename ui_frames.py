@@ -66,11 +66,10 @@ class SerialControlFrame(ttk.Frame):
         self.btn_e_stop = ttk.Button(self, text="EMERGENCY STOP", command=lambda: dispatcher.emit('emergencyStop'))
         self.btn_e_stop.grid(row=10, column=0, columnspan=2, padx=5, sticky='ew', pady=(0, 3))
 
-        self.dispatcher.register_event('updateSerialConnectionStatus', self.update_serial_connection_status)
+        self.dispatcher.register_event('updateSerialConnectionStatus', self.update_serial_connection_status, tk=True)
 
     # UI UPDATES
     def update_serial_connection_status(self, status):
-        print("debug this function from SeriaControlFrame0")
         self.serial_connected = status
         self.update_button_states()
 
@@ -80,7 +79,6 @@ class SerialControlFrame(ttk.Frame):
             widget.config(state=state)
 
     def update_button_states(self):
-        print("debug this function from SerialControlFrame")
         widgets = [
             self.btn_mtrs,
             self.btn_maln,
@@ -158,11 +156,10 @@ class TCPControlFrame(ttk.Frame):
         self.btn_e_stop = ttk.Button(self, text="EMERGENCY STOP", command=lambda: dispatcher.emit('emergencyStop'))
         self.btn_e_stop.grid(row=10, column=0, columnspan=2, padx=5, sticky='ew', pady=(0, 3))
 
-        self.dispatcher.register_event('updateTCPConnectionStatus', self.update_tcp_connection_status)
+        self.dispatcher.register_event('updateTCPConnectionStatus', self.update_tcp_connection_status, tk=True)
 
         # UI UPDATES
     def update_tcp_connection_status(self, status):
-        print("debug this function from TCPControlFrame0")
         self.tcp_connected = status
         self.update_button_states()
 
@@ -172,7 +169,6 @@ class TCPControlFrame(ttk.Frame):
             widget.config(state=state)
 
     def update_button_states(self):
-        print("debug this function from TCPControlFrame1")
         widgets = [
             self.btn_t1,
             self.btn_t2,
@@ -205,6 +201,11 @@ class MacroControlFrame(ttk.Frame):
         self.serial_connected = False
         self.tcp_connected = True
 
+        self.pipelined = tk.BooleanVar(value=False)
+        self.chk_pipelined = ttk.Checkbutton(self, text="Pipelined", variable=self.pipelined,
+                                             command=lambda: dispatcher.emit('setPipelinedMode', self.pipelined.get()))
+        self.chk_pipelined.grid(row=0, column=0, columnspan=2, padx=5, pady=(5, 0))
+
         self.lbl_alignments = ttk.Label(self, text="Alignments")
         self.lbl_alignments.grid(row=1, column=0, padx=5, pady=5)
 
@@ -261,10 +262,10 @@ class MacroControlFrame(ttk.Frame):
         self.btn_e_stop = ttk.Button(self, text="EMERGENCY STOP", command=lambda: dispatcher.emit('emergencyStop'))
         self.btn_e_stop.grid(row=11, column=0, columnspan=2, padx=5, pady=0, sticky='ew')
 
-        self.dispatcher.register_event('updateSerialConnectionStatus', self.update_serial_connection_status)
-        self.dispatcher.register_event('updateTCPConnectionStatus', self.update_tcp_connection_status)
-        self.dispatcher.register_event('startSequence', self.set_start_time)
-        self.dispatcher.register_event('stopSequence', self.set_stop_time)
+        self.dispatcher.register_event('updateSerialConnectionStatus', self.update_serial_connection_status, tk=True)
+        self.dispatcher.register_event('updateTCPConnectionStatus', self.update_tcp_connection_status, tk=True)
+        self.dispatcher.register_event('startSequence', self.set_start_time, tk=True)
+        self.dispatcher.register_event('stopSequence', self.set_stop_time, tk=True)
 
         self.update_button_states()
 
@@ -281,12 +282,10 @@ class MacroControlFrame(ttk.Frame):
         self.update_button_states()
 
     def update_serial_connection_status(self, status):
-        print("debug this function from MacroControlFrame0")
         self.serial_connected = status
         self.update_button_states()
 
     def update_tcp_connection_status(self, status):
-        print("debug this function from MacroControlFrame1")
         self.tcp_connected = status
         self.update_button_states()
 
@@ -299,18 +298,18 @@ class MacroControlFrame(ttk.Frame):
         if self.macro_running:
             self.btn_reset.config(state='disabled')
             self.btn_start.config(state='disabled')
+            self.chk_pipelined.config(state='disabled')
         else:
             self.btn_reset.config(state='normal')
             self.btn_start.config(state='normal')
+            self.chk_pipelined.config(state='normal')
 
     def set_start_time(self):
-        print("debug this function from MacroControlFrame2")
         self.start_time = datetime.now()
         self.val_start_time.config(text=self.start_time.strftime("%H:%M:%S"))
         print(f"Start time set to: {self.start_time.strftime('%H:%M:%S')}")
 
     def set_stop_time(self):
-        print("debug this function from MacroControlFrame3")
         self.stop_time = datetime.now()
         self.val_stop_time.config(text=self.stop_time.strftime("%H:%M:%S"))
         print(f"Stop time set to: {self.stop_time.strftime('%H:%M:%S')}")
@@ -332,7 +331,6 @@ class MacroControlFrame(ttk.Frame):
             self.val_elapsed_time.config(text="--:--:--")
 
     def reset_sequence(self):
-        print("debug this function from MacroControlFrame5")
         print("Sequence Reset")
         self.macro_running = False
         self.start_time = None
@@ -363,9 +361,9 @@ class StatusFrame(tk.Frame):
         self.lbl_macro_status = tk.Label(self, text="Macro: Stopped", width=self.status_label_width, foreground="dark grey")
         self.lbl_macro_status.grid(row=2, column=0, padx=0, pady=5, sticky='ew')
         """TODO: move these out of here"""
-        self.dispatcher.register_event('updateSerialConnectionStatus', self.update_serial_status)
-        self.dispatcher.register_event('updateTCPConnectionStatus', self.update_tcp_status)
-        self.dispatcher.register_event('updateMacroRunningStatus', self.update_macro_status)
+        self.dispatcher.register_event('updateSerialConnectionStatus', self.update_serial_status, tk=True)
+        self.dispatcher.register_event('updateTCPConnectionStatus', self.update_tcp_status, tk=True)
+        self.dispatcher.register_event('updateMacroRunningStatus', self.update_macro_status, tk=True)
 
     # UI UPDATES
     def update_serial_status(self, status):